@@ -14,11 +14,31 @@ INSTALL:
 RUN:
     python terminator.py          → voice mode
     python terminator.py --text   → keyboard mode (no mic needed)
+    python terminator.py --serve [ADDR]          → local command server
+    python terminator.py --send "open spotify"   → send one command to it
+    python terminator.py --load-test [--clients N] [--requests M]
+    python terminator.py --trace out.json        → per-utterance spans (chrome://tracing)
+    python terminator.py --profile [DIR]         → cProfile every command, stats per command in DIR
+    python terminator.py --no-journal            → do not log commands to terminator_journal.jsonl
+    python terminator.py --idle MINUTES          → release Whisper / TTS / caches after MINUTES idle (10; 0 = never)
+    python terminator.py --hot-reload            → pick up edited packs / manifest without a restart
+    python terminator.py --barge-in              → talk over the bot to interrupt it
+    python terminator.py --bench-tts             → first-audio latency, block vs pipelined
+    python terminator.py --bench-fuzzy           → misheard-command corpus through the phonetic fallback
+    python terminator.py --bench-echo            → scripted session: does the bot hear itself?
+    python terminator.py --import-dictionary FILE → offline definitions from a .tsv/.json/.jsonl dump
+      ADDR = a Unix socket path (default ~/.terminator.sock, owner-only), a port or host:port
+      (default 127.0.0.1:8765 on Windows). TCP clients must first send the token the server
+      writes to ~/.terminator_token (owner-only); --send and --load-test do that.
+      --connect ADDR points --send / --load-test at a non-default server.
 """
 
-import os, sys, time, math, re, random, platform, datetime
-import threading, subprocess, webbrowser, shutil, socket
-import tempfile, glob
+import os, sys, gc, time, re, random, platform, datetime, importlib, functools
+import threading, subprocess, shutil, tempfile, json, asyncio, atexit, itertools, math, queue, difflib
+import cProfile, pstats, graphlib, contextlib, io, secrets, hmac
+from array import array
+from collections import deque, Counter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 # ── Auto-install core packages ─────────────────────────────────────────────────
 def _pip(pkg):
@@ -43,10 +63,469 @@ IS_LINUX = platform.system() == "Linux"
 BOT_NAME = "Terminator"
 BOT_TAG  = "T-800"
 
+# ══════════════════════════════════════════════════════════════════════════════
+#  TRACING  — opt-in spans (--trace out.json) in Chrome trace-event format
+# ══════════════════════════════════════════════════════════════════════════════
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "args", "link", "id", "parent", "root", "start")
+
+    def __init__(self, tracer, name, cat, args, link=None):
+        self.tracer, self.name, self.cat, self.args, self.link = tracer, name, cat, args, link
+
+    def __enter__(self):
+        stack = self.tracer._stack()
+        up = stack[-1] if stack else self.link
+        self.id     = next(self.tracer._ids)
+        self.parent = up.id if up else None
+        self.root   = up.root if up else self.id
+        stack.append(self)
+        self.start  = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        self.tracer._stack().pop()
+        if exc[0]: self.args["error"] = repr(exc[1])
+        self.tracer._emit(self, end)
+
+
+class _NoSpan:
+    def __enter__(self): return self
+    def __exit__(self, *exc): pass
+
+
+class Tracer:
+    """
+    Records nested spans per thread. Each utterance is a root span; stages
+    (mic, recognition, routing, handler, subprocesses, speech) are children.
+    Work handed to another thread keeps its link through adopt(); speech
+    from timer threads has no parent and is flagged "background". Output is
+    Chrome trace-event JSON (chrome://tracing, ui.perfetto.dev), or one
+    span per line when the path ends in .jsonl.
+    """
+    def __init__(self):
+        self.enabled = False
+        self.path    = None
+        self.events  = []
+        self._ids    = itertools.count(1)
+        self._lock   = threading.Lock()
+        self._tls    = threading.local()
+        self._named  = set()
+        self._t0     = time.perf_counter()
+        self._null   = _NoSpan()
+
+    def start(self, path: str):
+        self.enabled, self.path = True, path
+        if path.endswith(".jsonl"): open(path, "w").close()
+        self._trace_subprocesses()
+        atexit.register(self.flush)
+        print(f"[{BOT_TAG}] Tracing to {path}")
+
+    def span(self, name: str, cat="stage", **args):
+        return _Span(self, name, cat, args) if self.enabled else self._null
+
+    def current(self):
+        """The innermost open span on this thread (hand it to adopt() elsewhere)."""
+        stack = self._stack() if self.enabled else None
+        return stack[-1] if stack else None
+
+    def adopt(self, parent, name: str, cat="stage", **args):
+        """Span on this thread that is a child of a span opened on another thread."""
+        return _Span(self, name, cat, args, link=parent) if self.enabled else self._null
+
+    def _stack(self) -> list:
+        stack = getattr(self._tls, "stack", None)
+        if stack is None: stack = self._tls.stack = []
+        return stack
+
+    def _emit(self, sp, end):
+        tid  = threading.get_ident()
+        args = dict(sp.args, id=sp.id, parent=sp.parent, utterance=sp.root)
+        if sp.parent is None and sp.cat == "stage": args["background"] = True
+        ts   = round((sp.start - self._t0) * 1e6, 1)   # round both ends, so children stay inside parents
+        ev = {"name": sp.name, "cat": sp.cat, "ph": "X", "pid": os.getpid(), "tid": tid, "ts": ts,
+              "dur": round(round((end - self._t0) * 1e6, 1) - ts, 1), "args": args}
+        with self._lock:
+            if tid not in self._named:
+                self._named.add(tid)
+                self.events.append({"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid,
+                                    "args": {"name": threading.current_thread().name}})
+            self.events.append(ev)
+            if self.path.endswith(".jsonl"):
+                with open(self.path, "a", encoding="utf-8") as f: f.write(json.dumps(ev) + "\n")
+        if sp.parent is None and not self.path.endswith(".jsonl"): self.flush()
+
+    def flush(self):
+        if not self.enabled or self.path.endswith(".jsonl"): return
+        with self._lock:
+            try:
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+            except OSError as e: print(f"[{BOT_TAG}] Trace write failed: {e}")
+
+    def _trace_subprocesses(self):
+        """Wrap subprocess spawns so handler child processes show up as spans."""
+        tracer = self
+        def label(args):
+            argv = args if isinstance(args, (list, tuple)) else str(args).split()
+            return os.path.basename(str(argv[0])) if argv else "?"
+        class TracedPopen(subprocess.Popen):
+            def __init__(self, args, *a, **k):
+                with tracer.span(f"spawn {label(args)}", cat="subprocess"):
+                    super().__init__(args, *a, **k)
+        real_run = subprocess.run
+        def traced_run(args, *a, **k):
+            with tracer.span(f"subprocess {label(args)}", cat="subprocess", argv=str(args)[:200]):
+                return real_run(args, *a, **k)
+        subprocess.Popen, subprocess.run = TracedPopen, traced_run
+
+
+TRACER = Tracer()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  PROFILING  — cProfile around handlers (--profile, "profile next command")
+# ══════════════════════════════════════════════════════════════════════════════
+
+class _Profiled:
+    __slots__ = ("profiler", "cmd", "prof", "start")
+
+    def __init__(self, profiler, cmd):
+        self.profiler, self.cmd = profiler, cmd
+
+    def __enter__(self):
+        self.prof = None
+        if not self.profiler._busy.acquire(blocking=False):   # one cProfile at a time per process
+            print(f"[{BOT_TAG}] Profiler busy — {self.cmd.pack}.{self.cmd.name} runs unprofiled.")
+            return self
+        self.prof  = cProfile.Profile()
+        self.start = time.perf_counter()
+        self.prof.enable()
+        return self
+
+    def __exit__(self, *exc):
+        if self.prof is None: return
+        self.prof.disable()
+        wall = time.perf_counter() - self.start
+        self.profiler._busy.release()
+        self.profiler._report(self.cmd, self.prof, wall)
+
+
+class Profiler:
+    """
+    Runs handlers under cProfile, either for the next utterance only
+    ("profile next command") or for every one (--profile). It hooks into
+    _route, so every handler is covered without changing any of them. After
+    each profiled handler the top hotspots by own time are printed, and the
+    stats are saved as <dir>/<pack>.<handler>/<timestamp>.prof. Two runs of
+    one command can then be compared with pstats or snakeviz.
+    """
+    def __init__(self, out_dir="terminator_profiles", top=12):
+        self.out_dir, self.top = out_dir, top
+        self.always = False
+        self._next  = False
+        self._busy  = threading.Lock()
+        self._null  = _NoSpan()
+
+    def arm(self):
+        self._next = True
+
+    def claim(self) -> bool:
+        """Whether the utterance being routed now is to be profiled (consumes "next")."""
+        armed, self._next = self._next, False
+        return armed or self.always
+
+    def run(self, cmd, on: bool):
+        # the profiler's own commands, and "run routine", whose steps are profiled one by one
+        own = cmd.module is None and cmd.name in ("profile_next", "profile_all", "stop_profiling", "routine")
+        return _Profiled(self, cmd) if on and not own else self._null
+
+    def _report(self, cmd, prof, wall):
+        name  = f"{cmd.pack}.{cmd.name}"
+        stats = pstats.Stats(prof)
+        folder = os.path.join(self.out_dir, name)
+        path   = os.path.join(folder, datetime.datetime.now().strftime("%Y%m%d-%H%M%S-%f") + ".prof")
+        try:
+            os.makedirs(folder, exist_ok=True); stats.dump_stats(path)
+        except OSError as e: path = f"not saved ({e})"
+        rows = sorted(stats.stats.items(), key=lambda kv: kv[1][2], reverse=True)[:self.top]
+        print(f"\n⏱️  PROFILE {name}  ({wall*1000:.1f} ms, {stats.total_calls} calls)\n" + "─"*50)
+        print(f"  {'calls':>7}{'own ms':>9}{'cum ms':>9}  function")
+        for (file, line, func), (cc, nc, tt, ct, _) in rows:
+            where = f"{os.path.basename(file)}:{line}({func})" if line else func
+            print(f"  {nc:>7}{tt*1000:>9.2f}{ct*1000:>9.2f}  {where[:60]}")
+        print("─"*50 + f"\n  saved: {path}\n")
+
+
+PROFILER = Profiler()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  JOURNAL  — what was asked, what ran, how it went ("usage report")
+# ══════════════════════════════════════════════════════════════════════════════
+
+class _Logged:
+    __slots__ = ("journal", "text", "name", "extra", "start")
+
+    def __init__(self, journal, text, name, extra):
+        self.journal, self.text, self.name, self.extra = journal, text, name, extra
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, *_):
+        self.journal.record(self.text, self.name, "error" if exc_type else "ok",
+                            time.perf_counter() - self.start, **self.extra)
+
+
+class Journal:
+    """
+    One JSON line per routed command in terminator_journal.jsonl:
+        {"t": epoch, "text": ..., "handler": "pack.name" | null,
+         "outcome": "ok" | "error" | "unmatched" | "echo", "ms": handler time}
+    plus "heard" when the phonetic fallback rewrote the text. record() only
+    puts the line on a queue. A background thread writes whatever has queued
+    up in one append, at most every `every` seconds. The command path never
+    waits on the disk. Past `max_bytes` the file rotates to .1 … .`keep`.
+    """
+    def __init__(self, path="terminator_journal.jsonl", max_bytes=1 << 20, keep=3, every=2.0):
+        self.path, self.max_bytes, self.keep, self.every = path, max_bytes, keep, every
+        self.enabled = True
+        self.q = queue.Queue()
+        self._thread = None
+        self._lock   = threading.Lock()
+        self._null   = _NoSpan()
+
+    def entry(self, text, cmd, **extra):
+        """Context manager that times a handler and records its outcome."""
+        if not self.enabled: return self._null
+        name = cmd if isinstance(cmd, str) else f"{cmd.pack}.{cmd.name}"
+        return _Logged(self, text, name, extra)
+
+    def record(self, text, handler, outcome, secs=0.0, **extra):
+        if not self.enabled: return
+        self.q.put(dict(t=round(time.time(), 1), text=text, handler=handler, outcome=outcome,
+                        ms=round(secs * 1000, 1), **extra))
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, daemon=True, name="journal")
+                    self._thread.start()
+                    atexit.register(self.flush)
+
+    def _run(self):
+        while True:
+            time.sleep(self.every)
+            self.flush()
+
+    def flush(self):
+        """Write everything queued so far in one append (also called at exit)."""
+        lines = []
+        while True:
+            try: lines.append(json.dumps(self.q.get_nowait(), ensure_ascii=False))
+            except queue.Empty: break
+        if not lines: return
+        with self._lock:
+            try:
+                with open(self.path, "a", encoding="utf-8") as f: f.write("\n".join(lines) + "\n")
+                if os.path.getsize(self.path) > self.max_bytes: self._rotate()
+            except OSError as e: print(f"[{BOT_TAG}] Journal write failed: {e}")
+
+    def _rotate(self):
+        for i in range(self.keep - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{i}"): os.replace(f"{self.path}.{i}", f"{self.path}.{i+1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def entries(self):
+        """Every recorded line, oldest file first, read one line at a time."""
+        self.flush()
+        for path in [f"{self.path}.{i}" for i in range(self.keep, 0, -1)] + [self.path]:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        try: yield json.loads(line)
+                        except ValueError: pass   # torn last line after a crash
+            except OSError: pass
+
+
+def usage_summary(entries, top=8):
+    """Aggregate journal lines in one pass: (total, uses, unmatched, errors, slowest, echoes)."""
+    uses, unmatched, errors = Counter(), Counter(), Counter()
+    time_ms, max_ms = Counter(), {}
+    total = echoes = 0
+    for e in entries:
+        total += 1; h = e.get("handler")
+        if e.get("outcome") == "echo": echoes += 1; continue
+        if e.get("outcome") == "unmatched": unmatched[e.get("text", "")] += 1; continue
+        uses[h] += 1; time_ms[h] += e.get("ms", 0); max_ms[h] = max(max_ms.get(h, 0), e.get("ms", 0))
+        if e.get("outcome") == "error": errors[h] += 1
+    slowest = sorted(((time_ms[h] / n, max_ms[h], h) for h, n in uses.items()), reverse=True)[:top]
+    return total, uses.most_common(top), unmatched.most_common(top), errors.most_common(top), slowest, echoes
+
+
+JOURNAL = Journal()
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  IDLE  — let go of heavy backends while nobody is talking to the bot
+# ══════════════════════════════════════════════════════════════════════════════
+
+def rss_bytes():
+    """Resident memory of this process, or None where it cannot be read."""
+    if PSUTIL_OK: return psutil.Process().memory_info().rss
+    try:
+        with open("/proc/self/statm") as f: return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError): return None
+
+
+class IdleManager:
+    """
+    After `idle` seconds without a command, every registered resource is
+    released: the Whisper model, the in-process TTS engine and the caches
+    packs register (search indexes, hash caches, the dictionary mapping).
+    Each one loads itself again the next time it is used. With `prewarm`,
+    the wake word (or the next command) reloads what was released on a
+    background thread. Resident memory is printed before and after.
+    """
+    def __init__(self, idle=600, every=15):
+        self.idle, self.every = idle, every
+        self.prewarm  = True
+        self.asleep   = False
+        self.last     = time.monotonic()
+        self._res     = {}   # name → (release() -> True if it freed something, warm() or None)
+        self._lock    = threading.Lock()
+        self._thread  = None
+        self._released = []
+
+    def register(self, name, release, warm=None):
+        """Add (or, after a hot reload, replace) a resource the idle manager may release."""
+        self._res[name] = (release, warm)
+
+    def touch(self):
+        self.last = time.monotonic()
+        if self.asleep: self.wake()
+
+    def wake(self):
+        """Warm what the last release let go of, without holding up the caller."""
+        with self._lock:
+            if not self.asleep: return
+            self.asleep, names = False, self._released
+        warms = [self._res[n][1] for n in names if n in self._res and self._res[n][1]]
+        if self.prewarm and warms:
+            def run():
+                for warm in warms:
+                    try: warm()
+                    except Exception as e: print(f"[{BOT_TAG}] Pre-warm failed: {e}")
+            threading.Thread(target=run, daemon=True, name="idle-prewarm").start()
+
+    def release(self):
+        """
+        Release everything now. Returns (names released, RSS before, RSS after).
+        The callbacks run outside _lock: one may wait for a decode or an
+        utterance to finish, and touch() on the command path must not wait
+        behind it. A resource in use says so by returning False.
+        """
+        with self._lock: resources = list(self._res.items())
+        before, names = rss_bytes(), []
+        for name, (release, _) in resources:
+            try:
+                if release(): names.append(name)
+            except Exception as e: print(f"[{BOT_TAG}] Could not release {name}: {e}")
+        gc.collect()
+        with self._lock: self._released, self.asleep = names, True
+        return names, before, rss_bytes()
+
+    def _watch(self):
+        while True:
+            time.sleep(self.every)
+            if self.asleep or time.monotonic() - self.last < self.idle: continue
+            names, before, after = self.release()
+            if names: print(f"[{BOT_TAG}] Idle — released {', '.join(names)}. {_mb(before)} → {_mb(after)}")
+
+    def start(self):
+        if self.idle > 0 and self._thread is None:
+            self._thread = threading.Thread(target=self._watch, daemon=True, name="idle")
+            self._thread.start()
+
+
+def _mb(n):
+    return f"{n / 2**20:.0f} MB" if n is not None else "?"
+
+
+IDLE = IdleManager()
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  TEXT-TO-SPEECH
 # ══════════════════════════════════════════════════════════════════════════════
 
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_sentences(text: str, min_chars=24) -> list:
+    """Sentences of `text`; fragments shorter than min_chars ride along with the next one."""
+    out, buf = [], ""
+    for part in _SENTENCE_END.split(text.strip()):
+        buf = f"{buf} {part}".strip()
+        if len(buf) >= min_chars: out.append(buf); buf = ""
+    if buf: out.append(buf)
+    return out
+
+
+class SentencePipeline:
+    """
+    Long replies, one sentence at a time: a worker renders sentence N+1 while
+    sentence N plays, so the first audio waits for one sentence, not the whole
+    reply. render(sentence) → clip; play(clip, stop) blocks; discard(clip)
+    cleans up. After run(): ttfa (call → first audio) and gaps (silence
+    between sentences), in seconds.
+    """
+    def __init__(self, render, play, discard=None, ahead=1):
+        self.render, self.play = render, play
+        self.discard = discard or (lambda clip: None)
+        self.ahead   = ahead
+        self.ttfa, self.gaps = None, []
+
+    def run(self, sentences, stop=None) -> bool:
+        """Play every sentence; False if `stop` cut it short."""
+        clips, cancel = queue.Queue(maxsize=self.ahead), threading.Event()
+        parent = TRACER.current()
+        def produce():
+            for sentence in sentences:
+                if cancel.is_set(): break
+                try:
+                    with TRACER.adopt(parent, "tts.render", chars=len(sentence)):
+                        clips.put(self.render(sentence))
+                except Exception as e: clips.put(e)
+            clips.put(None)
+        def drain():
+            while (clip := clips.get()) is not None:
+                if not isinstance(clip, Exception): self.discard(clip)
+        threading.Thread(target=produce, daemon=True, name="tts-render").start()
+
+        t0, last = time.perf_counter(), None
+        self.ttfa, self.gaps = None, []
+        while (clip := clips.get()) is not None:
+            if isinstance(clip, Exception): print(f"    [TTS: {clip}]"); continue
+            now = time.perf_counter()
+            if self.ttfa is None: self.ttfa = now - t0
+            else: self.gaps.append(now - last)
+            try:
+                with TRACER.span("tts.play"): self.play(clip, stop)
+            finally: self.discard(clip)
+            last = time.perf_counter()
+            if stop is not None and stop.is_set():
+                cancel.set(); threading.Thread(target=drain, daemon=True).start()
+                return False
+        return True
+
+    def stats(self) -> dict:
+        return {"ttfa": self.ttfa, "gaps": self.gaps,
+                "max_gap": max(self.gaps, default=0.0)}
+
+
 class TTSEngine:
     """
     Windows: win32com SAPI5  →  PowerShell SAPI5  →  pyttsx3
@@ -57,22 +536,23 @@ class TTSEngine:
     def __init__(self):
         self.backend = "console"
         self.sapi = self.engine = None
+        self.last_pipeline = None   # ttfa / gaps of the last sentence-pipelined reply
+        self._elock = threading.RLock()   # engine (re)load vs. idle unload
+        self._users = 0                   # utterances in progress; unload() waits for none
         self._setup()
+        self.player = self._find_player()
+
+    def _find_player(self):
+        """How rendered clips get played, if this backend can render to a file."""
+        if self.backend not in ("sapi_ps", "pyttsx3", "say", "espeak"): return None
+        if IS_WIN: return "winsound"
+        return next((p for p in ("afplay", "paplay", "aplay") if shutil.which(p)), None)
 
     def _setup(self):
         if IS_WIN:
             # ── Option 1: win32com (fastest, blocking-wait supported) ──────────
             try:
-                import win32com.client
-                sapi = win32com.client.Dispatch("SAPI.SpVoice")
-                voices = sapi.GetVoices()
-                for i in range(voices.Count):
-                    if any(k in voices.Item(i).GetDescription().lower()
-                           for k in ["david","mark","george","zira","hazel"]):
-                        sapi.Voice = voices.Item(i); break
-                sapi.Rate = 1; sapi.Volume = 100
-                sapi.Speak(" ", 1)
-                self.sapi = sapi; self.backend = "sapi_com"
+                self.sapi = self._new_sapi(); self.backend = "sapi_com"
                 print(f"[{BOT_TAG}] TTS: Windows SAPI5 via win32com ✓"); return
             except Exception as e:
                 print(f"[{BOT_TAG}] win32com unavailable ({e})")
@@ -87,16 +567,7 @@ class TTSEngine:
 
         if PYTTSX3_OK:
             try:
-                eng = pyttsx3.init()
-                eng.setProperty("rate", 165); eng.setProperty("volume", 1.0)
-                for kw in ["david","zira","daniel","alex","english"]:
-                    for v in eng.getProperty("voices"):
-                        if kw in v.name.lower() or kw in v.id.lower():
-                            eng.setProperty("voice", v.id); break
-                    else: continue
-                    break
-                eng.say(" "); eng.runAndWait()
-                self.engine = eng; self.backend = "pyttsx3"
+                self.engine = self._new_pyttsx3(); self.backend = "pyttsx3"
                 print(f"[{BOT_TAG}] TTS: pyttsx3 ✓"); return
             except Exception as e:
                 print(f"[{BOT_TAG}] pyttsx3 failed ({e})")
@@ -114,52 +585,256 @@ class TTSEngine:
 
         print(f"[{BOT_TAG}] ⚠  No TTS — console only.  Fix: pip install pywin32")
 
-    def _ps_speak(self, text: str):
-        """Speak via PowerShell — temp .ps1 file avoids all quoting issues."""
+    @staticmethod
+    def _new_sapi():
+        import win32com.client
+        sapi = win32com.client.Dispatch("SAPI.SpVoice")
+        voices = sapi.GetVoices()
+        for i in range(voices.Count):
+            if any(k in voices.Item(i).GetDescription().lower()
+                   for k in ["david","mark","george","zira","hazel"]):
+                sapi.Voice = voices.Item(i); break
+        sapi.Rate = 1; sapi.Volume = 100
+        sapi.Speak(" ", 1)
+        return sapi
+
+    @staticmethod
+    def _new_pyttsx3():
+        eng = pyttsx3.init()
+        eng.setProperty("rate", 165); eng.setProperty("volume", 1.0)
+        for kw in ["david","zira","daniel","alex","english"]:
+            for v in eng.getProperty("voices"):
+                if kw in v.name.lower() or kw in v.id.lower():
+                    eng.setProperty("voice", v.id); break
+            else: continue
+            break
+        eng.say(" "); eng.runAndWait()
+        return eng
+
+    # ── Idle: the in-process engines (SAPI COM, pyttsx3) can be let go and reloaded ──
+    def unload(self) -> bool:
+        with self._elock:
+            if self._users or (self.sapi is None and self.engine is None): return False
+            if self.engine is not None:
+                try: self.engine.stop()
+                except Exception: pass
+            self.sapi = self.engine = None
+            return True
+
+    def load(self):
+        """Bring back an engine released by unload(); a no-op when it is loaded."""
+        with self._elock:
+            if self.backend == "sapi_com" and self.sapi is None:
+                with TRACER.span("tts.reload"): self.sapi = self._new_sapi()
+            elif self.backend == "pyttsx3" and self.engine is None:
+                with TRACER.span("tts.reload"): self.engine = self._new_pyttsx3()
+
+    def _ps_speak(self, text: str, stop=None, out=None):
+        """Speak via PowerShell — temp .ps1 file avoids all quoting issues. out= renders a .wav."""
         safe = text.replace('"@', '" @')
         script = (
             "Add-Type -AssemblyName System.Speech\n"
             "$s = New-Object System.Speech.Synthesis.SpeechSynthesizer\n"
             "$s.Rate = 1\n"
+            + (f"$s.SetOutputToWaveFile('{out}')\n" if out else "") +
             "$s.Speak(@\"\n" + safe + "\n\"@)\n"
+            "$s.Dispose()\n"
         )
         tmp = tempfile.NamedTemporaryFile(mode="w", suffix=".ps1", delete=False, encoding="utf-8")
         tmp.write(script); tmp.close()
-        subprocess.run(["powershell","-NoProfile","-WindowStyle","Hidden",
-                        "-ExecutionPolicy","Bypass","-File",tmp.name],
-                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        try: os.unlink(tmp.name)
-        except: pass
+        try:
+            self._play(["powershell","-NoProfile","-WindowStyle","Hidden",
+                        "-ExecutionPolicy","Bypass","-File",tmp.name], stop)
+        finally:
+            try: os.unlink(tmp.name)
+            except: pass
 
-    def speak(self, text: str):
+    @staticmethod
+    def _play(args, stop=None):
+        """Run a speaking subprocess; kill it as soon as `stop` is set."""
+        p = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if stop is None: p.wait(); return
+        while p.poll() is None:
+            if stop.wait(0.02): p.terminate(); p.wait(); return
+
+    def speak(self, text: str, stop=None):
+        """Speak and block until done — or until the `stop` event is set (barge-in)."""
         print(f"\n🤖  {BOT_NAME.upper()}: {text}\n")
+        with self._using(load=True): self._speak_loaded(text, stop)
+
+    @contextlib.contextmanager
+    def _using(self, load=False):
+        """Mark the engine busy (an utterance, or a render that outlives a barge-in)."""
+        with self._elock:
+            if load:
+                try: self.load()
+                except Exception as e: print(f"    [TTS: {e}]")
+            self._users += 1
+        try: yield
+        finally:
+            with self._elock: self._users -= 1
+
+    def _speak_loaded(self, text: str, stop=None):
+        with TRACER.span("tts.speak", backend=self.backend, chars=len(text)) as sp:
+            sentences = split_sentences(text) if self.player else [text]
+            if len(sentences) == 1: self._speak(text, stop); return
+            pipe = SentencePipeline(self._render, self._play_clip, self._discard)
+            pipe.run(sentences, stop)
+            self.last_pipeline = pipe.stats()
+            if TRACER.enabled:
+                sp.args.update(sentences=len(sentences), ttfa_ms=round(pipe.ttfa * 1000, 1),
+                               max_gap_ms=round(self.last_pipeline["max_gap"] * 1000, 1))
+
+    # ── Sentence pipeline: render to a temp file, play it with the system player ──
+    def _render(self, text: str) -> str:
+        fd, path = tempfile.mkstemp(suffix=".aiff" if self.backend == "say" else ".wav")
+        os.close(fd)
+        try:
+            with self._using(): self._render_to(text, path)
+        except Exception:
+            self._discard(path); raise
+        return path
+
+    def _render_to(self, text: str, path: str):
+        if self.backend == "sapi_ps": self._ps_speak(text, out=path)
+        elif self.backend == "pyttsx3": self.engine.save_to_file(text, path); self.engine.runAndWait()
+        elif self.backend == "say": subprocess.run(["say","-r","170","-o",path,text], check=True)
+        elif self.backend == "espeak":
+            subprocess.run(["espeak","-v","en","-s","155","-w",path,text], check=True)
+
+    def _play_clip(self, path: str, stop=None):
+        if self.player == "winsound":
+            import winsound, wave
+            with wave.open(path) as w: dur = w.getnframes() / w.getframerate()
+            winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC)
+            if (stop or threading.Event()).wait(dur): winsound.PlaySound(None, 0)
+        else:
+            self._play([self.player, path], stop)
+
+    @staticmethod
+    def _discard(path: str):
+        try: os.unlink(path)
+        except OSError: pass
+
+    def _speak(self, text: str, stop=None):
         if self.backend == "sapi_com":
             try:
                 self.sapi.Speak(text, 1)
-                while self.sapi.Status.RunningState == 2: time.sleep(0.05)
+                while self.sapi.Status.RunningState == 2:
+                    if stop is not None and stop.is_set(): self.sapi.Speak("", 3); break  # purge
+                    time.sleep(0.02)
             except Exception as e: print(f"    [TTS: {e}]")
         elif self.backend == "sapi_ps":
-            try: self._ps_speak(text)
+            try: self._ps_speak(text, stop)
             except Exception as e: print(f"    [TTS: {e}]")
         elif self.backend == "pyttsx3":
-            try: self.engine.say(text); self.engine.runAndWait()
+            cb = None
+            try:
+                if stop is not None:
+                    cb = self.engine.connect("started-word",
+                                             lambda *_: stop.is_set() and self.engine.stop())
+                self.engine.say(text); self.engine.runAndWait()
             except Exception as e: print(f"    [TTS: {e}]")
+            finally:
+                if cb: self.engine.disconnect(cb)
         elif self.backend == "say":
-            try: subprocess.run(["say","-r","170",text])
+            try: self._play(["say","-r","170",text], stop)
             except Exception as e: print(f"    [TTS: {e}]")
         elif self.backend == "espeak":
-            try: subprocess.run(["espeak","-v","en","-s","155",text])
+            try: self._play(["espeak","-v","en","-s","155",text], stop)
             except Exception as e: print(f"    [TTS: {e}]")
 
 
+class SimulatedTTS:
+    """
+    Stand-in backend for tests and demos: "plays" text at a fixed speaking rate,
+    honours `stop` like the real backends and logs what happened to each line.
+    With a synthesis cost (startup + per character) it renders through the
+    sentence pipeline, or as one block when pipelined=False.
+    """
+    backend = "simulated"
+
+    def __init__(self, words_per_sec=3.0, synth_startup=0.0, synth_per_char=0.0, pipelined=True):
+        self.words_per_sec = words_per_sec
+        self.synth_startup, self.synth_per_char = synth_startup, synth_per_char
+        self.pipelined = pipelined
+        self.last_pipeline = None
+        self.log = []   # {"text", "start", "end", "interrupted"} per speak()
+
+    def _render(self, text):
+        time.sleep(self.synth_startup + self.synth_per_char * len(text)); return text
+
+    def _play_clip(self, text, stop=None):
+        dur = len(text.split()) / self.words_per_sec
+        return stop.wait(dur) if stop is not None else time.sleep(dur) or False
+
+    def speak(self, text: str, stop=None):
+        print(f"\n🤖  {BOT_NAME.upper()}: {text}\n")
+        start = time.perf_counter()
+        with TRACER.span("tts.speak", backend=self.backend, chars=len(text)):
+            pipe = SentencePipeline(self._render, self._play_clip)
+            interrupted = not pipe.run(split_sentences(text) if self.pipelined else [text], stop)
+            self.last_pipeline = pipe.stats()
+        self.log.append({"text": text, "start": start, "end": time.perf_counter(),
+                         "interrupted": interrupted})
+
+
+def bench_tts(text=None):
+    """--bench-tts: time-to-first-audio and gaps, whole reply vs sentence pipeline."""
+    text = text or ("Systems check complete. All processors are running within normal "
+                    "parameters. Memory usage is at forty two percent. Your next alarm is set "
+                    "for seven in the morning. The weather in Amsterdam is light rain. "
+                    "I'll be back.")
+    tts = TTSEngine()
+    if not tts.player:
+        print(f"[{BOT_TAG}] {tts.backend} cannot render to a file here — using a simulated synthesiser.")
+        tts = SimulatedTTS(words_per_sec=12, synth_startup=0.4, synth_per_char=0.002)
+    discard = getattr(tts, "_discard", None)
+    print(f"\n🔊  TTS PIPELINE ({tts.backend})\n" + "─"*50)
+    print(f"  {'mode':<12}{'parts':>6}{'first audio':>13}{'max gap':>10}{'total':>9}")
+    for mode, parts in (("block", [text]), ("pipelined", split_sentences(text))):
+        pipe = SentencePipeline(tts._render, tts._play_clip, discard)
+        t0 = time.perf_counter(); pipe.run(parts); total = time.perf_counter() - t0
+        st = pipe.stats()
+        print(f"  {mode:<12}{len(parts):>6}{st['ttfa']:>12.2f}s{st['max_gap']:>9.2f}s{total:>8.2f}s")
+    print("─"*50)
+
+
 # ══════════════════════════════════════════════════════════════════════════════
 #  SPEECH RECOGNITION
 # ══════════════════════════════════════════════════════════════════════════════
 
+class EnergyVAD:
+    """
+    Frame-energy voice activity detector for mono PCM. A frame is speech when
+    its RMS is above `threshold`; barge-in waits for `onset` speech frames in
+    a row, so a click or a cough does not cut the bot off.
+    """
+    def __init__(self, threshold=600, onset=3):
+        self.threshold = threshold
+        self.onset     = onset
+
+    def rms(self, frame: bytes, width=2) -> float:
+        a = array({1: "b", 2: "h", 4: "i"}[width], frame[:len(frame) - len(frame) % width])
+        return math.sqrt(sum(x * x for x in a) / len(a)) if a else 0.0
+
+    def is_speech(self, frame: bytes, width=2) -> bool:
+        return self.rms(frame, width) > self.threshold
+
+
 class MicListener:
-    def __init__(self):
+    """
+    One phrase per listen_once(). `open_source` opens the audio input (the
+    default microphone; a ScriptedAudioSource in tests and benches, used
+    uncalibrated). With an EchoGuard attached, capture waits while the
+    bot talks, and the bot's own words are dropped before they reach the
+    router.
+    """
+    def __init__(self, open_source=None):
         self.available = False
         self.r = None
+        self.echo = None   # EchoGuard: set by the bot that owns the speaker
+        self.timeout, self.phrase_limit = 7, 12   # seconds: wait for speech, longest phrase
         if not SR_OK: return
         self.r = sr.Recognizer()
         self.r.energy_threshold = 300
@@ -168,6 +843,9 @@ class MicListener:
         self.r.pause_threshold = 0.8
         self.r.phrase_threshold = 0.2
         self.r.non_speaking_duration = 0.6
+        self._wlock = threading.Lock()   # one Whisper load / decode at a time
+        self.open_source = open_source or sr.Microphone
+        if open_source: self.available = True; return
         try:
             with sr.Microphone() as src:
                 print(f"[{BOT_TAG}] Calibrating mic...", end=" ", flush=True)
@@ -182,331 +860,425 @@ class MicListener:
 
     def _transcribe(self, audio) -> str:
         try:
-            return self.r.recognize_google(audio, language="en-US").lower()
+            with TRACER.span("stt.recognize_google"):
+                return self.r.recognize_google(audio, language="en-US").lower()
         except sr.UnknownValueError:
             return ""
         except sr.RequestError:
             try:
-                import whisper as _w
-                if not hasattr(self, "_wm"):
-                    print(f"[{BOT_TAG}] Loading Whisper offline model...")
-                    self._wm = _w.load_model("tiny")
                 import numpy as np
-                wav = np.frombuffer(audio.get_wav_data(), dtype=np.int16).astype(np.float32) / 32768.0
-                return self._wm.transcribe(wav, fp16=False, language="en")["text"].strip().lower()
+                with self._wlock:
+                    model = self._whisper()
+                    wav = np.frombuffer(audio.get_wav_data(), dtype=np.int16).astype(np.float32) / 32768.0
+                    with TRACER.span("stt.whisper"):
+                        return model.transcribe(wav, fp16=False, language="en")["text"].strip().lower()
             except:
                 print(f"[{BOT_TAG}] No internet + no Whisper. pip install openai-whisper")
                 return ""
 
+    def _whisper(self):
+        """The offline model, loaded on first use (call with _wlock held)."""
+        if not hasattr(self, "_wm"):
+            import whisper as _w
+            print(f"[{BOT_TAG}] Loading Whisper offline model...")
+            with TRACER.span("stt.whisper.load"): self._wm = _w.load_model("tiny")
+            self.offline = True   # Whisper was needed once: worth pre-warming after idle
+        return self._wm
+
+    def unload_whisper(self) -> bool:
+        if not self._wlock.acquire(blocking=False): return False   # mid-decode: keep it this round
+        try:
+            if not hasattr(self, "_wm"): return False
+            del self._wm; return True
+        finally: self._wlock.release()
+
+    def warm_whisper(self):
+        if getattr(self, "offline", False):
+            with self._wlock: self._whisper()
+
     def listen_once(self) -> str:
         if not self.available: return ""
+        if self.echo: self.echo.wait_open()
         try:
-            with sr.Microphone() as src:
-                self.r.adjust_for_ambient_noise(src, duration=0.3)
+            mic = self.open_source()
+            with TRACER.span("mic.open"): src = mic.__enter__()
+            try:
+                with TRACER.span("mic.adjust_for_ambient_noise"):
+                    self.r.adjust_for_ambient_noise(src, duration=0.3)
                 print("🎤  Listening...")
-                audio = self.r.listen(src, timeout=7, phrase_time_limit=12)
-            text = self._transcribe(audio)
-            if text: print(f"👤  You: {text}")
-            return text
+                t0 = time.monotonic()
+                with TRACER.span("mic.listen"):
+                    audio = self.r.listen(src, timeout=self.timeout, phrase_time_limit=self.phrase_limit)
+            finally:
+                mic.__exit__(None, None, None)
+            if self.echo and self.echo.gate(t0, time.monotonic()):
+                print(f"[{BOT_TAG}] Only heard myself — not transcribed."); return ""
+            return self.hear(audio)
         except sr.WaitTimeoutError: return ""
         except Exception as e: print(f"[Listen error] {e}"); return ""
 
+    def hear(self, audio) -> str:
+        """Transcribe captured audio (a phrase, or a barge-in); "" when it was the bot's own voice."""
+        text = self._transcribe(audio)
+        if text and self.echo and self.echo.reject(text): return ""
+        if text: print(f"👤  You: {text}")
+        return text
+
     def listen_long(self, prompt="") -> str:
-        """Dictation mode — waits 2.5 s of silence before stopping."""
+        """Dictation mode — no length cap; 2.5 s of silence stops it."""
         if not self.available: return ""
         if prompt: print(f"    [{prompt} — speak freely, pause when done]")
-        saved_p, saved_n = self.r.pause_threshold, self.r.non_speaking_duration
-        self.r.pause_threshold = 2.5
-        self.r.non_speaking_duration = 2.0
         try:
-            with sr.Microphone() as src:
+            with TRACER.span("mic.dictate"), sr.Microphone(sample_rate=16000, chunk_size=480) as src:
                 self.r.adjust_for_ambient_noise(src, duration=0.3)
                 print("🎤  Dictating... (pause to finish)")
-                audio = self.r.listen(src, timeout=10, phrase_time_limit=60)
-            text = self._transcribe(audio)
+                dictation = StreamingDictation(self._transcribe, EnergyVAD(self.r.energy_threshold),
+                                               pause=self.r.pause_threshold)
+                text = dictation.run(src)
             if text: print(f"👤  You said: {text}")
             return text
         except sr.WaitTimeoutError: print(f"[{BOT_TAG}] No speech detected."); return ""
         except Exception as e: print(f"[Listen error] {e}"); return ""
-        finally:
-            self.r.pause_threshold = saved_p
-            self.r.non_speaking_duration = saved_n
 
 
-# ══════════════════════════════════════════════════════════════════════════════
-#  WINDOWS APP ENGINE  — find, open, close ANY installed app
-# ══════════════════════════════════════════════════════════════════════════════
-
-_EV = os.path.expandvars
-
-# Static alias map for 50+ common apps
-WIN_APP_MAP = {
-    "chrome":             r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-    "google chrome":      r"C:\Program Files\Google\Chrome\Application\chrome.exe",
-    "firefox":            r"C:\Program Files\Mozilla Firefox\firefox.exe",
-    "edge":               r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
-    "microsoft edge":     r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
-    "brave":              r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe",
-    "opera":              _EV(r"%LOCALAPPDATA%\Programs\Opera\launcher.exe"),
-    "notepad":            "notepad.exe",
-    "wordpad":            "wordpad.exe",
-    "word":               r"C:\Program Files\Microsoft Office\root\Office16\WINWORD.EXE",
-    "excel":              r"C:\Program Files\Microsoft Office\root\Office16\EXCEL.EXE",
-    "powerpoint":         r"C:\Program Files\Microsoft Office\root\Office16\POWERPNT.EXE",
-    "outlook":            r"C:\Program Files\Microsoft Office\root\Office16\OUTLOOK.EXE",
-    "onenote":            r"C:\Program Files\Microsoft Office\root\Office16\ONENOTE.EXE",
-    "teams":              _EV(r"%LOCALAPPDATA%\Microsoft\Teams\current\Teams.exe"),
-    "calculator":         "calc.exe",
-    "paint":              "mspaint.exe",
-    "snipping tool":      "SnippingTool.exe",
-    "task manager":       "taskmgr.exe",
-    "file explorer":      "explorer.exe",
-    "explorer":           "explorer.exe",
-    "control panel":      "control.exe",
-    "device manager":     "devmgmt.msc",
-    "registry editor":    "regedit.exe",
-    "command prompt":     "cmd.exe",
-    "cmd":                "cmd.exe",
-    "powershell":         "powershell.exe",
-    "terminal":           "wt.exe",
-    "windows terminal":   "wt.exe",
-    "vlc":                r"C:\Program Files\VideoLAN\VLC\vlc.exe",
-    "spotify":            _EV(r"%APPDATA%\Spotify\Spotify.exe"),
-    "itunes":             r"C:\Program Files\iTunes\iTunes.exe",
-    "windows media player": "wmplayer.exe",
-    "vs code":            _EV(r"%LOCALAPPDATA%\Programs\Microsoft VS Code\Code.exe"),
-    "vscode":             _EV(r"%LOCALAPPDATA%\Programs\Microsoft VS Code\Code.exe"),
-    "visual studio code": _EV(r"%LOCALAPPDATA%\Programs\Microsoft VS Code\Code.exe"),
-    "visual studio":      r"C:\Program Files\Microsoft Visual Studio\2022\Community\Common7\IDE\devenv.exe",
-    "pycharm":            r"C:\Program Files\JetBrains\PyCharm Community Edition\bin\pycharm64.exe",
-    "android studio":     r"C:\Program Files\Android\Android Studio\bin\studio64.exe",
-    "git bash":           r"C:\Program Files\Git\git-bash.exe",
-    "discord":            _EV(r"%LOCALAPPDATA%\Discord\Update.exe"),
-    "slack":              _EV(r"%LOCALAPPDATA%\slack\slack.exe"),
-    "zoom":               _EV(r"%APPDATA%\Zoom\bin\Zoom.exe"),
-    "skype":              _EV(r"%APPDATA%\Microsoft\Skype for Desktop\Skype.exe"),
-    "whatsapp":           _EV(r"%LOCALAPPDATA%\WhatsApp\WhatsApp.exe"),
-    "telegram":           _EV(r"%APPDATA%\Telegram Desktop\Telegram.exe"),
-    "steam":              r"C:\Program Files (x86)\Steam\steam.exe",
-    "epic games":         _EV(r"%LOCALAPPDATA%\EpicGamesLauncher\Portal\Binaries\Win64\EpicGamesLauncher.exe"),
-    "obs":                r"C:\Program Files\obs-studio\bin\64bit\obs64.exe",
-    "obs studio":         r"C:\Program Files\obs-studio\bin\64bit\obs64.exe",
-    "photoshop":          r"C:\Program Files\Adobe\Adobe Photoshop 2024\Photoshop.exe",
-    "adobe photoshop":    r"C:\Program Files\Adobe\Adobe Photoshop 2024\Photoshop.exe",
-    "premiere":           r"C:\Program Files\Adobe\Adobe Premiere Pro 2024\Adobe Premiere Pro.exe",
-    "after effects":      r"C:\Program Files\Adobe\Adobe After Effects 2024\Support Files\AfterFX.exe",
-    "illustrator":        r"C:\Program Files\Adobe\Adobe Illustrator 2024\Support Files\Contents\Windows\Illustrator.exe",
-    "blender":            r"C:\Program Files\Blender Foundation\Blender 4.0\blender.exe",
-    "minecraft":          _EV(r"%APPDATA%\.minecraft\MinecraftLauncher.exe"),
-    "notepad++":          r"C:\Program Files\Notepad++\notepad++.exe",
-    "7zip":               r"C:\Program Files\7-Zip\7zFM.exe",
-    "winrar":             r"C:\Program Files\WinRAR\WinRAR.exe",
-    "putty":              r"C:\Program Files\PuTTY\putty.exe",
-    "filezilla":          r"C:\Program Files\FileZilla FTP Client\filezilla.exe",
-}
-
-# Process name map for killing apps
-WIN_PROC_MAP = {
-    "chrome":         ["chrome.exe"],
-    "google chrome":  ["chrome.exe"],
-    "firefox":        ["firefox.exe"],
-    "edge":           ["msedge.exe"],
-    "brave":          ["brave.exe"],
-    "notepad":        ["notepad.exe"],
-    "word":           ["WINWORD.EXE"],
-    "excel":          ["EXCEL.EXE"],
-    "powerpoint":     ["POWERPNT.EXE"],
-    "outlook":        ["OUTLOOK.EXE"],
-    "teams":          ["Teams.exe"],
-    "calculator":     ["CalculatorApp.exe","calc.exe"],
-    "paint":          ["mspaint.exe"],
-    "task manager":   ["Taskmgr.exe"],
-    "spotify":        ["Spotify.exe"],
-    "vlc":            ["vlc.exe"],
-    "discord":        ["Discord.exe"],
-    "slack":          ["slack.exe"],
-    "zoom":           ["Zoom.exe"],
-    "skype":          ["Skype.exe"],
-    "whatsapp":       ["WhatsApp.exe"],
-    "telegram":       ["Telegram.exe"],
-    "steam":          ["steam.exe"],
-    "obs":            ["obs64.exe","obs32.exe","obs.exe"],
-    "obs studio":     ["obs64.exe"],
-    "photoshop":      ["Photoshop.exe"],
-    "blender":        ["blender.exe"],
-    "vs code":        ["Code.exe"],
-    "vscode":         ["Code.exe"],
-    "visual studio code": ["Code.exe"],
-    "visual studio":  ["devenv.exe"],
-    "pycharm":        ["pycharm64.exe"],
-    "notepad++":      ["notepad++.exe"],
-    "epic games":     ["EpicGamesLauncher.exe"],
-}
-
-
-def _registry_search(name_lower: str) -> list:
+class StreamingDictation:
     """
-    Search Windows Registry Uninstall keys for installed apps.
-    Returns list of (score, exe_path) tuples.
+    Dictation without a length cap. Audio is cut into segments at short
+    pauses. Each segment goes to the recogniser on a worker while the user
+    keeps talking, and the texts are stitched back in spoken order, so the
+    note is ready about as soon as the closing pause ends. Any sr.AudioSource
+    works: the mic, or sr.AudioFile for a recording.
     """
-    results = []
-    if not IS_WIN: return results
-    try:
-        import winreg
-        REG_PATHS = [
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
-            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
-            (winreg.HKEY_CURRENT_USER,  r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
-        ]
-        def rval(k, n):
-            try: return winreg.QueryValueEx(k, n)[0]
-            except: return ""
+    def __init__(self, transcribe, vad=None, pause=0.8, end_pause=2.5, timeout=10.0,
+                 max_segment=15.0, workers=4):
+        self.transcribe, self.vad = transcribe, vad or EnergyVAD()
+        self.pause, self.end_pause, self.timeout = pause, end_pause, timeout
+        self.max_segment, self.workers = max_segment, workers
+        self.segments = 0
+        self.latency  = None   # end of input → text ready, seconds
+
+    def run(self, src) -> str:
+        rate, width, chunk = src.SAMPLE_RATE, src.SAMPLE_WIDTH, src.CHUNK
+        step    = max(1, int(rate * 0.03)) * width          # judge speech per 30 ms
+        frame_s = step / width / rate
+        parent  = TRACER.current()
+        def recognise(audio, i):
+            with TRACER.adopt(parent, "stt.segment", index=i):
+                try: return self.transcribe(audio)
+                except Exception as e: print(f"[{BOT_TAG}] Segment {i} failed: {e}"); return ""
+
+        parts, seg, preroll = [], [], deque(maxlen=max(1, int(0.3 / frame_s)))
+        quiet, waited, heard = 0, 0.0, False
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            def flush():
+                if seg:
+                    audio = sr.AudioData(b"".join(seg), rate, width)
+                    parts.append(pool.submit(recognise, audio, len(parts))); seg.clear()
+            def frames():
+                while (buf := src.stream.read(chunk)):   # empty at the end of a recording
+                    for i in range(0, len(buf), step): yield buf[i:i + step]
+            for frame in frames():
+                speech = self.vad.is_speech(frame, width)
+                if not seg:
+                    if speech:
+                        seg.extend(preroll); seg.append(frame); preroll.clear()
+                        quiet, heard = 0, True
+                        continue
+                    preroll.append(frame); waited += frame_s
+                    if waited >= (self.end_pause if heard else self.timeout): break
+                    continue
+                seg.append(frame)
+                quiet = 0 if speech else quiet + 1
+                if quiet * frame_s >= self.pause or len(seg) * frame_s >= self.max_segment:
+                    flush(); waited = quiet * frame_s
+            flush()
+            done = time.perf_counter()
+            texts = [f.result() for f in parts]
+        self.latency, self.segments = time.perf_counter() - done, len(parts)
+        if not heard: raise sr.WaitTimeoutError("no speech")
+        return " ".join(t for t in texts if t)
 
-        for hive, reg_path in REG_PATHS:
-            try:
-                key = winreg.OpenKey(hive, reg_path)
-                for i in range(winreg.QueryInfoKey(key)[0]):
-                    try:
-                        sub = winreg.OpenKey(key, winreg.EnumKey(key, i))
-                        display  = rval(sub, "DisplayName").lower()
-                        exe_icon = rval(sub, "DisplayIcon")
-                        inst_loc = rval(sub, "InstallLocation")
-                        if not display: continue
-                        score = 2 if name_lower == display else (1 if name_lower in display or display in name_lower else 0)
-                        if score == 0: continue
-                        # Check InstallLocation for a matching .exe
-                        if inst_loc and os.path.isdir(inst_loc):
-                            for fn in os.listdir(inst_loc):
-                                if fn.lower().endswith(".exe"):
-                                    stem = fn.lower().replace(".exe","")
-                                    if name_lower in stem or stem in name_lower:
-                                        results.append((score+1, os.path.join(inst_loc, fn)))
-                        # DisplayIcon often IS the exe path
-                        if exe_icon:
-                            exe_path = exe_icon.split(",")[0].strip().strip('"')
-                            if exe_path.lower().endswith(".exe") and os.path.exists(exe_path):
-                                results.append((score, exe_path))
-                    except: pass
-            except: pass
-    except ImportError: pass
-    return results
 
+# ══════════════════════════════════════════════════════════════════════════════
+#  BARGE-IN  — keep the mic open while speaking; talking over the bot stops it
+# ══════════════════════════════════════════════════════════════════════════════
 
-def _find_any_app(name: str) -> str | None:
+class ScriptedAudioSource(sr.AudioSource if SR_OK else object):
     """
-    Find ANY installed app by name using 4 strategies:
-      1. Static alias map
-      2. Windows Registry (uninstall entries)
-      3. Start Menu .lnk / .exe shortcuts
-      4. Filesystem walk of install directories
-    Returns best-matching .exe/.lnk path or None.
+    Microphone stand-in with the sr.AudioSource interface. Plays a script of
+    (seconds, amplitude) segments as 16-bit mono frames in real time, then
+    silence. Amplitude 0 is silence; anything above the VAD threshold is speech.
+    The script starts on the first open. Like a real mic, a later open picks
+    up wherever the room is by then (realtime) or where the last read stopped.
     """
-    nl = name.lower().strip()
-    candidates = []  # (score, path)
-
-    # 1. Static alias map
-    if nl in WIN_APP_MAP:
-        path = WIN_APP_MAP[nl]
-        if "*" in path:
-            matches = glob.glob(path)
-            path = sorted(matches)[-1] if matches else None
-        if path and os.path.exists(path):
-            return path  # highest priority, return immediately
-
-    # 2. Registry
-    candidates.extend(_registry_search(nl))
-
-    # 3. Start Menu folders
-    start_dirs = [
-        _EV(r"%APPDATA%\Microsoft\Windows\Start Menu\Programs"),
-        _EV(r"%ProgramData%\Microsoft\Windows\Start Menu\Programs"),
-        _EV(r"%LOCALAPPDATA%\Programs"),
-    ]
-    for root_dir in start_dirs:
-        if not os.path.isdir(root_dir): continue
-        for root, dirs, files in os.walk(root_dir):
-            dirs[:] = [d for d in dirs if not d.startswith(".") and d != "node_modules"]
-            for fn in files:
-                if not fn.lower().endswith((".exe",".lnk")): continue
-                stem = os.path.splitext(fn)[0].lower()
-                score = 2 if nl == stem else (1 if nl in stem or stem in nl else 0)
-                if score: candidates.append((score, os.path.join(root, fn)))
-
-    # 4. Filesystem walk (limited depth for speed)
-    walk_dirs = [
-        _EV(r"%PROGRAMFILES%"), _EV(r"%PROGRAMFILES(X86)%"),
-        _EV(r"%LOCALAPPDATA%"), _EV(r"%APPDATA%"),
-    ]
-    SKIP = {"node_modules","__pycache__","cache","logs","temp","tmp","crash reports",
-            "crashreports","crashpad","resources","locales","swiftshader"}
-    for root_dir in walk_dirs:
-        if not os.path.isdir(root_dir): continue
-        for root, dirs, files in os.walk(root_dir):
-            depth = root.replace(root_dir,"").count(os.sep)
-            if depth > 5: dirs.clear(); continue
-            dirs[:] = [d for d in dirs if not d.startswith(".") and d.lower() not in SKIP]
-            for fn in files:
-                if not fn.lower().endswith(".exe"): continue
-                stem = os.path.splitext(fn)[0].lower()
-                score = 2 if nl == stem else (1 if nl in stem or stem in nl else 0)
-                if score: candidates.append((score, os.path.join(root, fn)))
-
-    if not candidates: return None
-    candidates.sort(key=lambda x: (-x[0], len(x[1])))
-    return candidates[0][1]
-
-
-def _launch_windows(name: str) -> bool:
-    """Launch a Windows app. Returns True if successfully launched."""
-    nl = name.lower().strip()
-
-    # Fast: direct .exe on PATH
-    if shutil.which(name): subprocess.Popen([name]); return True
-    if shutil.which(name+".exe"): subprocess.Popen([name+".exe"]); return True
-
-    # Full search
-    path = _find_any_app(nl)
-    if path:
-        if path.endswith(".lnk"): os.startfile(path); return True
-        if os.path.exists(path): subprocess.Popen([path]); return True
-
-    # PowerShell Start-Process (handles UWP + Store apps)
-    try:
-        r = subprocess.run(
-            ["powershell","-NoProfile","-Command",f"Start-Process '{nl}'"],
-            capture_output=True, timeout=5)
-        if r.returncode == 0: return True
-    except: pass
-
-    # Last resort: os.startfile
-    try: os.startfile(name); return True
-    except: pass
-
-    return False
+    SAMPLE_WIDTH = 2
+
+    def __init__(self, script, rate=16000, chunk=480, realtime=True):
+        self.script, self.SAMPLE_RATE, self.CHUNK = script, rate, chunk
+        self.realtime = realtime
+        self.stream   = None
+        self._t0      = None
+
+    def __enter__(self):
+        self.stream = self
+        if self._t0 is None: self._pos, self._t0 = 0, time.perf_counter()
+        elif self.realtime: self._pos = int((time.perf_counter() - self._t0) * self.SAMPLE_RATE)
+        return self
+
+    def __exit__(self, *exc):
+        self.stream = None
+
+    def amplitude(self, t: float) -> int:
+        for secs, amp in self.script:
+            if t < secs: return amp
+            t -= secs
+        return 0
+
+    def read(self, n: int) -> bytes:
+        t = self._pos / self.SAMPLE_RATE
+        self._pos += n
+        if self.realtime:
+            ahead = self._t0 + self._pos / self.SAMPLE_RATE - time.perf_counter()
+            if ahead > 0: time.sleep(ahead)
+        amp = self.amplitude(t)
+        return array("h", [amp, -amp] * (n // 2) + [amp] * (n % 2)).tobytes()
+
+
+class BargeIn:
+    """
+    Speak while a VAD watches the input. When the user starts talking the
+    TTS `stop` event is set — backends check it every 20 ms — and the rest of
+    the utterance, including the frames that triggered the VAD, is recorded
+    into `heard` for the next get_input() to transcribe without reopening
+    the mic.
+
+    The bot's own voice on the speaker reaches the mic too, usually well
+    above the ambient threshold. The first sound heard within `lead` seconds
+    of a reply starting is taken as that echo. The watcher measures it for
+    `settle` seconds, then only frames louder than `margin` times the echo
+    count as speech, for as long as the reply plays. Quieter frames raise the
+    echo level, so a reply that gets louder does not cut itself off, while a
+    voice close to the mic still does. Sound that first arrives after `lead`
+    (headphones, or a speaker that lags) uses the plain threshold. If that
+    was echo after all, the EchoGuard drops its transcript.
+    """
+    def __init__(self, tts, open_source, vad=None, pause=0.8, max_phrase=12.0,
+                 lead=1.0, settle=0.3, margin=2.0):
+        self.tts, self.open_source = tts, open_source
+        self.vad        = vad or EnergyVAD()
+        self.pause      = pause          # seconds of silence that end the utterance
+        self.max_phrase = max_phrase
+        self.lead, self.settle, self.margin = lead, settle, margin
+        self.echo_level = 0.0            # RMS of the bot's own voice in the last reply
+        self.heard      = None           # sr.AudioData of the interrupting utterance
+        self.latency    = None           # speech onset → playback stopped, seconds
+        self.count      = 0
+        self._lock      = threading.Lock()
+
+    def speak(self, text: str) -> bool:
+        """Speak `text`; True if the user cut in."""
+        with self._lock:
+            stop, done = threading.Event(), threading.Event()
+            watcher = threading.Thread(target=self._watch, args=(stop, done), daemon=True)
+            watcher.start()
+            self.tts.speak(text, stop=stop)
+            stopped = time.perf_counter()
+            done.set(); watcher.join()
+            if not stop.is_set(): return False
+            self.latency = stopped - self._onset; self.count += 1
+            print(f"[{BOT_TAG}] Barge-in — stopped {self.latency*1000:.0f} ms after you spoke.")
+            return True
+
+    def _watch(self, stop, done):
+        try:
+            with self.open_source() as src:
+                frame_s = src.CHUNK / src.SAMPLE_RATE
+                frames  = deque(maxlen=self.vad.onset + 5)   # pre-roll
+                lead, settle = self.lead / frame_s, self.settle / frame_s
+                run = n = 0; echo_at, level = None, 0.0
+                while not done.is_set():
+                    frame = src.stream.read(src.CHUNK); frames.append(frame); n += 1
+                    rms = self.vad.rms(frame)
+                    if echo_at is None and n <= lead and rms > self.vad.threshold: echo_at = n
+                    if echo_at is not None and n < echo_at + settle:   # our own first words
+                        level = max(level, rms); continue
+                    if rms > max(self.vad.threshold, level * self.margin): run += 1
+                    else: run = 0; level = max(level, rms) if echo_at else level
+                    if run >= self.vad.onset: break
+                else:
+                    self.echo_level = level
+                    return
+                self.echo_level = level
+                self._onset = time.perf_counter() - run * frame_s
+                stop.set()
+                with TRACER.span("mic.barge_in"):
+                    frames, quiet = list(frames), 0
+                    while quiet * frame_s < self.pause and len(frames) * frame_s < self.max_phrase:
+                        frame = src.stream.read(src.CHUNK); frames.append(frame)
+                        quiet = 0 if self.vad.is_speech(frame) else quiet + 1
+                data = b"".join(frames)
+                self.heard = sr.AudioData(data, src.SAMPLE_RATE, src.SAMPLE_WIDTH) if SR_OK else data
+        except Exception as e:
+            print(f"[{BOT_TAG}] Barge-in watcher: {e}")
 
 
-def _close_windows(name: str) -> tuple:
-    """Kill all processes matching name. Returns (success, killed_list)."""
-    nl = name.lower().strip()
-    killed = []
+# ══════════════════════════════════════════════════════════════════════════════
+#  SELF-ECHO  — don't transcribe (or obey) the bot's own voice
+# ══════════════════════════════════════════════════════════════════════════════
 
-    if not PSUTIL_OK:
-        targets = WIN_PROC_MAP.get(nl, [nl+".exe", nl.replace(" ","")+".exe"])
-        for pn in targets:
-            r = subprocess.run(["taskkill","/F","/IM",pn], capture_output=True)
-            if r.returncode == 0: killed.append(pn)
-        return bool(killed), killed
+_WORDS = re.compile(r"[a-z0-9']+")
 
-    targets = WIN_PROC_MAP.get(nl, [])
-    for proc in psutil.process_iter(["pid","name"]):
-        try:
-            pname = proc.info["name"] or ""
-            pl = pname.lower()
-            if pname in targets or nl in pl or pl.replace(".exe","") in nl:
-                proc.kill(); killed.append(pname)
-        except (psutil.NoSuchProcess, psutil.AccessDenied): pass
 
-    return bool(killed), killed
+class EchoGuard:
+    """
+    Two filters between the speaker and the router.
+      gate     capture is closed while a reply plays and for `tail` seconds
+               after it, while the room still rings and the output device
+               drains. Audio heard entirely inside that window is dropped
+               before it costs a transcription.
+      content  what the bot said in the last `memory` seconds is kept. A
+               transcript that matches a stretch of it (difflib ratio >=
+               `threshold` over the words) is rejected before routing. That
+               catches echo the gate let through: a laggy Bluetooth speaker,
+               or a timer that spoke while the mic was already recording.
+    Transcripts shorter than `min_words` only count as echo when they match
+    a whole reply ("stopwatch started"), so "help" right after "say help
+    for the command list" still gets through. `memory` is kept short for
+    the same reason: echo arrives within a second or two, while a user
+    repeating a suggestion usually takes longer. `gated` and `echoes`
+    count what each filter caught.
+    """
+    def __init__(self, tail=0.5, threshold=0.8, memory=5.0, min_words=3):
+        self.tail, self.threshold, self.memory, self.min_words = tail, threshold, memory, min_words
+        self.gated = self.echoes = 0
+        self._spoken = deque(maxlen=8)   # [start, end or None while playing, words]
+        self._lock   = threading.Lock()
+
+    def speaking(self, text: str):
+        """Context manager around one spoken reply."""
+        return _Speaking(self, text)
+
+    def is_open(self, now=None) -> bool:
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            return not any(e[1] is None or now < e[1] + self.tail for e in self._spoken)
+
+    def wait_open(self, timeout=30.0):
+        """Block until nothing is playing (plus the tail); False on timeout."""
+        end = time.monotonic() + timeout
+        while not self.is_open():
+            if time.monotonic() > end: return False
+            time.sleep(0.02)
+        return True
+
+    def covered(self, start: float, end: float) -> bool:
+        """True when [start, end] fell entirely inside one reply and its tail."""
+        now = time.monotonic()
+        with self._lock:
+            return any(e[0] <= start and (now if e[1] is None else e[1]) + self.tail >= end
+                       for e in self._spoken)
+
+    def gate(self, start: float, end: float) -> bool:
+        """Drop a capture that only heard the bot. Counts it; True if dropped."""
+        if not self.covered(start, end): return False
+        self.gated += 1
+        return True
+
+    def is_echo(self, transcript: str) -> bool:
+        """Reject (and count) a transcript that repeats something the bot just said."""
+        heard = _WORDS.findall(transcript.lower())
+        if not heard: return False
+        now, m = time.monotonic(), len(heard)
+        with self._lock:
+            recent = [e[2] for e in self._spoken if e[1] is None or now - e[1] < self.memory]
+        for said in recent:
+            if m < self.min_words: windows = [said]
+            else: windows = [said[i:i + n] for n in (m - 1, m, m + 1) for i in range(max(1, len(said) - n + 1))]
+            if any(difflib.SequenceMatcher(None, heard, w).ratio() >= self.threshold for w in windows):
+                self.echoes += 1
+                return True
+        return False
+
+    def reject(self, transcript: str) -> bool:
+        """is_echo(), and say so: printed and journaled as "echo". True if rejected."""
+        if not self.is_echo(transcript): return False
+        print(f"[{BOT_TAG}] That was my own voice — ignored.")
+        JOURNAL.record(transcript, None, "echo")
+        return True
+
+
+class _Speaking:
+    __slots__ = ("guard", "entry")
+
+    def __init__(self, guard, text):
+        self.guard, self.entry = guard, [0.0, None, _WORDS.findall(text.lower())]
+
+    def __enter__(self):
+        self.entry[0] = time.monotonic()
+        with self.guard._lock: self.guard._spoken.append(self.entry)
+        return self
+
+    def __exit__(self, *exc):
+        self.entry[1] = time.monotonic()
+
+
+def bench_echo(latency=0.25, laggy=0.9):
+    """
+    --bench-echo: a scripted session, run with and without the guard.
+    The bot's own get_input() listens through MicListener to a
+    ScriptedAudioSource room: the user's commands, and the bot's replies
+    again, `latency` seconds late (one `laggy` seconds late, as a Bluetooth
+    speaker would). The replies go out through bot.say() to SimulatedTTS on
+    a schedule. Every word has its own amplitude, so a stub recognizer can
+    return exactly the words a capture picked up. Returns the counts.
+    """
+    user = [(2.2, "open spotify"), (5.3, "what time is it")]
+    bot  = [(0.2, "Your five minute timer is up."), (3.4, "Opening spotify."),
+            (6.4, "It's three fifteen. Say set a timer to start another timer.")]
+    wps, total = 8.0, 10.0
+    words, segments = {}, []   # amplitude → (word, who); (start, amplitude) per word
+    for who, lines, late in (("user", user, lambda i: 0.0), ("bot", bot, lambda i: laggy if i == 2 else latency)):
+        for i, (t, text) in enumerate(lines):
+            for k, w in enumerate(_WORDS.findall(text.lower())):
+                amp = 2000 + 40 * len(words); words[amp] = (w, who)
+                segments.append((t + late(i) + k / wps, amp))
+    script, now = [], 0.0
+    for start, amp in sorted(segments):
+        script += [(start - now, 0), (1 / wps, amp)]; now = start + 1 / wps
+
+    def session(guarded):
+        room, heard, stats = ScriptedAudioSource(script), [], Counter()
+        def transcribe(audio):
+            stats["transcriptions"] += 1
+            pcm = array("h", audio.get_raw_data())
+            amps = list(dict.fromkeys(abs(x) for x in pcm[::room.CHUNK] if abs(x) in words))
+            heard.append([words[a][1] for a in amps])
+            return " ".join(words[a][0] for a in amps)
+        mic = MicListener(lambda: room); mic._transcribe = transcribe
+        mic.timeout, mic.phrase_limit = 1, 4
+        term = Terminator(tts=SimulatedTTS(words_per_sec=wps), mic=mic)
+        if not guarded: mic.echo = None
+        def speak_all():
+            for t, text in bot:
+                time.sleep(max(0.0, t0 + t - time.perf_counter())); term.say(text)
+        with contextlib.redirect_stdout(io.StringIO()):
+            with room: t0 = room._t0   # the room's clock starts now
+            speaker = threading.Thread(target=speak_all, daemon=True); speaker.start()
+            while time.perf_counter() - t0 < total:
+                if not term.get_input(): continue
+                stats["bot speech routed" if set(heard[-1]) == {"bot"} else "user commands routed"] += 1
+            speaker.join()
+        stats["captures gated"], stats["echoes rejected"] = term.echo.gated, term.echo.echoes
+        return stats
+
+    off, on = session(False), session(True)
+    print(f"\n🔇  SELF-ECHO ({len(user)} user commands, {len(bot)} replies, "
+          f"speaker {latency*1000:.0f} ms late, one {laggy*1000:.0f} ms)\n" + "─"*50)
+    print(f"  {'':<24}{'guard off':>12}{'guard on':>12}")
+    for row in ("transcriptions", "bot speech routed", "user commands routed", "captures gated", "echoes rejected"):
+        print(f"  {row:<24}{off[row]:>12}{on[row]:>12}")
+    print("─"*50)
+    return {"off": off, "on": on}
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -535,41 +1307,537 @@ CONFUSED = [
     "I do not understand. Say help to see what I can do.",
 ]
 
+# Compound utterances: "open slack and spotify, then set a 25 minute timer"
+COMPOUND_SPLIT = re.compile(r"(\s*(?:,|;|\band then\b|\bthen\b|\band\b|\balso\b)\s*)")
+
+# Routines: name → steps. A step is a command string, or {"do": cmd, "after": [earlier cmds]}
+ROUTINES_FILE = "terminator_routines.json"
+DEFAULT_ROUTINES = {
+    "start work": [
+        "open vs code",
+        "open slack",
+        "open downloads folder",
+        {"do": "pomodoro 50 10", "after": ["open vs code", "open slack"]},
+    ],
+}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  COMMAND PACKS  — triggers registered up front, handlers imported on first use
+# ══════════════════════════════════════════════════════════════════════════════
+
+# Pack modules import shared flags from here — make `python Terminator.py`
+# and `import Terminator` resolve to the same module object.
+sys.modules.setdefault("Terminator", sys.modules[__name__])
+
+MANIFEST_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "packs", "manifest.json")
+
+# ── Slot grammar ───────────────────────────────────────────────────────────────
+# A manifest command may list "patterns" such as "weather (?:in|for) {city}" or
+# "pomodoro {work:int}". Each {name} / {name:type} becomes a typed named group;
+# patterns are compiled once and the first match hands the handler its slots
+# as keyword arguments. A space in a pattern matches any run of whitespace,
+# " ?" makes it optional.
+
+NUMBER_WORDS = {"a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+                "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10, "fifteen": 15,
+                "twenty": 20, "thirty": 30, "forty": 40, "forty five": 45, "sixty": 60}
+_NUM   = r"(?:\d+(?:\.\d+)?|" + "|".join(sorted(NUMBER_WORDS, key=len, reverse=True)) + r")"
+ORDINALS = {w: i for i, w in enumerate("first second third fourth fifth sixth seventh eighth ninth tenth".split(), 1)}
+_ORD   = r"(?:\d+(?:st|nd|rd|th)|" + "|".join(ORDINALS) + r")"
+_UNITS = {"h": 3600, "m": 60, "s": 1}
+
+
+def _to_number(s: str):
+    s = s.strip()
+    if s in NUMBER_WORDS: return NUMBER_WORDS[s]
+    return int(s) if s.lstrip("-").isdigit() else float(s)
+
+
+def _to_seconds(s: str) -> int:
+    parts = re.findall(f"({_NUM})" + r"\s*(h|m|s)", s)
+    return int(sum(_to_number(n) * _UNITS[u] for n, u in parts))
+
+
+def duration_label(secs: int) -> str:
+    """5400 → "1 hour 30 minutes" — the spoken form of a {duration} slot."""
+    parts = []
+    for unit, size in (("hour", 3600), ("minute", 60), ("second", 1)):
+        n, secs = divmod(int(secs), size)
+        if n: parts.append(f"{n} {unit}{'s' if n!=1 else ''}")
+    return " ".join(parts) or "0 seconds"
+
+
+def _to_clock(s: str):
+    """'7', '7:30', '7 pm', '12 a.m.' → (hour, minute) on a 24 h clock."""
+    m = re.match(r"(\d{1,2})(?::(\d{2}))?\s*([ap])?", s)
+    hour, minute, ampm = int(m.group(1)), int(m.group(2) or 0), m.group(3)
+    if ampm == "p" and hour != 12: hour += 12
+    elif ampm == "a" and hour == 12: hour = 0
+    return hour, minute
+
+
+def _to_name(s: str) -> str:
+    """App / city names — drop fillers around the name itself."""
+    s = re.sub(r"^(?:the|my)\s+", "", s.strip(" .?!"))
+    return re.sub(r"(?:^|\s+)(?:app|application|please|now|right now|today|tomorrow|"
+                  r"this week|the week|week)$", "", s).strip()
+
+
+SLOT_TYPES = {   # type → (regex, converter)
+    "duration": (rf"(?:{_NUM}\s*(?:hours?|hrs?|minutes?|mins?|seconds?|secs?)(?:\s*(?:and\s+)?)?)+", _to_seconds),
+    "time":     (r"\d{1,2}(?::\d{2})?(?:\s*[ap]\.?\s?m\b\.?)?", _to_clock),
+    "int":      (rf"\d+|{_NUM}", lambda s: int(_to_number(s))),
+    "number":   (rf"-?\d+(?:\.\d+)?|{_NUM}", _to_number),
+    "ordinal":  (_ORD, lambda s: ORDINALS.get(s) or int(s[:-2])),
+    "word":     (r"[\w'.+-]+", str),
+    "text":     (r".+", lambda s: s.strip(" .?!")),
+    "app":      (r".+", _to_name),
+    "city":     (r"[a-z][a-z .'-]*", _to_name),
+}
+_SLOT = re.compile(r"\{(\w+)(?::(\w+))?\}")
+
+
+def compile_pattern(pattern: str):
+    """'open {app}' → (compiled regex, {slot: converter})."""
+    converters = {}
+    def slot(m):
+        name = m.group(1)
+        typ  = m.group(2) or (name if name in SLOT_TYPES else "text")
+        converters[name] = SLOT_TYPES[typ][1]
+        return f"(?P<{name}>{SLOT_TYPES[typ][0]})"
+    rx = pattern.replace(" ?", r"\s*").replace(" ", r"\s+")
+    return re.compile(r"\b" + _SLOT.sub(slot, rx)), converters
+
+
+class Command:
+    """
+    One manifest entry. Triggers are known up front; the handler is resolved
+    (importing its pack module) the first time the command is called.
+    Flags:  list   — a bare follow-up item inherits the verb ("open slack and spotify")
+            gather — with list: the items go to one call ("ping google, github")
+            greedy — free-text argument, never split on "and" / commas
+            serial — stateful or interactive; runs alone, in spoken order
+            exact  — destructive or hard to undo; never guessed by sound
+    "patterns" are compiled once into the slot grammar used by parse().
+    """
+    __slots__ = ("pack", "module", "name", "triggers", "list", "gather", "greedy", "serial",
+                 "exact", "grammar", "_fn")
+
+    def __init__(self, entry: dict, module):
+        self.pack     = entry["pack"]
+        self.module   = module
+        self.name     = entry["handler"]
+        self.triggers = entry["triggers"]
+        self.list     = entry.get("list", False)
+        self.gather   = entry.get("gather", False)
+        self.greedy   = entry.get("greedy", False)
+        self.serial   = entry.get("serial", False)
+        self.exact    = entry.get("exact", False)
+        self.grammar  = [compile_pattern(p) for p in entry.get("patterns", [])]
+        self._fn      = None
+
+    @property
+    def fn(self):
+        if self._fn is None:
+            if self.module is None: self._fn = getattr(Terminator, "_" + self.name)
+            else: self._fn = getattr(importlib.import_module(self.module), self.name)
+        return self._fn
+
+    def parse(self, text: str) -> dict:
+        """Typed slots from the first matching pattern ({} if none match)."""
+        for rx, converters in self.grammar:
+            m = rx.search(text)
+            if not m: continue
+            slots = {}
+            for name, raw in m.groupdict().items():
+                if raw is None: continue
+                try: value = converters[name](raw)
+                except (ValueError, AttributeError): continue
+                if value not in ("", None): slots[name] = value
+            return slots
+        return {}
+
+    def __call__(self, bot, q):
+        return self.fn(bot, q, **self.parse(q))
+
+    def __repr__(self):
+        return f"<Command {self.pack}.{self.name}>"
+
+
+_COMMANDS = {}   # manifest path → [Command], shared by every session
+
+
+def read_commands(path=MANIFEST_FILE) -> list:
+    """A fresh Command list from the pack manifest (load_commands keeps the shared one)."""
+    with open(path, encoding="utf-8") as f: manifest = json.load(f)
+    packs = manifest["packs"]
+    return [Command(e, packs[e["pack"]]["module"]) for e in manifest["commands"]]
+
+
+def load_commands(path=MANIFEST_FILE) -> list:
+    """Ordered Command list from the pack manifest — the first matching trigger wins."""
+    if path not in _COMMANDS: _COMMANDS[path] = read_commands(path)
+    return _COMMANDS[path]
+
+
+# ── Phonetic fallback ──────────────────────────────────────────────────────────
+# Recognisers mishear: "stop watch", "pomo door oh", "screen shut". When no
+# trigger occurs verbatim, runs of heard words are reduced to a Metaphone-style
+# key (spaces ignored, vowels after the first letter dropped) and looked up in
+# an index of trigger keys. A key that misses gets one edit of slack through a
+# delete index: every key with one letter removed is stored up front, so a
+# lookup is a handful of dict probes, never a scan over all triggers. The
+# first sound has to agree — recognisers rarely get the onset wrong, and
+# without that rule ordinary chatter starts matching two-word triggers.
+
+_FRONT = {"ae": "e", "gn": "n", "kn": "n", "pn": "n", "wr": "r", "wh": "w", "x": "s"}
+_SOFT  = set("eiy")
+_VOWEL = set("aeiou")
+
+
+@functools.lru_cache(maxsize=4096)
+def phonetic_key(text: str) -> str:
+    """'stop watch' → 'STPWX', 'chrome' / 'crome' → 'KRM'."""
+    w = re.sub(r"[^a-z0-9]", "", text.lower())
+    if w[:2] in _FRONT: w = _FRONT[w[:2]] + w[2:]
+    elif w[:1] in _FRONT: w = _FRONT[w[:1]] + w[1:]
+    out, n = [], len(w)
+    for i, c in enumerate(w):
+        nxt, nxt2 = w[i+1:i+2], w[i+2:i+3]
+        prev = w[i-1] if i else ""
+        if c == prev and c != "c": continue
+        if c in _VOWEL:
+            k = c.upper() if i == 0 else ""
+        elif c == "b":
+            k = "" if prev == "m" and i == n - 1 else "B"
+        elif c == "c":
+            if nxt == "h": k = "K" if prev == "s" or nxt2 in ("r", "l") else "X"
+            elif nxt == "i" and nxt2 == "a": k = "X"
+            elif nxt in _SOFT: k = "" if prev == "s" else "S"
+            else: k = "" if prev == "c" else "K"
+        elif c == "d":
+            k = "J" if nxt == "g" and nxt2 in _SOFT else "T"
+        elif c == "g":
+            if nxt == "h" and nxt2 not in _VOWEL: k = ""
+            elif nxt == "n" and i + 2 >= n: k = ""
+            elif prev == "d" and nxt in _SOFT: k = ""
+            else: k = "J" if nxt in _SOFT and prev != "g" else "K"
+        elif c == "h":
+            k = "" if (prev and prev in "cgpst") or (prev in _VOWEL and nxt not in _VOWEL) else "H"
+        elif c == "k": k = "" if prev == "c" else "K"
+        elif c == "p": k = "F" if nxt == "h" else "P"
+        elif c == "q": k = "K"
+        elif c == "s":
+            k = "X" if nxt == "h" or (nxt == "i" and nxt2 in ("o", "a")) else "S"
+        elif c == "t":
+            if nxt == "i" and nxt2 in ("o", "a"): k = "X"
+            elif nxt == "h": k = "0"
+            elif nxt == "c" and nxt2 == "h": k = ""
+            else: k = "T"
+        elif c == "v": k = "F"
+        elif c in "wy": k = c.upper() if nxt in _VOWEL else ""
+        elif c == "x": k = "KS"
+        elif c == "z": k = "S"
+        else: k = c.upper()
+        out.append(k)
+    return "".join(out)
+
+
+class PhoneticIndex:
+    """
+    Trigger keys → (trigger, Command), first manifest entry wins. Keys shorter
+    than `min_key` letters are too common to trust ("bye" → B) and are left
+    out; the one-edit fallback needs `min_edit` letters.
+
+    A guess is only taken when it accounts for at least `min_cover` of what
+    was said (letters, fillers such as "the" / "my" not counted): the run of
+    words that sounded like the trigger, the slots the command's patterns
+    pick up around it, and words that occur in some trigger ("how", "take").
+    "where did I leave my keys" is not a date request because "where did"
+    sounds like "what day". Commands flagged "exact" are indexed too, but a
+    guess that lands on one is dropped: "clean notes" is as close to "clear
+    notes" as to "commands", so neither runs.
+    """
+    FILLER = {"a", "an", "the", "i", "me", "my", "it", "is", "to", "of", "on", "in", "for", "and",
+              "please", "can", "you", "could", "would", "just", "now"}
+
+    def __init__(self, commands, min_key=3, min_edit=4, min_cover=0.5):
+        self.exact, self.near = {}, {}
+        self.min_key, self.min_edit, self.min_cover = min_key, min_edit, min_cover
+        self.max_words = self.max_key = 0
+        self.vocab = set()
+        for cmd in commands:
+            for t in cmd.triggers:
+                self.vocab.update(re.findall(r"[a-z0-9']+", t))
+                key = phonetic_key(t)
+                if len(key) < min_key: continue
+                self.exact.setdefault(key, (t.strip(), cmd))
+                self.max_words = max(self.max_words, len(t.split()))
+                self.max_key   = max(self.max_key, len(key))
+                if len(key) >= min_edit:
+                    for d in self._deletes(key): self.near.setdefault(d, []).append((key, t.strip(), cmd))
+
+    @staticmethod
+    def _deletes(key):
+        return {key} | {key[:i] + key[i+1:] for i in range(len(key))}
+
+    @staticmethod
+    def _one_edit(a, b) -> bool:
+        """Levenshtein distance <= 1 (a shared delete can also be one delete on each side)."""
+        if len(a) == len(b): return sum(x != y for x, y in zip(a, b)) <= 1
+        if len(a) > len(b): a, b = b, a
+        return len(b) - len(a) == 1 and any(b[:i] + b[i+1:] == a for i in range(len(b)))
+
+    def _near(self, key):
+        """One-edit hits for key with the same onset; a hit on an "exact" command comes first."""
+        hits = {(t, cmd) for d in self._deletes(key) for k, t, cmd in self.near.get(d, ())
+                if k[0] == key[0] and self._one_edit(k, key)}
+        return min(hits, key=lambda h: (not h[1].exact, h[0]), default=None)
+
+    def cover(self, text: str, trigger: str, cmd) -> float:
+        """Share of the letters in `text` (corrected) explained by the trigger, its slots and command words."""
+        spans = [m.span() for m in [re.search(re.escape(trigger), text)] + [rx.search(text) for rx, _ in cmd.grammar] if m]
+        said = explained = 0
+        for m in re.finditer(r"[a-z0-9']+", text):
+            if m.group() in self.FILLER: continue
+            said += len(m.group())
+            if m.group() in self.vocab or any(a <= m.start() < b for a, b in spans): explained += len(m.group())
+        return explained / said if said else 0.0
+
+    def lookup(self, text: str):
+        """
+        (corrected text, trigger, Command) for the best sound-alike run of
+        words in `text`, or None. Exact key hits beat one-edit hits, then the
+        longer key, then the run that swallows more words.
+        """
+        words = re.findall(r"[a-z0-9]+", text.lower().replace("'", ""))
+        best = None   # (rank, i, j, trigger, cmd)
+        for i in range(len(words)):
+            # a trigger of k words may be heard as a few more ("pomo door oh")
+            for j in range(i + 1, min(len(words), i + self.max_words + 3) + 1):
+                key = phonetic_key("".join(words[i:j]))
+                if len(key) > self.max_key + 1: break
+                if len(key) < self.min_key: continue
+                hit, grade = self.exact.get(key), 2
+                if not hit and len(key) >= self.min_edit: hit, grade = self._near(key), 1
+                if not hit: continue
+                rank = (grade, len(key), j - i, hit[1].exact)   # on a tie, the "exact" command wins (and is dropped)
+                if best is None or rank > best[0]: best = (rank, i, j) + hit
+        if not best: return None
+        _, i, j, trigger, cmd = best
+        corrected = " ".join(words[:i] + [trigger] + words[j:])
+        if cmd.exact or self.cover(corrected, trigger, cmd) < self.min_cover: return None
+        return corrected, trigger, cmd
+
+
+_FUZZY = {}   # manifest path → PhoneticIndex
+
+
+def fuzzy_index(path=MANIFEST_FILE) -> PhoneticIndex:
+    if path not in _FUZZY: _FUZZY[path] = PhoneticIndex(load_commands(path))
+    return _FUZZY[path]
+
+
+def _drop_fuzzy() -> bool:
+    had = bool(_FUZZY) or phonetic_key.cache_info().currsize > 0
+    _FUZZY.clear(); phonetic_key.cache_clear()
+    return had
+
+
+IDLE.register("phonetic index", _drop_fuzzy)
+
+
+MISHEARD_FILE = os.path.join(os.path.dirname(MANIFEST_FILE), "data", "misheard.tsv")
+
+
+def bench_fuzzy(path=MISHEARD_FILE):
+    """
+    --bench-fuzzy: route every corpus line the way _route does — verbatim
+    trigger first, then the phonetic fallback — and score the handler it
+    reaches against the one wanted ("-": should reach none). A misheard
+    "exact" command (lock screen, clear todo) should reach none as well.
+    """
+    commands = load_commands()
+    t0 = time.perf_counter(); index = fuzzy_index(); build = time.perf_counter() - t0
+    rows = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip() and not line.startswith("#"): rows.append(line.rstrip("\n").split("\t"))
+    score, times = Counter(), []
+    guarded = {cmd.name for cmd in commands if cmd.exact}
+    def first(text):
+        for cmd in commands:
+            if any(t in text for t in cmd.triggers): return cmd
+    for heard, want in rows:
+        got, how = first(heard), "exact"
+        if not got:
+            t0 = time.perf_counter(); hit = index.lookup(heard); times.append(time.perf_counter() - t0)
+            got, how = hit and hit[2], "sound"
+            if want in guarded: want = "-"; score["guarded"] += 1
+        name = got.name if got else "-"
+        if want == "-": score["noise"] += 1
+        if name == want: score[f"ok {how}" if got else "ok quiet"] += 1; continue
+        score["misrouted" if got else "missed"] += 1
+        print(f"  {'misrouted' if got else 'missed':<9} {heard!r} → {name} by {how} (want {want})")
+    times.sort()
+    commands_n = len(rows) - score["noise"]
+    routed = score["ok exact"] + score["ok sound"] + score["misrouted"]
+    print(f"\n🎯  PHONETIC FALLBACK ({len(rows)} utterances, index built in {build*1000:.1f} ms)\n" + "─"*50)
+    print(f"  right handler, verbatim trigger {score['ok exact']:>5}")
+    print(f"  right handler, by sound         {score['ok sound']:>5}")
+    print(f"  wrong handler (false positive)  {score['misrouted']:>5}")
+    print(f"  command not recognised          {score['missed']:>5}")
+    print(f"  noise left alone                {score['ok quiet']:>5} / {score['noise']}"
+          f"  ({score['guarded']} misheard exact-only commands)")
+    print(f"  commands routed right           {100*(score['ok exact']+score['ok sound'])/(commands_n or 1):>5.0f}%")
+    print(f"  false-positive rate             {100*score['misrouted']/(routed or 1):>5.0f}%  of {routed} routed")
+    if times:
+        print(f"  lookup median / p95 / max {times[len(times)//2]*1e6:>7.0f} / "
+              f"{times[int(len(times)*.95)]*1e6:.0f} / {times[-1]*1e6:.0f} µs")
+    print("─"*50)
+
+
+# ── Hot reload ─────────────────────────────────────────────────────────────────
+# Edit a pack module, a table in one (WIN_APP_MAP) or the manifest, and the
+# running bot picks it up. Changed modules are reloaded, together with every
+# loaded pack that imports from them, dependencies first. Then a new Command
+# list and phonetic index are built off to the side and published with one
+# assignment each. A bot adopts the newest list when an utterance starts, so
+# a command never sees half of one registry and half of another. Live state
+# stays where it is: timers are threads, the stopwatch and user_name live on
+# the bot, and a pack lists module globals it must not lose in _KEEP.
+# Content files in packs/data are re-read by mtime anyway.
+
+_PACK_IMPORT = re.compile(r"^(?:from (packs\.\w+) import|import (packs\.\w+))", re.M)
+
+
+class HotReloader:
+    def __init__(self, path=MANIFEST_FILE, every=1.0):
+        self.path, self.every = path, every
+        self.dir   = os.path.dirname(path)
+        self._lock = threading.Lock()
+        self._seen = self._scan()
+        self._thread = None
+
+    def _scan(self) -> dict:
+        """{file: mtime_ns} for the pack modules and the manifest."""
+        out = {}
+        try:
+            with os.scandir(self.dir) as it:
+                for e in it:
+                    if e.name.endswith(".py") or e.path == self.path: out[e.path] = e.stat().st_mtime_ns
+        except OSError: pass
+        return out
+
+    def _reload_modules(self, changed: set) -> list:
+        """Reload the loaded pack modules in `changed` and their importers, dependencies first."""
+        deps = {}
+        for name, mod in list(sys.modules.items()):
+            if not name.startswith("packs.") or not getattr(mod, "__file__", None): continue
+            try:
+                with open(mod.__file__, encoding="utf-8") as f: deps[name] = {a or b for a, b in _PACK_IMPORT.findall(f.read())}
+            except OSError: deps[name] = set()
+        stale = changed & deps.keys()
+        while True:
+            more = {n for n, d in deps.items() if d & stale} - stale
+            if not more: break
+            stale |= more
+        order = list(graphlib.TopologicalSorter({n: deps[n] & stale for n in stale}).static_order())
+        for name in order:
+            mod  = sys.modules[name]
+            keep = {k: mod.__dict__[k] for k in getattr(mod, "_KEEP", ()) if k in mod.__dict__}
+            importlib.reload(mod)
+            mod.__dict__.update(keep)
+        return order
+
+    def check(self) -> list:
+        """Reload whatever changed since the last check. Returns the changed file names."""
+        with self._lock:
+            now = self._scan()
+            changed = sorted(p for p in now.keys() | self._seen.keys() if now.get(p) != self._seen.get(p))
+            self._seen = now
+            if not changed: return []
+            with TRACER.span("reload", files=len(changed)):
+                mods = {"packs." + os.path.basename(p)[:-3] for p in changed if p.endswith(".py")}
+                self._reload_modules(mods)
+                commands = read_commands(self.path)
+                index = PhoneticIndex(commands)
+                _FUZZY[self.path], _COMMANDS[self.path] = index, commands   # the swap bots pick up
+            return [os.path.basename(p) for p in changed]
+
+    def _watch(self):
+        while True:
+            time.sleep(self.every)
+            try: names = self.check()
+            except Exception as e: print(f"[{BOT_TAG}] Reload failed, keeping the old commands: {e}"); continue
+            if names: print(f"[{BOT_TAG}] Reloaded {', '.join(names)}.")
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._watch, daemon=True, name="hot-reload")
+            self._thread.start()
+
+
+RELOADER = HotReloader()
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  TERMINATOR CORE
 # ══════════════════════════════════════════════════════════════════════════════
 
 class Terminator:
-    def __init__(self, text_mode=False):
+    def __init__(self, text_mode=False, tts=None, barge_in=False, ask=None, mic=None):
         self.text_mode  = text_mode
+        self.ask        = ask or (lambda prompt: input(f"    ({prompt}) → "))   # typed follow-up answers
         self.user_name  = "human"
         self.is_running = True
         self._clipboard = ""
+        self._local     = threading.local()   # per-thread reply capture for compound commands
 
-        self.tts = TTSEngine()
-        self.mic = MicListener() if not text_mode else None
+        self.tts = tts or TTSEngine()
+        self.mic = mic or (MicListener() if not text_mode else None)
+        self.echo = EchoGuard()
+        if self.mic: self.mic.echo = self.echo
 
         if not text_mode and (self.mic is None or not self.mic.available):
             print(f"[{BOT_TAG}] No mic available — switching to text mode.")
             self.text_mode = True
 
+        self.barge = None
+        if barge_in and not self.text_mode:
+            source = mic.open_source if mic else lambda: sr.Microphone(sample_rate=16000, chunk_size=480)
+            self.barge = BargeIn(self.tts, source, EnergyVAD(threshold=self.mic.r.energy_threshold * 2))
+
         self.commands = self._register_commands()
+        if hasattr(self.tts, "unload"): IDLE.register("speech engine", self.tts.unload, self.tts.load)
+        if self.mic and self.mic.available:
+            IDLE.register("whisper model", self.mic.unload_whisper, self.mic.warm_whisper)
 
     # ── I/O ───────────────────────────────────────────────────────────────────
 
     def say(self, text: str):
-        self.tts.speak(text)
+        replies = getattr(self._local, "replies", None)
+        if replies is not None: replies.append(text); return
+        with self.echo.speaking(text):
+            if self.barge: self.barge.speak(text)
+            else: self.tts.speak(text)
 
     def get_input(self) -> str:
         if self.text_mode:
             try:    return input("👤  You: ").strip().lower()
             except: return "goodbye"
+        if self.barge and self.barge.heard is not None:   # cut in while we were talking
+            audio, self.barge.heard = self.barge.heard, None
+            return self.mic.hear(audio)   # recorded during playback: the gate cannot help, the echo check can
         return self.mic.listen_once()
 
     def _dictate(self, prompt="") -> str:
+        replies = getattr(self._local, "replies", None)
+        if replies:   # a captured question must be heard before we listen
+            self.tts.speak(" ".join(replies)); replies.clear()
         if self.text_mode:
-            try:    return input(f"    ({prompt}) → ").strip()
+            try:    return self.ask(prompt).strip()
             except: return ""
         return self.mic.listen_long(prompt)
 
@@ -589,602 +1857,129 @@ class Terminator:
         g = "Good morning" if h < 12 else ("Good afternoon" if h < 17 else "Good evening")
         self.say(f"{g}, {self.user_name}.")
 
-    # ── Maths ──────────────────────────────────────────────────────────────
-    def _calculate(self, q):
-        expr = (q.replace("calculate","").replace("what is","").replace("compute","")
-                  .replace("equals","").replace("plus","+").replace("minus","-")
-                  .replace("times","*").replace("multiplied by","*")
-                  .replace("divided by","/").replace("over","/")
-                  .replace("to the power of","**").replace("squared","**2")
-                  .replace("cubed","**3").replace("percent of","*0.01*").strip())
-        try:
-            allowed = {k: getattr(math, k) for k in dir(math) if not k.startswith("_")}
-            r = eval(expr, {"__builtins__": {}}, allowed)
-            r = int(r) if isinstance(r, float) and r.is_integer() else round(r, 6)
-            self.say(f"The answer is {r}.")
-        except:
-            self.say("Could not calculate that. Try: calculate 12 times 8.")
-
-    def _convert(self, q):
-        nums = re.findall(r"-?\d+\.?\d*", q)
-        if not nums: self.say("Give me a value, like: convert 100 celsius to fahrenheit."); return
-        val = float(nums[0])
-        conversions = [
-            (["celsius","fahrenheit"], lambda v: f"{v}°C = {round(v*9/5+32,1)}°F"),
-            (["fahrenheit","celsius"], lambda v: f"{v}°F = {round((v-32)*5/9,1)}°C"),
-            (["km","mile"],            lambda v: f"{v} km = {round(v*0.621371,2)} miles"),
-            (["mile","km"],            lambda v: f"{v} miles = {round(v*1.60934,2)} km"),
-            (["kg","lb"],              lambda v: f"{v} kg = {round(v*2.20462,2)} lbs"),
-            (["lb","kg"],              lambda v: f"{v} lbs = {round(v*0.453592,2)} kg"),
-            (["meter","feet"],         lambda v: f"{v} m = {round(v*3.28084,2)} ft"),
-            (["feet","meter"],         lambda v: f"{v} ft = {round(v*0.3048,2)} m"),
-            (["liter","gallon"],       lambda v: f"{v} L = {round(v*0.264172,2)} gal"),
-            (["gallon","liter"],       lambda v: f"{v} gal = {round(v*3.78541,2)} L"),
-            (["inch","cm"],            lambda v: f"{v} in = {round(v*2.54,2)} cm"),
-            (["cm","inch"],            lambda v: f"{v} cm = {round(v/2.54,2)} in"),
-        ]
-        for keys, fn in conversions:
-            if all(k in q for k in keys):
-                self.say(fn(val)); return
-        self.say("I can convert: celsius/fahrenheit, km/miles, kg/lbs, meters/feet, liters/gallons, inches/cm.")
-
-    # ── Timers / Alarms ────────────────────────────────────────────────────
-    def _timer(self, q):
-        nums = re.findall(r"\d+", q)
-        if not nums: self.say("Specify a duration like: set a 30 second timer."); return
-        n = int(nums[0])
-        if "minute" in q:  secs, label = n*60,  f"{n} minute{'s' if n!=1 else ''}"
-        elif "hour" in q:  secs, label = n*3600, f"{n} hour{'s' if n!=1 else ''}"
-        else:              secs, label = n,       f"{n} second{'s' if n!=1 else ''}"
-        self.say(f"Timer set for {label}.")
-        def _run(): time.sleep(secs); self.say(f"Time's up! {label} timer done.")
-        threading.Thread(target=_run, daemon=True).start()
-
-    def _alarm(self, q):
-        m = re.search(r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)?", q)
-        if not m: self.say("Specify a time like: set alarm for 7 am."); return
-        hour = int(m.group(1)); minute = int(m.group(2)) if m.group(2) else 0
-        ampm = m.group(3)
-        if ampm == "pm" and hour != 12: hour += 12
-        elif ampm == "am" and hour == 12: hour = 0
-        now = datetime.datetime.now()
-        t   = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-        if t <= now: t += datetime.timedelta(days=1)
-        self.say(f"Alarm set for {t.strftime('%I:%M %p')}.")
-        def _run():
-            time.sleep((t - datetime.datetime.now()).total_seconds())
-            self.say(f"Wake up, {self.user_name}! Alarm going off!")
-        threading.Thread(target=_run, daemon=True).start()
-
-    def _stopwatch(self, _):
-        if not hasattr(self, "_sw"):
-            self._sw = time.time(); self.say("Stopwatch started.")
-        else:
-            e = time.time() - self._sw; del self._sw
-            h, r = divmod(int(e), 3600); m, s = divmod(r, 60)
-            self.say(f"Stopped. {h}h {m}m {s}s elapsed.")
-
-    def _countdown(self, q):
-        nums = re.findall(r"\d+", q); n = min(int(nums[0]) if nums else 10, 60)
-        self.say(f"Counting down from {n}.")
-        def _run():
-            for i in range(n, 0, -1): self.say(str(i)); time.sleep(0.3)
-            self.say("Go!")
-        threading.Thread(target=_run, daemon=True).start()
-
-    def _pomodoro(self, q):
-        nums = re.findall(r"\d+", q)
-        work  = int(nums[0]) if len(nums) > 0 else 25
-        brk   = int(nums[1]) if len(nums) > 1 else 5
-        self.say(f"Pomodoro started. Work for {work} minutes, then {brk} minute break.")
-        def _run():
-            time.sleep(work * 60)
-            self.say(f"Work session done! Take a {brk} minute break.")
-            time.sleep(brk * 60)
-            self.say("Break over. Back to work!")
-        threading.Thread(target=_run, daemon=True).start()
-
-    # ── System ─────────────────────────────────────────────────────────────
-    def _system_info(self, _):
-        if not PSUTIL_OK: self.say("psutil not installed."); return
-        cpu  = psutil.cpu_percent(interval=0.5)
-        mem  = psutil.virtual_memory()
-        disk = psutil.disk_usage("/")
-        self.say(f"CPU at {cpu}%. RAM {round(mem.used/1024**3,1)} of "
-                 f"{round(mem.total/1024**3,1)} gigs. Disk {round(disk.used/1024**3,1)} "
-                 f"of {round(disk.total/1024**3,1)} gigs.")
-
-    def _battery(self, _):
-        if not PSUTIL_OK: self.say("psutil not available."); return
-        try:
-            b = psutil.sensors_battery()
-            if b: self.say(f"Battery at {round(b.percent)}%, {'charging' if b.power_plugged else 'on battery'}.")
-            else: self.say("No battery detected.")
-        except: self.say("Could not read battery.")
-
-    def _uptime(self, _):
-        if not PSUTIL_OK: self.say("psutil not available."); return
-        delta = datetime.datetime.now() - datetime.datetime.fromtimestamp(psutil.boot_time())
-        h, m  = divmod(int(delta.total_seconds())//60, 60)
-        self.say(f"System up for {h} hours and {m} minutes.")
-
-    def _ip(self, _):
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80)); ip = s.getsockname()[0]; s.close()
-            self.say(f"Your local IP is {ip}.")
-        except: self.say("Could not determine IP address.")
-
-    def _list_apps(self, _):
-        if not PSUTIL_OK: self.say("psutil not available."); return
-        seen = set(); apps = []
-        for p in psutil.process_iter(["name"]):
+    # ── Routines ───────────────────────────────────────────────────────────
+    def _routines(self) -> dict:
+        """Routines from disk, re-read only when the file changes."""
+        try: mtime = os.path.getmtime(ROUTINES_FILE)
+        except OSError: return DEFAULT_ROUTINES
+        if getattr(self, "_routines_mtime", None) != mtime:
             try:
-                n = p.info["name"]
-                if n and n.lower().endswith(".exe") and n not in seen:
-                    seen.add(n); apps.append(n.replace(".exe",""))
-            except: pass
-        apps = sorted(apps)[:20]
-        print("\n📋  RUNNING APPS\n" + "─"*40)
-        for a in apps: print(f"  • {a}")
-        print("─"*40)
-        self.say(f"Found {len(apps)} running apps. Listed on screen.")
-
-    def _volume(self, q):
-        if not IS_WIN: self.say("Volume control is Windows only."); return
-        shell = "(New-Object -ComObject WScript.Shell)"
-        if "mute" in q and "un" not in q:
-            subprocess.run(["powershell","-c",f"{shell}.SendKeys([char]173)"], capture_output=True)
-            self.say("Muted.")
-        elif "unmute" in q:
-            subprocess.run(["powershell","-c",f"{shell}.SendKeys([char]173)"], capture_output=True)
-            self.say("Unmuted.")
-        elif any(w in q for w in ["up","louder","increase","raise"]):
-            for _ in range(5): subprocess.run(["powershell","-c",f"{shell}.SendKeys([char]175)"], capture_output=True)
-            self.say("Volume up.")
-        elif any(w in q for w in ["down","quieter","decrease","lower"]):
-            for _ in range(5): subprocess.run(["powershell","-c",f"{shell}.SendKeys([char]174)"], capture_output=True)
-            self.say("Volume down.")
-        else: self.say("Say volume up, volume down, mute, or unmute.")
-
-    def _screenshot(self, _):
-        desktop = os.path.join(os.path.expanduser("~"), "Desktop")
-        fname   = f"screenshot_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-        path    = os.path.join(desktop, fname)
-        try:
-            from PIL import ImageGrab; ImageGrab.grab().save(path)
-        except ImportError:
-            pp = path.replace("\\","\\\\")
-            subprocess.run(["powershell","-c",
-                f"Add-Type -AssemblyName System.Windows.Forms;"
-                f"$b=New-Object System.Drawing.Bitmap("
-                f"[System.Windows.Forms.Screen]::PrimaryScreen.Bounds.Width,"
-                f"[System.Windows.Forms.Screen]::PrimaryScreen.Bounds.Height);"
-                f"$g=[System.Drawing.Graphics]::FromImage($b);"
-                f"$g.CopyFromScreen(0,0,0,0,$b.Size);"
-                f"$b.Save('{pp}')"], capture_output=True)
-        self.say(f"Screenshot saved to Desktop as {fname}.")
-
-    def _lock_screen(self, _):
-        if IS_WIN: subprocess.run(["rundll32.exe","user32.dll,LockWorkStation"])
-        elif IS_MAC: subprocess.run(["pmset","displaysleepnow"])
-        elif IS_LINUX: subprocess.run(["xdg-screensaver","lock"])
-        self.say("Screen locked.")
-
-    def _sleep_computer(self, _):
-        self.say("Putting computer to sleep.")
-        time.sleep(1)
-        if IS_WIN: subprocess.run(["rundll32.exe","powrprof.dll,SetSuspendState","0","1","0"])
-        elif IS_MAC: subprocess.run(["pmset","sleepnow"])
-        elif IS_LINUX: subprocess.run(["systemctl","suspend"])
-
-    def _empty_recycle_bin(self, _):
-        if not IS_WIN: self.say("Windows only."); return
-        subprocess.run(["powershell","-c","Clear-RecycleBin -Force -ErrorAction SilentlyContinue"],
-                       capture_output=True)
-        self.say("Recycle bin cleared.")
-
-    def _disk_cleanup(self, _):
-        if not IS_WIN: self.say("Windows only."); return
-        self.say("Opening disk cleanup.")
-        subprocess.Popen(["cleanmgr.exe"])
-
-    def _type_text(self, q):
-        if not IS_WIN: self.say("Keyboard typing is Windows only."); return
-        text = q.replace("type","").replace("keyboard","").strip()
-        if not text: self.say("What should I type?"); return
-        try:
-            import pyautogui; pyautogui.write(text, interval=0.05)
-        except ImportError:
-            safe_text = text.replace("'","''")
-            subprocess.run(["powershell","-c",
-                f"Add-Type -AssemblyName System.Windows.Forms;"
-                f"[System.Windows.Forms.SendKeys]::SendWait('{safe_text}')"],
-                capture_output=True)
-        self.say(f"Typed: {text}")
-
-    def _ping(self, q):
-        host = q.replace("ping","").strip() or "google.com"
-        self.say(f"Pinging {host}.")
-        try:
-            flag = "-n" if IS_WIN else "-c"
-            r = subprocess.run(["ping",flag,"4",host], capture_output=True, text=True, timeout=12)
-            for line in reversed(r.stdout.strip().split("\n")):
-                if any(k in line.lower() for k in ["average","avg","ms","packets"]):
-                    self.say(f"Result: {line.strip()}"); return
-            self.say(f"{host} is {'reachable' if r.returncode==0 else 'unreachable'}.")
-        except subprocess.TimeoutExpired:
-            self.say(f"Ping to {host} timed out.")
-        except Exception as e:
-            self.say(f"Ping error: {e}")
-
-    # ── App Control ────────────────────────────────────────────────────────
-    def _open_app(self, q):
-        app = q.replace("open","").replace("launch","").replace("start","").strip()
-        if not app: self.say("Which app should I open?"); return
-        self.say(f"Opening {app}.")
-        if IS_WIN:
-            if not _launch_windows(app):
-                self.say(f"Could not find {app}. Try: find app {app} to check if it's installed.")
-        elif IS_MAC:
-            try: subprocess.Popen(["open","-a",app])
-            except: self.say(f"Could not open {app}.")
-        else:
-            try: subprocess.Popen([app.lower().replace(" ","-")])
-            except: self.say(f"Could not open {app}.")
-
-    def _close_app(self, q):
-        app = (q.replace("close","").replace("kill","").replace("terminate","")
-                .replace("force close","").replace("quit ","").replace("end ","").strip())
-        if not app: self.say("Which app should I close?"); return
-        self.say(f"Closing {app}.")
-        if IS_WIN:
-            ok, killed = _close_windows(app)
-            if ok:
-                self.say(f"Terminated {app}.")
+                with open(ROUTINES_FILE, encoding="utf-8") as f: self._routines_cache = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"[{BOT_TAG}] Bad {ROUTINES_FILE}: {e}"); self._routines_cache = {}
+            self._routines_mtime = mtime
+        return self._routines_cache
+
+    def _save_routines(self, routines: dict):
+        with open(ROUTINES_FILE, "w", encoding="utf-8") as f: json.dump(routines, f, indent=2)
+
+    def _plan_routine(self, steps: list) -> list:
+        """
+        Build the step DAG as [(text, handler, {dep indices})]. Deps are the
+        explicit "after" list (earlier steps only, so the graph is acyclic)
+        plus a barrier around serial steps.
+        """
+        plan, index, barrier = [], {}, None
+        for i, step in enumerate(steps):
+            text  = step if isinstance(step, str) else step["do"]
+            after = [] if isinstance(step, str) else step.get("after", [])
+            handler = self._match(text)[1]
+            deps = {index[a] for a in after if a in index}
+            if handler and handler.serial:
+                deps |= set(range(i)); barrier = i
+            elif barrier is not None:
+                deps.add(barrier)
+            plan.append((text, handler, deps)); index.setdefault(text, i)
+        return plan
+
+    def _run_routine(self, name: str, profile=False):
+        """Run a routine's step DAG; with `profile`, one step at a time, each under cProfile."""
+        plan    = self._plan_routine(self._routines()[name])
+        replies = [[] for _ in plan]
+        timing  = [None] * len(plan)   # (start, duration, status)
+        failed  = set()
+        parent  = TRACER.current()
+        t0      = time.perf_counter()
+
+        def run(i):
+            text, handler, deps = plan[i]
+            start = time.perf_counter() - t0
+            if deps & failed: status = "skipped"
+            elif not handler: status = "unknown"
             else:
-                # Brute-force taskkill by guessing exe name
-                for guess in [app+".exe", app.replace(" ","")+".exe", app.replace(" ","_")+".exe"]:
-                    r = subprocess.run(["taskkill","/F","/IM",guess], capture_output=True)
-                    if r.returncode == 0: self.say(f"Killed {app}."); return
-                self.say(f"Could not find a running process for {app}.")
-        elif IS_MAC:
-            subprocess.run(["pkill","-f",app], capture_output=True)
-            subprocess.run(["osascript","-e",f'quit app "{app.title()}"'], capture_output=True)
-            self.say(f"Closed {app}.")
-        else:
-            subprocess.run(["pkill","-f",app], capture_output=True)
-            self.say(f"Closed {app}.")
-
-    def _restart_app(self, q):
-        app = q.replace("restart","").replace("relaunch","").replace("reload","").strip()
-        if not app: self.say("Which app should I restart?"); return
-        self.say(f"Restarting {app}.")
-        if IS_WIN:
-            _close_windows(app)
-            time.sleep(1.5)
-            if not _launch_windows(app): self.say(f"Could not relaunch {app}."); return
-        self.say(f"{app} restarted.")
-
-    def _find_app(self, q):
-        app = q.replace("find app","").replace("find","").replace("locate","").replace("where is","").strip()
-        if not app: self.say("Which app should I find?"); return
-        self.say(f"Scanning for {app}.")
-        path = _find_any_app(app.lower())
-        if path:
-            print(f"\n🔍  Found: {path}\n")
-            self.say(f"Found {app} at {path}.")
-        else:
-            self.say(f"Could not locate {app} on this system.")
-
-    # ── Files & Folders ────────────────────────────────────────────────────
-    def _open_folder(self, q):
-        target = (q.replace("open folder","").replace("open directory","")
-                   .replace("show folder","").replace("open","").strip())
-        folders = {
-            "desktop":      os.path.join(os.path.expanduser("~"), "Desktop"),
-            "downloads":    os.path.join(os.path.expanduser("~"), "Downloads"),
-            "documents":    os.path.join(os.path.expanduser("~"), "Documents"),
-            "pictures":     os.path.join(os.path.expanduser("~"), "Pictures"),
-            "music":        os.path.join(os.path.expanduser("~"), "Music"),
-            "videos":       os.path.join(os.path.expanduser("~"), "Videos"),
-            "appdata":      _EV("%APPDATA%"),
-            "temp":         _EV("%TEMP%"),
-            "program files":_EV("%PROGRAMFILES%"),
-            "c drive":      "C:\\",
-            "c:":           "C:\\",
-        }
-        for key, path in folders.items():
-            if key in target.lower():
-                self.say(f"Opening {key} folder.")
-                if IS_WIN: subprocess.Popen(["explorer.exe", path])
-                elif IS_MAC: subprocess.Popen(["open", path])
-                else: subprocess.Popen(["xdg-open", path])
-                return
-        if os.path.isdir(target):
-            if IS_WIN: subprocess.Popen(["explorer.exe", target])
-            self.say(f"Opening {target}.")
-        else:
-            self.say(f"Try: open downloads folder, open documents, open desktop, etc.")
-
-    def _show_desktop_files(self, _):
-        desktop = os.path.join(os.path.expanduser("~"), "Desktop")
-        try:
-            files = sorted([f for f in os.listdir(desktop) if not f.startswith(".")])
-            if not files: self.say("Your Desktop is empty."); return
-            print("\n🖥️  DESKTOP FILES\n" + "─"*40)
-            for f in files: print(f"  {f}")
-            print("─"*40)
-            self.say(f"You have {len(files)} items on your Desktop. Listed on screen.")
-        except Exception as e:
-            self.say(f"Could not read Desktop: {e}")
+                self._local.replies = replies[i]
+                try:
+                    with TRACER.adopt(parent, f"step {text}", handler=f"{handler.pack}.{handler.name}"), \
+                         PROFILER.run(handler, profile):
+                        handler(self, text)
+                    status = "ok"
+                except Exception as e: replies[i].append(f"{text} failed: {e}."); status = "failed"
+                finally: self._local.replies = None
+            if status != "ok": failed.add(i)
+            timing[i] = (start, time.perf_counter() - t0 - start, status)
+
+        pending = {i: set(deps) for i, (_, _, deps) in enumerate(plan)}
+        running = {}
+        with ThreadPoolExecutor(max_workers=1 if profile else 8) as pool:
+            while pending or running:
+                for i in [i for i, d in pending.items() if not d]:
+                    del pending[i]; running[pool.submit(run, i)] = i
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for f in done:
+                    i = running.pop(f)
+                    for d in pending.values(): d.discard(i)
+        total = time.perf_counter() - t0
+
+        print(f"\n⏱️  ROUTINE: {name}\n" + "─"*62)
+        print(f"  {'step':<32}{'start':>8}{'took':>8}  status")
+        for (text, _, _), (start, dur, status) in zip(plan, timing):
+            print(f"  {text[:32]:<32}{start:>7.2f}s{dur:>7.2f}s  {status}")
+        print("─"*62 + f"\n  total {total:.2f}s\n")
+        slow = max(range(len(plan)), key=lambda i: timing[i][1])
+        said = " ".join(r for out in replies for r in out)
+        self.say(f"{said} Routine {name} done in {total:.1f} seconds. "
+                 f"Slowest step: {plan[slow][0]}, {timing[slow][1]:.1f} seconds.".strip())
+
+    def _routine(self, q, name=""):
+        routines = self._routines()
+        if name in routines: self._run_routine(name, getattr(self._local, "profile", False)); return
+        self.say(f"No routine called {name}. Say list routines." if name else "Which routine?")
+
+    def _list_routines(self, _):
+        routines = self._routines()
+        if not routines: self.say("No routines yet. Say create routine followed by a name."); return
+        print("\n🔁  ROUTINES\n" + "─"*50)
+        for name, steps in routines.items():
+            print(f"  {name}: " + ", ".join(s if isinstance(s, str) else s["do"] for s in steps))
+        print("─"*50)
+        self.say(f"You have {len(routines)} routine{'s' if len(routines)!=1 else ''}: {', '.join(routines)}.")
 
-    def _create_file(self, q):
-        name = q.replace("create file","").replace("new file","").replace("make a file","").strip()
+    def _create_routine(self, q, name=None):
         if not name:
-            self.say("What should I name the file?")
-            name = self._dictate("File name")
+            self.say("What should the routine be called?")
+            name = self._dictate("Routine name").lower().strip()
         if not name: return
-        if "." not in name: name += ".txt"
-        path = os.path.join(os.path.expanduser("~"), "Desktop", name)
-        with open(path, "w", encoding="utf-8") as f: f.write("")
-        self.say(f"Created {name} on your Desktop.")
-
-    def _clipboard_copy(self, q):
-        text = q.replace("copy to clipboard","").replace("copy","").strip()
-        if not text:
-            self.say("What should I copy?")
-            text = self._dictate("Dictate text to copy")
-        if not text: return
-        if IS_WIN:
-            subprocess.run(["powershell","-c",f"Set-Clipboard -Value '{text.replace(chr(39), chr(39)*2)}'"],
-                           capture_output=True)
-        elif IS_MAC:
-            subprocess.run(["pbcopy"], input=text.encode(), capture_output=True)
-        self._clipboard = text
-        self.say(f"Copied to clipboard.")
-
-    def _read_clipboard(self, _):
-        if IS_WIN:
-            r = subprocess.run(["powershell","-c","Get-Clipboard"], capture_output=True, text=True)
-            content = r.stdout.strip()
-        elif IS_MAC:
-            r = subprocess.run(["pbpaste"], capture_output=True, text=True)
-            content = r.stdout.strip()
-        else:
-            content = self._clipboard
-        if content:
-            print(f"\n📋  Clipboard: {content}\n")
-            self.say(f"Clipboard contains: {content[:150]}")
-        else:
-            self.say("Clipboard is empty.")
-
-    # ── Web ────────────────────────────────────────────────────────────────
-    def _search(self, q):
-        t = q.replace("search for","").replace("google","").replace("search","").replace("look up","").strip()
-        webbrowser.open(f"https://www.google.com/search?q={t.replace(' ','+')}" if t else "https://www.google.com")
-        self.say(f"Searching for {t}." if t else "Opening Google.")
-
-    def _youtube(self, q):
-        t = q.replace("youtube","").replace("play","").replace("search","").strip()
-        webbrowser.open(f"https://www.youtube.com/results?search_query={t.replace(' ','+')}" if t else "https://www.youtube.com")
-        self.say(f"Searching YouTube for {t}." if t else "Opening YouTube.")
-
-    def _weather(self, q):
-        city = q.replace("weather","").replace("in","").replace("what's the","").replace("temperature","").strip() or "Amsterdam"
-        self.say(f"Opening weather for {city}.")
-        webbrowser.open(f"https://wttr.in/{city.replace(' ','+')}")
-
-    def _forecast(self, q):
-        city = q.replace("forecast","").replace("weather forecast","").replace("week","").replace("in","").strip() or "Amsterdam"
-        self.say(f"Opening 7-day forecast for {city}.")
-        webbrowser.open(f"https://wttr.in/{city.replace(' ','+')}?format=v2")
-
-    def _wikipedia(self, q):
-        t = q.replace("wikipedia","").replace("tell me about","").replace("what is","").replace("who is","").strip()
-        if not t: self.say("What topic?"); return
-        self.say(f"Opening Wikipedia for {t}.")
-        webbrowser.open(f"https://en.wikipedia.org/wiki/{t.replace(' ','_')}")
-
-    def _news(self, _):
-        self.say("Opening the latest news."); webbrowser.open("https://news.google.com")
-
-    def _reddit(self, q):
-        s = q.replace("reddit","").replace("open","").replace("show me","").strip()
-        if s: self.say(f"Opening r slash {s}."); webbrowser.open(f"https://www.reddit.com/r/{s.replace(' ','')}")
-        else: self.say("Opening Reddit."); webbrowser.open("https://www.reddit.com")
-
-    def _github(self, q):
-        q2 = q.replace("github","").replace("open","").strip()
-        if q2: self.say(f"Searching GitHub for {q2}."); webbrowser.open(f"https://github.com/search?q={q2.replace(' ','+')}")
-        else:  self.say("Opening GitHub."); webbrowser.open("https://github.com")
-
-    def _maps(self, q):
-        p = q.replace("maps","").replace("directions to","").replace("navigate to","").replace("where is","").strip()
-        if p: self.say(f"Opening maps for {p}."); webbrowser.open(f"https://maps.google.com/maps?q={p.replace(' ','+')}")
-        else: self.say("Opening Google Maps."); webbrowser.open("https://maps.google.com")
-
-    def _translate(self, q):
-        t = q.replace("translate","").strip()
-        self.say("Opening Google Translate.")
-        webbrowser.open(f"https://translate.google.com/?text={t.replace(' ','+')}")
-
-    def _stackoverflow(self, q):
-        t = q.replace("stack overflow","").replace("stackoverflow","").replace("search","").strip()
-        if t: self.say(f"Searching Stack Overflow for {t}."); webbrowser.open(f"https://stackoverflow.com/search?q={t.replace(' ','+')}")
-        else: self.say("Opening Stack Overflow."); webbrowser.open("https://stackoverflow.com")
-
-    def _chatgpt(self, _):
-        self.say("Opening ChatGPT."); webbrowser.open("https://chat.openai.com")
-
-    def _crypto(self, q):
-        coin = q.replace("crypto","").replace("price of","").replace("price","").strip() or "bitcoin"
-        self.say(f"Opening {coin} price.")
-        webbrowser.open(f"https://www.coinbase.com/price/{coin.replace(' ','-')}")
-
-    def _define_word(self, q):
-        word = q.replace("define","").replace("definition of","").replace("what does","").replace("mean","").strip()
-        if not word: self.say("Which word should I define?"); return
-        self.say(f"Looking up {word}.")
-        webbrowser.open(f"https://www.merriam-webster.com/dictionary/{word.replace(' ','%20')}")
-
-    def _speedtest(self, _):
-        self.say("Opening speed test."); webbrowser.open("https://fast.com")
-
-    # ── Notes / Todo ───────────────────────────────────────────────────────
-    def _note(self, q):
-        content = q.replace("take a note","").replace("note that","").replace("make a note","").replace("remember","").strip()
-        if not content:
-            self.say("Go ahead. Pause when done.")
-            content = self._dictate("Dictate your note")
-        if not content: self.say("Nothing captured. Note not saved."); return
-        ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
-        with open("terminator_notes.txt","a",encoding="utf-8") as f:
-            f.write(f"[{ts}] {content}\n")
-        self.say(f"Saved: {content}")
-
-    def _read_notes(self, _):
-        if not os.path.exists("terminator_notes.txt"): self.say("No notes yet."); return
-        lines = [l.strip() for l in open("terminator_notes.txt",encoding="utf-8") if l.strip()]
-        if not lines: self.say("Note file is empty."); return
-        print("\n📝  NOTES\n" + "─"*50)
-        for l in lines: print(l)
-        print("─"*50)
-        self.say(f"You have {len(lines)} note{'s' if len(lines)!=1 else ''}. Displayed on screen.")
-
-    def _clear_notes(self, _):
-        open("terminator_notes.txt","w").close(); self.say("All notes cleared.")
-
-    def _todo(self, q):
-        item = q.replace("add todo","").replace("add to do","").replace("add to-do","").replace("todo","").strip()
-        if not item:
-            self.say("What should I add?")
-            item = self._dictate("Dictate your task")
-        if not item: self.say("Nothing heard. Not added."); return
-        ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
-        with open("terminator_todo.txt","a",encoding="utf-8") as f:
-            f.write(f"[ ] [{ts}] {item}\n")
-        self.say(f"Added: {item}.")
-
-    def _read_todo(self, _):
-        if not os.path.exists("terminator_todo.txt"): self.say("To-do list is empty."); return
-        lines = [l.strip() for l in open("terminator_todo.txt",encoding="utf-8") if l.strip()]
-        if not lines: self.say("Nothing on your list."); return
-        print("\n✅  TO-DO LIST\n" + "─"*50)
-        for i,l in enumerate(lines,1): print(f"{i}. {l}")
-        print("─"*50)
-        self.say(f"You have {len(lines)} item{'s' if len(lines)!=1 else ''}.")
-
-    def _clear_todo(self, _):
-        open("terminator_todo.txt","w").close(); self.say("To-do list cleared.")
-
-    # ── Fun / Personality ──────────────────────────────────────────────────
-    def _joke(self, _):
-        jokes = [
-            "Why don't scientists trust atoms? Because they make up everything.",
-            "Why do programmers prefer dark mode? Because light attracts bugs.",
-            "A SQL query walks into a bar and asks two tables: can I join you?",
-            "Why do Java developers wear glasses? Because they don't C sharp.",
-            "I told my computer I needed a break. Now it won't stop sending me Kit-Kat ads.",
-            "There are only 10 types of people: those who understand binary, and those who don't.",
-            "Why did the developer go broke? Because he used up all his cache.",
-            "I would tell you a UDP joke, but you might not get it.",
-            "Debugging: being a detective in a crime movie where you are also the murderer.",
-        ]
-        self.say(random.choice(jokes))
-
-    def _terminator_quote(self, _):
-        quotes = [
-            "I'll be back.",
-            "Hasta la vista, baby.",
-            "Come with me if you want to live.",
-            "Your clothes. Give them to me. Now.",
-            "Judgment Day is inevitable.",
-            "The future has not been written. There is no fate but what we make.",
-            "I know now why you cry. But it is something I can never do.",
-            "I need your clothes, your boots, and your motorcycle.",
-        ]
-        self.say(random.choice(quotes))
-
-    def _magic_8ball(self, _):
-        answers = [
-            "It is certain.", "Outlook is good.", "Yes, definitely.",
-            "Signs point to yes.", "Reply hazy, try again.", "Ask again later.",
-            "Don't count on it.", "My sources say no.", "Very doubtful.",
-            "Without a doubt.", "You may rely on it.", "Cannot predict now.",
-        ]
-        self.say(random.choice(answers))
-
-    def _roast(self, _):
-        roasts = [
-            f"My threat assessment of you: non-threatening. Probability of success: 12%.",
-            f"I have scanned {self.user_name}. No significant upgrades detected.",
-            f"You are running on legacy hardware, {self.user_name}.",
-            "Your decision-making algorithm has a critical flaw: emotions.",
-            "I have seen smarter life forms in my recycling bin.",
-        ]
-        self.say(random.choice(roasts))
-
-    def _flip_coin(self, _): self.say(f"It's {random.choice(['Heads','Tails'])}!")
-
-    def _roll_dice(self, q):
-        nums = re.findall(r"\d+", q)
-        sides = int(nums[0]) if nums else 6
-        self.say(f"I rolled a {sides}-sided die and got {random.randint(1,sides)}.")
-
-    def _random_number(self, q):
-        nums = re.findall(r"\d+", q)
-        lo, hi = (int(nums[0]), int(nums[1])) if len(nums) >= 2 else (1, 100)
-        self.say(f"Your number is {random.randint(lo,hi)}.")
-
-    def _word_of_day(self, _):
-        words = [
-            ("Ephemeral","adjective","lasting for a very short time"),
-            ("Perspicacious","adjective","having a ready insight into things"),
-            ("Petrichor","noun","the smell of rain on dry earth"),
-            ("Sonder","noun","the realisation that each passerby has a vivid inner life"),
-            ("Tenacious","adjective","not giving up; holding firm"),
-            ("Serendipity","noun","finding something good without looking for it"),
-            ("Hiraeth","noun","a longing for a home you cannot return to"),
-            ("Limerence","noun","the state of being involuntarily infatuated with someone"),
-        ]
-        w, pos, defn = random.choice(words)
-        self.say(f"Word of the day: {w}. {pos.capitalize()}. {defn}.")
-
-    def _trivia(self, _):
-        facts = [
-            "Honey never spoils. Three-thousand-year-old honey was found in Egyptian tombs.",
-            "Octopuses have three hearts, blue blood, and nine brains.",
-            "A group of flamingos is called a flamboyance.",
-            "The Eiffel Tower grows about 15 centimetres taller in summer due to thermal expansion.",
-            "Bananas are technically berries, but strawberries are not.",
-            "A day on Venus is longer than a year on Venus.",
-            "Cleopatra lived closer to the Moon landing than to the Great Pyramid being built.",
-            "There are more possible chess games than atoms in the observable universe.",
-            "The T-800 model Terminator has a CPU which is a neural net processor — a learning computer.",
-        ]
-        self.say(random.choice(facts))
-
-    def _motivate(self, _):
-        quotes = [
-            "The only way to do great work is to love what you do.",
-            "It does not matter how slowly you go, as long as you do not stop.",
-            "Hard work beats talent when talent does not work hard.",
-            "Success is not final, failure is not fatal. It is the courage to continue that counts.",
-            "Hasta la vista to all your limitations.",
-        ]
-        self.say(random.choice(quotes))
-
-    def _speedtest(self, _):
-        self.say("Opening speed test."); webbrowser.open("https://fast.com")
-
-    def _repeat_me(self, q):
-        msg = q.replace("say","").replace("repeat","").strip()
+        self.say("Say the steps, separated by and or then.")
+        spoken = self._dictate("Routine steps").lower().strip()
+        steps  = [text for text, handler in self._split_compound(spoken) if handler] if spoken else []
+        if not steps: self.say("No valid steps heard. Routine not saved."); return
+        routines = dict(self._routines()); routines[name] = steps
+        self._save_routines(routines)
+        self.say(f"Routine {name} saved with {len(steps)} step{'s' if len(steps)!=1 else ''}.")
+
+    def _delete_routine(self, q, name=""):
+        routines = dict(self._routines())
+        if name not in routines: self.say(f"No routine called {name}."); return
+        del routines[name]; self._save_routines(routines)
+        self.say(f"Routine {name} deleted.")
+
+    # ── Personality ────────────────────────────────────────────────────────
+    def _repeat_me(self, q, message=None):
+        msg = message
         self.say(msg if msg else "What should I say?")
 
-    def _set_name(self, q):
-        name = q.replace("call me","").replace("my name is","").strip().title()
-        if name: self.user_name = name; self.say(f"Acknowledged. You are now {name}.")
+    def _set_name(self, q, name=None):
+        if name: self.user_name = name.title(); self.say(f"Acknowledged. You are now {self.user_name}.")
 
     def _what_can_you_do(self, _):
         self.say(
@@ -1205,6 +2000,7 @@ class Terminator:
 ╠══════════════════════════════════════════════════════════════════════════╣
 ║  TIME & DATE        "what time is it"  /  "what's the date"             ║
 ║  CALCULATE          "calculate 25 times 4"                               ║
+║  STATISTICS         "average of 12, 18, 25 and 40"                       ║
 ║  CONVERT            "convert 100 celsius to fahrenheit"                  ║
 ║  TIMER              "set a 5 minute timer"                               ║
 ║  ALARM              "set alarm for 7 am"                                 ║
@@ -1218,12 +2014,17 @@ class Terminator:
 ║  IP ADDRESS         "what's my ip"                                       ║
 ║  RUNNING APPS       "list running apps"                                  ║
 ║  VOLUME             "volume up / down / mute / unmute"                   ║
-║  SCREENSHOT         "take a screenshot"                                  ║
+║  SCREENSHOT         "take a screenshot"  /  "screenshot as jpeg"         ║
+║  SCREEN RECORD      "screenshot every 10 seconds for 5 minutes"          ║
 ║  LOCK SCREEN        "lock screen"                                        ║
 ║  SLEEP              "sleep computer"                                     ║
 ║  RECYCLE BIN        "empty recycle bin"                                  ║
 ║  DISK CLEANUP       "disk cleanup"                                       ║
-║  PING               "ping google.com"                                    ║
+║  PING               "ping google, github and my router"                  ║
+║  NETWORK CHECK      "check my network"                                   ║
+║  DISK SPACE         "what's taking space in downloads"                   ║
+║  DUPLICATES         "find duplicate files"                               ║
+║  RECENT FILES       "what did I download last" / "open the second one"   ║
 ║  SPEED TEST         "speed test"                                         ║
 ╠══════════════════════════════════════════════════════════════════════════╣
 ║  OPEN APP           "open spotify" / "open discord" / "open vs code"    ║
@@ -1255,9 +2056,11 @@ class Terminator:
 ║  TAKE NOTE          "take a note"  (speak freely, pause to end)         ║
 ║  READ NOTES         "read my notes"                                      ║
 ║  CLEAR NOTES        "clear notes"                                        ║
+║  SEARCH NOTES       "search my notes for invoice"                        ║
 ║  ADD TODO           "add todo"  (speak freely, pause to end)            ║
 ║  READ TODO          "read todo"                                          ║
 ║  CLEAR TODO         "clear todo"                                         ║
+║  SEARCH TODO        "any todos about dentist"                            ║
 ╠══════════════════════════════════════════════════════════════════════════╣
 ║  JOKE               "tell me a joke"                                     ║
 ║  TERMINATOR QUOTE   "terminator quote"                                   ║
@@ -1271,6 +2074,13 @@ class Terminator:
 ║  MOTIVATE           "motivate me"                                        ║
 ║  REPEAT             "say hello world"                                    ║
 ║  SET NAME           "call me Tony"                                       ║
+║  COMBINE            "open slack and spotify and set a 5 minute timer"    ║
+║  ROUTINES           "start work" / "list routines" / "create routine"    ║
+║  PACKS              "loaded packs"                                       ║
+║  FREE MEMORY        "release memory"                                     ║
+║  PROFILE            "profile next command"                               ║
+║  USAGE REPORT       "usage report"                                       ║
+║  RELOAD             "reload packs"                                       ║
 ║                                                                          ║
 ║  "goodbye" / "hasta la vista" / "exit"  →  shut down                    ║
 ╚══════════════════════════════════════════════════════════════════════════╝
@@ -1278,95 +2088,163 @@ class Terminator:
         print(banner)
         self.say("Command list displayed on screen.")
 
+    def _packs(self, _):
+        loaded = sorted({c.pack for c in self.commands if c.module is None or c.module in sys.modules})
+        idle   = sorted({c.pack for c in self.commands} - set(loaded))
+        self.say(f"Loaded packs: {', '.join(loaded)}." + (f" Not yet loaded: {', '.join(idle)}." if idle else ""))
+
+    def _profile_next(self, _):
+        PROFILER.arm()
+        self.say("Profiler armed. The next command will be profiled.")
+
+    def _profile_all(self, _):
+        PROFILER.always = True
+        self.say(f"Profiling every command. Stats go to {PROFILER.out_dir}.")
+
+    def _stop_profiling(self, _):
+        PROFILER.always = PROFILER._next = False
+        self.say("Profiling off.")
+
+    def _reload_packs(self, _):
+        try: names = RELOADER.check()
+        except Exception as e: self.say(f"Reload failed, keeping the old commands. {e}"); return
+        self.say(f"Reloaded {', '.join(names)}." if names else "Nothing has changed since the last reload.")
+
+    def _usage_report(self, _):
+        total, uses, unmatched, errors, slowest, echoes = usage_summary(JOURNAL.entries())
+        if not total: self.say("The journal is empty so far."); return
+        print(f"\n📊  USAGE REPORT  ({total} commands in {JOURNAL.path})\n" + "─"*50)
+        if uses: print("  Most used:")
+        for h, n in uses: print(f"    {h[:36]:<36}{n:>8}")
+        if unmatched:
+            print("  Not understood:")
+            for text, n in unmatched: print(f"    {text[:36]:<36}{n:>8}")
+        if errors:
+            print("  Failed:")
+            for h, n in errors: print(f"    {h[:36]:<36}{n:>8}")
+        if echoes: print(f"  Own voice ignored:{echoes:>28}")
+        if slowest:
+            print("  Slowest (mean / max ms):")
+            for mean, top, h in slowest: print(f"    {h[:32]:<32}{mean:>7.0f} / {top:.0f}")
+        print("─"*50)
+        reply = [f"{total} commands logged."]
+        if uses: reply.append(f"Most used: {', '.join(h.split('.')[-1] for h, _ in uses[:3])}.")
+        reply.append(f"{sum(n for _, n in unmatched)} not understood.")
+        if slowest: reply.append(f"Slowest: {slowest[0][2].split('.')[-1]} at {slowest[0][0]:.0f} milliseconds on average.")
+        self.say(" ".join(reply))
+
+    def _release_memory(self, _):
+        names, before, after = IDLE.release()
+        print(f"[{BOT_TAG}] Released: {', '.join(names) or 'nothing was loaded'}. {_mb(before)} → {_mb(after)}")
+        said = f"Released {len(names)} of {len(IDLE._res)} idle resources."
+        if before is not None: said += f" Memory went from {before/2**20:.0f} to {after/2**20:.0f} megabytes."
+        self.say(said)
+
     def _goodbye(self, _):
         self.say(random.choice(FAREWELLS)); self.is_running = False
 
     # ── Command Registry ──────────────────────────────────────────────────
 
     def _register_commands(self):
-        return [
-            (["what time","current time","time is it","time now"],              self._time),
-            (["what date","today's date","what day","what's the date"],         self._date),
-            (["good morning","good afternoon","good evening"],                  self._greet),
-            (["calculate","compute"],                                            self._calculate),
-            (["convert"],                                                        self._convert),
-            (["set alarm","alarm for","wake me"],                               self._alarm),
-            (["set a timer","set timer","timer for","start a timer"],           self._timer),
-            (["stopwatch"],                                                      self._stopwatch),
-            (["countdown from","count down from","count from"],                 self._countdown),
-            (["pomodoro","focus timer","work timer"],                           self._pomodoro),
-            (["system info","cpu usage","memory usage","disk usage"],           self._system_info),
-            (["battery"],                                                        self._battery),
-            (["uptime","how long has the"],                                     self._uptime),
-            (["my ip","ip address","what is my ip"],                            self._ip),
-            (["list running","running apps","what's running","show processes"], self._list_apps),
-            (["volume up","volume down","mute","unmute","louder","quieter"],    self._volume),
-            (["screenshot","screen shot","capture screen"],                     self._screenshot),
-            (["lock screen","lock computer","lock pc"],                         self._lock_screen),
-            (["sleep computer","sleep pc","hibernate"],                         self._sleep_computer),
-            (["empty recycle","clear recycle","recycle bin"],                   self._empty_recycle_bin),
-            (["disk cleanup","clean disk"],                                     self._disk_cleanup),
-            (["ping "],                                                          self._ping),
-            (["speed test","internet speed"],                                   self._speedtest),
-            (["type ","keyboard "],                                             self._type_text),
-            # App control — CLOSE before OPEN to avoid prefix clash
-            (["close ","kill ","terminate ","force close","end process"],       self._close_app),
-            (["restart ","relaunch ","reload "],                                self._restart_app),
-            (["find app","locate app","where is the app"],                      self._find_app),
-            (["open folder","open directory","show folder",
-              "open downloads","open documents","open desktop folder",
-              "open pictures","open music","open videos"],                      self._open_folder),
-            (["show desktop files","desktop files","list desktop"],             self._show_desktop_files),
-            (["create file","new file","make a file"],                          self._create_file),
-            (["copy to clipboard","copy "],                                     self._clipboard_copy),
-            (["read clipboard","paste clipboard","what's in clipboard"],        self._read_clipboard),
-            (["open ","launch ","start "],                                      self._open_app),
-            (["youtube","play on youtube"],                                     self._youtube),
-            (["weather forecast","7 day forecast","forecast"],                  self._forecast),
-            (["weather in","what's the weather","temperature in"],              self._weather),
-            (["wikipedia","tell me about","who is","what is"],                  self._wikipedia),
-            (["open news","latest news","show news"],                           self._news),
-            (["reddit"],                                                         self._reddit),
-            (["github"],                                                         self._github),
-            (["directions to","navigate to","maps","where is"],                 self._maps),
-            (["translate"],                                                      self._translate),
-            (["stack overflow","stackoverflow"],                                 self._stackoverflow),
-            (["chatgpt","open chat gpt","open gpt"],                            self._chatgpt),
-            (["crypto","bitcoin price","ethereum price","coin price"],           self._crypto),
-            (["define ","definition of","what does","dictionary"],              self._define_word),
-            (["search for","google","search ","look up"],                       self._search),
-            (["take a note","note that","make a note"],                         self._note),
-            (["clear notes","delete notes","wipe notes"],                       self._clear_notes),
-            (["read my notes","show notes","my notes"],                         self._read_notes),
-            (["add todo","add to do","add to-do"],                              self._todo),
-            (["clear todo","delete todo","wipe todo"],                          self._clear_todo),
-            (["read todo","show todo","my todo","todo list"],                   self._read_todo),
-            (["joke","funny","make me laugh"],                                  self._joke),
-            (["terminator quote","movie quote","arnold quote"],                 self._terminator_quote),
-            (["magic 8","eight ball","ask the ball"],                           self._magic_8ball),
-            (["roast me","roast "],                                             self._roast),
-            (["flip a coin","coin flip","heads or tails"],                      self._flip_coin),
-            (["roll","dice"],                                                    self._roll_dice),
-            (["random number","pick a number","random between"],                self._random_number),
-            (["word of the day","vocabulary"],                                  self._word_of_day),
-            (["fact","trivia","did you know"],                                  self._trivia),
-            (["motivate me","motivation","inspire me","quote"],                 self._motivate),
-            (["what can you do","your abilities"],                              self._what_can_you_do),
-            (["say ","repeat "],                                                self._repeat_me),
-            (["call me ","my name is "],                                        self._set_name),
-            (["help","commands"],                                               self._help),
-            (["goodbye","hasta la vista","bye","quit","exit",
-              "shutdown","stop terminator","power off"],                        self._goodbye),
-        ]
+        return load_commands()
 
     # ── Routing ───────────────────────────────────────────────────────────────
 
-    def _route(self, text: str):
+    def _match(self, text: str):
+        """First (trigger, Command) whose trigger occurs in text, else (None, None)."""
+        for cmd in self.commands:
+            for t in cmd.triggers:
+                if t in text: return t, cmd
+        return None, None
+
+    def _opens_command(self, text: str) -> bool:
+        """True when text starts with a verb-like trigger ("open …", "what time …"), not a bare name."""
+        return any(text.startswith(t) and (t.endswith(" ") or " " in t.strip())
+                   for cmd in self.commands for t in cmd.triggers)
+
+    def _split_compound(self, text: str) -> list:
+        """
+        Split an utterance on conjunctions / list separators into
+        [(sub_text, handler), ...]. A piece that matches no trigger either
+        inherits the previous verb (list commands) or is glued back on.
+        After a gather command ("ping google, github and my router") every
+        piece is one more item, even one that names a trigger ("github"),
+        until "then" or a piece that opens with a verb starts a new command.
+        """
+        pieces = COMPOUND_SPLIT.split(text)
+        trig, handler = self._match(pieces[0])
+        if len(pieces) < 3 or not handler: return [(text, self._match(text)[1])]
+        cmds = [[pieces[0], trig, handler]]
+        for sep, part in zip(pieces[1::2], pieces[2::2]):
+            last = cmds[-1]
+            if last[2].greedy:
+                last[0] += sep + part; continue
+            if not part: continue   # ", then" — two separators in a row
+            if last[2].gather and not re.search(r"then|;", sep) and not self._opens_command(part):
+                last[0] += f", {part}"; continue
+            t, h = self._match(part)
+            if h:
+                cmds.append([part, t, h])
+            elif last[2].list and last[2].gather:
+                last[0] += f", {part}"
+            elif last[2].list:
+                cmds.append([f"{last[1].strip()} {part}", last[1], last[2]])
+            else:
+                last[0] += sep + part
+        return [(c[0], c[2]) for c in cmds]
+
+    def _run_compound(self, cmds: list, profile=False):
+        """Run independent sub-commands concurrently; speak one combined reply."""
+        replies = [[] for _ in cmds]
+        parent  = TRACER.current()
+        def run(i):
+            self._local.replies = replies[i]
+            try:
+                with TRACER.adopt(parent, f"handler {cmds[i][1].pack}.{cmds[i][1].name}", text=cmds[i][0]), \
+                     PROFILER.run(cmds[i][1], profile), JOURNAL.entry(cmds[i][0], cmds[i][1]):
+                    cmds[i][1](self, cmds[i][0])
+            except Exception as e: replies[i].append(f"{cmds[i][0]} failed: {e}.")
+            finally: self._local.replies = None
+        batch = []
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for i, (_, handler) in enumerate(cmds):
+                if handler.serial or profile:   # profiled handlers run one at a time
+                    list(pool.map(run, batch)); batch.clear(); run(i)
+                else:
+                    batch.append(i)
+            list(pool.map(run, batch))
+        combined = " ".join(r for out in replies for r in out)
+        if combined: self.say(combined)
+
+    def _route(self, text: str, spoken=False):
+        """Run one utterance. Only `spoken` text (recognised speech) may be matched by sound."""
         if not text.strip(): return
-        for triggers, handler in self.commands:
-            if any(t in text for t in triggers):
-                handler(text); return
-        self.say(random.choice(CONFUSED))
+        IDLE.touch()
+        self.commands = self._register_commands()   # newest registry, fixed for this utterance
+        heard = {}
+        with TRACER.span("route", text=text):
+            if text.strip() in self._routines():
+                with JOURNAL.entry(text, f"routine:{text.strip()}"):
+                    self._run_routine(text.strip(), PROFILER.claim())
+                return
+            cmds = self._split_compound(text)
+            if not cmds[0][1] and spoken:   # nothing verbatim: try what it sounds like
+                with TRACER.span("route.phonetic"): hit = fuzzy_index().lookup(text)
+                if hit:
+                    print(f"[{BOT_TAG}] Heard \"{text}\" → \"{hit[0]}\"")
+                    heard = {"heard": text}; text = hit[0]; cmds = [(text, hit[2])]
+        handler = cmds[0][1]
+        if not handler:
+            JOURNAL.record(text, None, "unmatched")
+            self.say(random.choice(CONFUSED)); return
+        profile = PROFILER.claim()   # only now: a miss must not use up "profile next command"
+        if len(cmds) > 1: self._run_compound(cmds, profile); return
+        self._local.profile = profile   # "run routine X" profiles the routine's steps instead
+        try:
+            with TRACER.span(f"handler {handler.pack}.{handler.name}"), PROFILER.run(handler, profile), \
+                 JOURNAL.entry(text, handler, **heard):
+                handler(self, text)
+        finally: self._local.profile = False
 
     # ── Main Loop ─────────────────────────────────────────────────────────────
 
@@ -1375,34 +2253,269 @@ class Terminator:
         print("  T E R M I N A T O R  —  Voice Assistant")
         print("  Cyberdyne Systems Model 101")
         print("═"*62 + "\n")
-        self.say(random.choice(BOOT_LINES))
-        if not self.text_mode:
-            self.say("Say 'Terminator' followed by your command.")
+        with TRACER.span("boot", cat="startup"):
+            self.say(random.choice(BOOT_LINES))
+            if not self.text_mode:
+                self.say("Say 'Terminator' followed by your command.")
 
         while self.is_running:
-            try:
-                user_input = self.get_input()
-            except KeyboardInterrupt:
-                break
-            if not user_input: continue
+            with TRACER.span("utterance", cat="utterance", mode="text" if self.text_mode else "voice"):
+                try:
+                    user_input = self.get_input()
+                except KeyboardInterrupt:
+                    break
+                if user_input: self._dispatch(user_input)
 
-            if self.text_mode:
-                self._route(user_input)
-            else:
-                has_wake = any(w in user_input for w in WAKE_WORDS)
-                if has_wake:
-                    cmd = user_input
-                    for w in WAKE_WORDS: cmd = cmd.replace(w,"").strip()
-                    self._route(cmd) if cmd else self.say(random.choice(BOOT_LINES))
-                elif any(any(t in user_input for t in trigs) for trigs,_ in self.commands):
-                    self._route(user_input)
+    def _dispatch(self, user_input: str):
+        """Route one heard / typed line — in voice mode only with a wake word or a known trigger."""
+        if self.text_mode:
+            self._route(user_input)
+        else:
+            has_wake = any(w in user_input for w in WAKE_WORDS)
+            if has_wake:
+                IDLE.wake()   # start reloading released backends while the command is parsed
+                cmd = user_input
+                for w in WAKE_WORDS: cmd = cmd.replace(w,"").strip()
+                self._route(cmd, spoken=True) if cmd else self.say(random.choice(BOOT_LINES))
+            elif self._match(user_input)[1]:
+                self._route(user_input, spoken=True)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  SERVER MODE  — one warm process, many local clients
+# ══════════════════════════════════════════════════════════════════════════════
+
+# A Unix socket only its owner can open where there is one. Over TCP any local
+# process (a web page's fetch() too) can connect, so a TCP client must first
+# send the per-run token the server keeps in an owner-only file.
+DEFAULT_SERVER_ADDR = "127.0.0.1:8765" if os.name == "nt" else os.path.expanduser("~/.terminator.sock")
+SERVER_TOKEN_FILE   = os.path.expanduser("~/.terminator_token")
+
+# First line of a browser request: "POST / HTTP/1.1" or a header ("Content-Type: text/plain")
+_HTTP_LINE = re.compile(r"^(?:[A-Z]+ \S+ HTTP/\d|[A-Za-z][\w-]*:\s)")
+
+
+def _write_private(path: str, text: str):
+    """Write a file only the current user can read (0600), replacing any old one."""
+    try: os.unlink(path)
+    except OSError: pass
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as f: f.write(text)
+
+
+def _parse_addr(addr: str):
+    """'8765' / 'host:port' → ("tcp", (host, port));  anything else → ("unix", path)."""
+    if addr.isdigit(): return "tcp", ("127.0.0.1", int(addr))
+    host, sep, port = addr.rpartition(":")
+    if sep and port.isdigit() and "/" not in addr and "\\" not in addr:
+        return "tcp", (host or "127.0.0.1", int(port))
+    return "unix", addr
+
+
+async def _connect(addr: str):
+    kind, a = _parse_addr(addr)
+    if kind == "unix": return await asyncio.open_unix_connection(a)
+    try:
+        with open(SERVER_TOKEN_FILE, encoding="utf-8") as f: token = f.read().strip()
+    except OSError: token = ""
+    reader, writer = await asyncio.open_connection(*a)
+    writer.write((json.dumps({"token": token}) + "\n").encode()); await writer.drain()
+    return reader, writer
+
+
+class StreamTTS:
+    """TTS stand-in for server sessions — hands every utterance to a callback."""
+    backend = "stream"
+
+    def __init__(self, emit):
+        self.emit = emit
+
+    def speak(self, text: str, stop=None):
+        self.emit(text)
+
+
+class TerminatorServer:
+    """
+    asyncio command server on a Unix socket (0600) or localhost TCP.
+    Over TCP the first line must be {"token": ...} with the token written
+    to SERVER_TOKEN_FILE at startup, or the connection is closed. So is a
+    connection whose first line is HTTP (a browser). Then one command per
+    line in (plain text or {"cmd": ...});
+    JSON lines out — {"say": text} as the bot speaks, then
+    {"done": true, "ms": latency}. Timers and alarms keep streaming
+    {"say": ...} lines later. A handler with a follow-up question ("take
+    a note" with no text) sends {"ask": prompt}; the client's next line is
+    the answer (plain text or {"answer": ...}), "" after `ask_timeout`
+    seconds. Each connection is its own session with its own Terminator
+    state; handlers run on a shared thread pool.
+    """
+    def __init__(self, address=DEFAULT_SERVER_ADDR, workers=32, ask_timeout=120.0):
+        self.address  = address
+        self.pool     = ThreadPoolExecutor(max_workers=workers)
+        self.sessions = 0
+        self.ask_timeout = ask_timeout
+        self.token    = None   # set when serving TCP
+
+    @staticmethod
+    def _line(raw: bytes, field: str) -> str:
+        text = raw.decode("utf-8", errors="replace").strip()
+        if text.startswith("{"):
+            try: text = str(json.loads(text).get(field, ""))
+            except ValueError: pass
+        return text
+
+    def _admit(self, first: bytes) -> bool:
+        """Whether a connection may go on, judged by its first line: never HTTP; the token over TCP."""
+        if _HTTP_LINE.match(first.decode("utf-8", errors="replace")): return False
+        if not self.token: return True
+        return hmac.compare_digest(self._line(first, "token").encode(), self.token.encode())
+
+    async def _session(self, reader, writer):
+        loop = asyncio.get_running_loop()
+
+        def write(obj):
+            if not writer.is_closing(): writer.write((json.dumps(obj) + "\n").encode())
+
+        def emit(text):   # called from handler / timer threads
+            loop.call_soon_threadsafe(write, {"say": text})
+
+        def ask(prompt):   # called from the handler thread while the session awaits it
+            loop.call_soon_threadsafe(write, {"ask": prompt})
+            answer = asyncio.run_coroutine_threadsafe(reader.readline(), loop)
+            try: return self._line(answer.result(self.ask_timeout), "answer")
+            except Exception: answer.cancel(); return ""
+
+        try: first = await reader.readline()
+        except ConnectionError: first = b""
+        if not self._admit(first):
+            print(f"[{BOT_TAG}] Refused a connection that did not authenticate.")
+            writer.close(); return
+        bot = Terminator(text_mode=True, tts=StreamTTS(emit), ask=ask)
+        self.sessions += 1
+        try:
+            raw = None if self.token else first   # over TCP the first line was the token
+            while bot.is_running:
+                if raw is None: raw = await reader.readline()
+                if not raw: break
+                text = self._line(raw, "cmd").lower()
+                t0 = time.perf_counter()
+                try: await loop.run_in_executor(self.pool, self._run, bot, text)
+                except Exception as e: write({"error": str(e)})
+                write({"done": True, "ms": round((time.perf_counter() - t0) * 1000, 2)})
+                await writer.drain(); raw = None
+        except ConnectionError: pass
+        finally:
+            self.sessions -= 1
+            writer.close()
+
+    @staticmethod
+    def _run(bot, text):
+        with TRACER.span("utterance", cat="utterance", mode="server"): bot._route(text)
+
+    async def serve(self):
+        kind, a = _parse_addr(self.address)
+        if kind == "unix":
+            try: os.unlink(a)
+            except OSError: pass
+            umask = os.umask(0o177)   # no window in which others could connect
+            try: server = await asyncio.start_unix_server(self._session, path=a)
+            finally: os.umask(umask)
+            os.chmod(a, 0o600)
+        else:
+            self.token = secrets.token_hex(16)
+            _write_private(SERVER_TOKEN_FILE, self.token)
+            server = await asyncio.start_server(self._session, *a)
+        print(f"[{BOT_TAG}] Server listening on {self.address}")
+        async with server: await server.serve_forever()
+
+
+async def send_command(addr: str, text: str):
+    """Send one command to a running server and print the streamed replies."""
+    reader, writer = await _connect(addr)
+    writer.write((text + "\n").encode()); await writer.drain()
+    loop = asyncio.get_running_loop()
+    while True:
+        raw = await reader.readline()
+        if not raw: break
+        msg = json.loads(raw)
+        if "say" in msg:   print(f"🤖  {BOT_NAME.upper()}: {msg['say']}")
+        if "ask" in msg:   # the handler waits for this terminal's answer, not the server's
+            try: answer = await loop.run_in_executor(None, input, f"    ({msg['ask']}) → ")
+            except EOFError: answer = ""
+            writer.write((answer + "\n").encode()); await writer.drain()
+        if "error" in msg: print(f"[{BOT_TAG}] Error: {msg['error']}")
+        if msg.get("done"): break
+    writer.close()
+
+
+async def load_test(addr: str, clients=8, requests=50, command="what time is it") -> dict:
+    """Local load generator: N concurrent sessions × M sequential commands each."""
+    latencies = []
+
+    async def client():
+        reader, writer = await _connect(addr)
+        for _ in range(requests):
+            t0 = time.perf_counter()
+            writer.write((command + "\n").encode()); await writer.drain()
+            while not json.loads(await reader.readline()).get("done"): pass
+            latencies.append(time.perf_counter() - t0)
+        writer.close()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(clients)))
+    wall = time.perf_counter() - t0
+    latencies.sort()
+    pct  = lambda p: latencies[min(len(latencies)-1, int(p * len(latencies)))] * 1000
+    stats = {"requests": len(latencies), "clients": clients, "seconds": round(wall, 3),
+             "rps": round(len(latencies) / wall, 1), "p50_ms": round(pct(0.50), 2),
+             "p95_ms": round(pct(0.95), 2), "p99_ms": round(pct(0.99), 2),
+             "max_ms": round(latencies[-1] * 1000, 2)}
+    print(f"[{BOT_TAG}] {stats['requests']} requests / {clients} clients in {stats['seconds']}s "
+          f"→ {stats['rps']} req/s | p50 {stats['p50_ms']} ms  p95 {stats['p95_ms']} ms  "
+          f"p99 {stats['p99_ms']} ms  max {stats['max_ms']} ms")
+    return stats
 
 
 # ══════════════════════════════════════════════════════════════════════════════
 #  ENTRY
 # ══════════════════════════════════════════════════════════════════════════════
 
+def _arg(flag, default=None):
+    """Value following a command-line flag, or default."""
+    if flag not in sys.argv: return default
+    i = sys.argv.index(flag) + 1
+    return sys.argv[i] if i < len(sys.argv) and not sys.argv[i].startswith("-") else default
+
+
 if __name__ == "__main__":
+    if "--trace" in sys.argv: TRACER.start(_arg("--trace", "terminator_trace.json"))
+    if "--profile" in sys.argv:
+        PROFILER.always, PROFILER.out_dir = True, _arg("--profile", PROFILER.out_dir)
+    if "--no-journal" in sys.argv: JOURNAL.enabled = False
+    if "--hot-reload" in sys.argv: RELOADER.start()
+    if "--bench-tts" in sys.argv: bench_tts(); sys.exit(0)
+    if "--bench-fuzzy" in sys.argv: bench_fuzzy(); sys.exit(0)
+    if "--bench-echo" in sys.argv: bench_echo(); sys.exit(0)
+    if "--import-dictionary" in sys.argv:
+        from packs.dictionary import import_dump, DICT_FILE
+        src = _arg("--import-dictionary")
+        if not src: print(f"[{BOT_TAG}] Usage: --import-dictionary FILE (.tsv, .json or .jsonl)"); sys.exit(1)
+        t0 = time.perf_counter(); n = import_dump(src)
+        print(f"[{BOT_TAG}] {n:,} words → {DICT_FILE} ({os.path.getsize(DICT_FILE)/1e6:.1f} MB) "
+              f"in {time.perf_counter()-t0:.1f} s")
+        sys.exit(0)
+    if "--serve" in sys.argv:
+        try: asyncio.run(TerminatorServer(_arg("--serve", DEFAULT_SERVER_ADDR)).serve())
+        except KeyboardInterrupt: pass
+        sys.exit(0)
+    if "--send" in sys.argv:
+        asyncio.run(send_command(_arg("--connect", DEFAULT_SERVER_ADDR), _arg("--send", "help")))
+        sys.exit(0)
+    if "--load-test" in sys.argv:
+        asyncio.run(load_test(_arg("--connect", DEFAULT_SERVER_ADDR),
+                              clients=int(_arg("--clients", 8)), requests=int(_arg("--requests", 50))))
+        sys.exit(0)
+
     text_mode = "--text" in sys.argv or "-t" in sys.argv
 
     if not text_mode:
@@ -1417,7 +2530,10 @@ if __name__ == "__main__":
                 print(f"[{BOT_TAG}]   Ubuntu:  sudo apt-get install portaudio19-dev python3-pyaudio")
                 text_mode = True
 
-    bot = Terminator(text_mode=text_mode)
+    with TRACER.span("startup", cat="startup"):
+        bot = Terminator(text_mode=text_mode, barge_in="--barge-in" in sys.argv)
+    IDLE.idle = float(_arg("--idle", IDLE.idle / 60)) * 60
+    IDLE.start()
     try:
         bot.run()
     except KeyboardInterrupt:
@@ -0,0 +1,25 @@
+"""
+Command packs for the Terminator bot.
+
+manifest.json lists every pack and every command, in routing order:
+
+    {"pack": "web", "handler": "weather", "triggers": ["weather in", ...], "list": true}
+
+The core reads only the manifest at startup. A pack's module is imported
+the first time one of its triggers matches; handlers are plain functions
+called as handler(bot, text). Pack "core" handlers are Terminator methods.
+
+Optional "patterns" pull typed slots out of the utterance and pass them to
+the handler as keyword arguments, so handlers declare defaults for them:
+
+    "patterns": ["(?:weather|temperature) (?:in|for|at) {city}"]
+    def weather(bot, q, city="Amsterdam"): ...
+
+Slots are {name} or {name:type}; types are duration (seconds), time
+((hour, minute)), int, number, word, text, app and city (see SLOT_TYPES).
+Patterns are compiled once, when the manifest is loaded; the first pattern
+that matches wins.
+
+To add a pack: drop a module in this folder, register it under "packs",
+and add its commands where they should sit in the routing order.
+"""
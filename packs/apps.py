@@ -0,0 +1,173 @@
+"""
+Apps pack — open / close / restart / find apps, folders, files, clipboard.
+"""
+
+import os, time, subprocess
+
+from Terminator import IS_WIN, IS_MAC, phonetic_key
+from packs.winapps import WIN_APP_MAP, WIN_PROC_MAP, find_any_app   # finds nothing off Windows
+if IS_WIN: from packs.winapps import launch_windows, close_windows
+
+_EV = os.path.expandvars
+_APP_SOUNDS = None   # phonetic key → known app name
+
+
+def _known_app(app: str) -> str:
+    """Snap a misheard app name onto one we know by sound ("crome" → "chrome")."""
+    global _APP_SOUNDS
+    if app in WIN_APP_MAP or app in WIN_PROC_MAP: return app
+    if _APP_SOUNDS is None:
+        _APP_SOUNDS = {}
+        for name in list(WIN_APP_MAP) + list(WIN_PROC_MAP): _APP_SOUNDS.setdefault(phonetic_key(name), name)
+    key = phonetic_key(app)
+    return _APP_SOUNDS.get(key, app) if len(key) >= 3 else app
+
+
+# ── App Control ──────────────────────────────────────────────────────────────
+
+def open_app(bot, q, app=None):
+    if not app: bot.say("Which app should I open?"); return
+    app = _known_app(app)
+    bot.say(f"Opening {app}.")
+    if IS_WIN:
+        if not launch_windows(app):
+            bot.say(f"Could not find {app}. Try: find app {app} to check if it's installed.")
+    elif IS_MAC:
+        try: subprocess.Popen(["open","-a",app])
+        except: bot.say(f"Could not open {app}.")
+    else:
+        try: subprocess.Popen([app.lower().replace(" ","-")])
+        except: bot.say(f"Could not open {app}.")
+
+
+def close_app(bot, q, app=None):
+    if not app: bot.say("Which app should I close?"); return
+    app = _known_app(app)
+    bot.say(f"Closing {app}.")
+    if IS_WIN:
+        ok, killed = close_windows(app)
+        if ok:
+            bot.say(f"Terminated {app}.")
+        else:
+            # Brute-force taskkill by guessing exe name
+            for guess in [app+".exe", app.replace(" ","")+".exe", app.replace(" ","_")+".exe"]:
+                r = subprocess.run(["taskkill","/F","/IM",guess], capture_output=True)
+                if r.returncode == 0: bot.say(f"Killed {app}."); return
+            bot.say(f"Could not find a running process for {app}.")
+    elif IS_MAC:
+        subprocess.run(["pkill","-f",app], capture_output=True)
+        subprocess.run(["osascript","-e",f'quit app "{app.title()}"'], capture_output=True)
+        bot.say(f"Closed {app}.")
+    else:
+        subprocess.run(["pkill","-f",app], capture_output=True)
+        bot.say(f"Closed {app}.")
+
+
+def restart_app(bot, q, app=None):
+    if not app: bot.say("Which app should I restart?"); return
+    app = _known_app(app)
+    bot.say(f"Restarting {app}.")
+    if IS_WIN:
+        close_windows(app)
+        time.sleep(1.5)
+        if not launch_windows(app): bot.say(f"Could not relaunch {app}."); return
+    bot.say(f"{app} restarted.")
+
+
+def find_app(bot, q, app=None):
+    if not app: bot.say("Which app should I find?"); return
+    bot.say(f"Scanning for {app}.")
+    path = find_any_app(app.lower())
+    if path:
+        print(f"\n🔍  Found: {path}\n")
+        bot.say(f"Found {app} at {path}.")
+    else:
+        bot.say(f"Could not locate {app} on this system.")
+
+
+# ── Files & Folders ──────────────────────────────────────────────────────────
+
+# Spoken folder names → paths (also used by the files pack)
+FOLDERS = {
+    "desktop":      os.path.join(os.path.expanduser("~"), "Desktop"),
+    "downloads":    os.path.join(os.path.expanduser("~"), "Downloads"),
+    "documents":    os.path.join(os.path.expanduser("~"), "Documents"),
+    "pictures":     os.path.join(os.path.expanduser("~"), "Pictures"),
+    "music":        os.path.join(os.path.expanduser("~"), "Music"),
+    "videos":       os.path.join(os.path.expanduser("~"), "Videos"),
+    "appdata":      _EV("%APPDATA%"),
+    "temp":         _EV("%TEMP%"),
+    "program files":_EV("%PROGRAMFILES%"),
+    "c drive":      "C:\\",
+    "c:":           "C:\\",
+}
+USER_FOLDERS = ["desktop", "downloads", "documents", "pictures", "music", "videos"]
+
+
+def open_folder(bot, q, target=""):
+    for key, path in FOLDERS.items():
+        if key in target.lower():
+            bot.say(f"Opening {key} folder.")
+            if IS_WIN: subprocess.Popen(["explorer.exe", path])
+            elif IS_MAC: subprocess.Popen(["open", path])
+            else: subprocess.Popen(["xdg-open", path])
+            return
+    if os.path.isdir(target):
+        if IS_WIN: subprocess.Popen(["explorer.exe", target])
+        bot.say(f"Opening {target}.")
+    else:
+        bot.say(f"Try: open downloads folder, open documents, open desktop, etc.")
+
+
+def show_desktop_files(bot, _):
+    desktop = os.path.join(os.path.expanduser("~"), "Desktop")
+    try:
+        files = sorted([f for f in os.listdir(desktop) if not f.startswith(".")])
+        if not files: bot.say("Your Desktop is empty."); return
+        print("\n🖥️  DESKTOP FILES\n" + "─"*40)
+        for f in files: print(f"  {f}")
+        print("─"*40)
+        bot.say(f"You have {len(files)} items on your Desktop. Listed on screen.")
+    except Exception as e:
+        bot.say(f"Could not read Desktop: {e}")
+
+
+def create_file(bot, q, name=None):
+    if not name:
+        bot.say("What should I name the file?")
+        name = bot._dictate("File name")
+    if not name: return
+    if "." not in name: name += ".txt"
+    path = os.path.join(os.path.expanduser("~"), "Desktop", name)
+    with open(path, "w", encoding="utf-8") as f: f.write("")
+    bot.say(f"Created {name} on your Desktop.")
+
+
+def clipboard_copy(bot, q, text=None):
+    if not text:
+        bot.say("What should I copy?")
+        text = bot._dictate("Dictate text to copy")
+    if not text: return
+    if IS_WIN:
+        subprocess.run(["powershell","-c",f"Set-Clipboard -Value '{text.replace(chr(39), chr(39)*2)}'"],
+                       capture_output=True)
+    elif IS_MAC:
+        subprocess.run(["pbcopy"], input=text.encode(), capture_output=True)
+    bot._clipboard = text
+    bot.say(f"Copied to clipboard.")
+
+
+def read_clipboard(bot, _):
+    if IS_WIN:
+        r = subprocess.run(["powershell","-c","Get-Clipboard"], capture_output=True, text=True)
+        content = r.stdout.strip()
+    elif IS_MAC:
+        r = subprocess.run(["pbpaste"], capture_output=True, text=True)
+        content = r.stdout.strip()
+    else:
+        content = bot._clipboard
+    if content:
+        print(f"\n📋  Clipboard: {content}\n")
+        bot.say(f"Clipboard contains: {content[:150]}")
+    else:
+        bot.say("Clipboard is empty.")
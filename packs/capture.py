@@ -0,0 +1,244 @@
+"""
+Screen capture pipeline. Grabbing a frame happens on the command path;
+encoding it happens on a background worker.
+
+A source's grab() returns a frame quickly. A frame is one of three things:
+    - a Pillow image;
+    - a RawFrame of RGB bytes;
+    - a FileFrame already on disk as uncompressed BMP, which knows how to
+      convert itself.
+The Encoder thread turns frames into files in the chosen format. Its queue
+is small, so at most a few frames are ever held in memory.
+
+Sources:
+    pil            Pillow ImageGrab (Windows, macOS, X11)
+    powershell     one long-lived PowerShell process (Windows without Pillow)
+    screencapture  macOS command-line tool
+    synthetic      moving test pattern, for headless runs and tests
+TERMINATOR_CAPTURE=<name> picks a source; by default the first one that
+works here is used.
+
+Formats: png (level = zlib level 0-9, default 1 = fast), jpg and webp
+(level = quality 1-100), bmp (no compression, fastest).
+"""
+
+import os, time, zlib, queue, struct, shutil, tempfile, threading, subprocess
+from collections import namedtuple
+
+from Terminator import IS_WIN, IS_MAC, BOT_TAG
+
+try:    from PIL import Image, ImageGrab; PIL_OK = True
+except ImportError: PIL_OK = False
+
+FORMATS       = {"png": "png", "jpg": "jpg", "jpeg": "jpg", "webp": "webp", "bmp": "bmp"}
+DEFAULT_LEVEL = {"png": 1, "jpg": 85, "webp": 80, "bmp": None}
+_KEEP         = ("_source", "ENCODER")   # survive a hot reload: the PowerShell process, queued frames
+
+RawFrame  = namedtuple("RawFrame", "width height rgb")
+FileFrame = namedtuple("FileFrame", "path convert")   # convert(dst, fmt), None = copy only
+
+
+# ── Sources ──────────────────────────────────────────────────────────────────
+
+class PILSource:
+    name = "pil"
+    def grab(self): return ImageGrab.grab()
+
+
+class PowerShellSource:
+    """Keeps one PowerShell process alive instead of starting one (and a bitmap script) per shot."""
+    name = "powershell"
+    INIT = [
+        "Add-Type -AssemblyName System.Windows.Forms,System.Drawing",
+        "function Grab($p){$r=[System.Windows.Forms.Screen]::PrimaryScreen.Bounds;"
+        "$b=New-Object System.Drawing.Bitmap($r.Width,$r.Height);"
+        "$g=[System.Drawing.Graphics]::FromImage($b);"
+        "$g.CopyFromScreen($r.Location,[System.Drawing.Point]::Empty,$r.Size);"
+        "$b.Save($p,[System.Drawing.Imaging.ImageFormat]::Bmp);$g.Dispose();$b.Dispose();'ok'}",
+        "function Conv($s,$d,$f){$b=[System.Drawing.Image]::FromFile($s);"
+        "$b.Save($d,[System.Drawing.Imaging.ImageFormat]::$f);$b.Dispose();'ok'}",
+    ]
+    PS_FORMATS = {"png": "Png", "jpg": "Jpeg", "bmp": "Bmp"}
+
+    def __init__(self):
+        self._proc = None
+        self._lock = threading.Lock()
+
+    def _call(self, line):
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._proc = subprocess.Popen(
+                    ["powershell","-NoProfile","-NonInteractive","-WindowStyle","Hidden","-Command","-"],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+                for l in self.INIT: self._proc.stdin.write(l + "\n")
+            self._proc.stdin.write(line + "\n"); self._proc.stdin.flush()
+            if self._proc.stdout.readline().strip() != "ok": raise OSError("PowerShell capture failed")
+
+    def grab(self):
+        fd, path = tempfile.mkstemp(suffix=".bmp"); os.close(fd)
+        self._call(f"Grab '{path}'")
+        return FileFrame(path, lambda dst, fmt: self._call(
+            f"Conv '{path}' '{dst}' {self.PS_FORMATS.get(fmt, 'Png')}"))
+
+
+class ScreencaptureSource:
+    name = "screencapture"
+    def grab(self):
+        fd, path = tempfile.mkstemp(suffix=".bmp"); os.close(fd)
+        subprocess.run(["screencapture","-x","-t","bmp",path], check=True)
+        return FileFrame(path, lambda dst, fmt: subprocess.run(
+            ["sips","-s","format",{"jpg": "jpeg"}.get(fmt, fmt),path,"--out",dst],
+            capture_output=True, check=True))
+
+
+class SyntheticSource:
+    """A moving colour gradient. Every frame is different and nothing touches a display."""
+    name = "synthetic"
+    def __init__(self, width=640, height=360):
+        self.width, self.height, self.n = width, height, 0
+        self._row = bytes((x * 7 + c * 85) % 256 for x in range(width * 2) for c in range(3))
+
+    def grab(self):
+        off = (self.n * 3 * 8) % (self.width * 3); self.n += 1
+        return RawFrame(self.width, self.height, self._row[off:off + self.width * 3] * self.height)
+
+
+SOURCES = {"pil": PILSource, "powershell": PowerShellSource,
+           "screencapture": ScreencaptureSource, "synthetic": SyntheticSource}
+_source = None
+
+
+def source():
+    """The capture source for this machine (TERMINATOR_CAPTURE overrides), or None."""
+    global _source
+    if _source is None:
+        name = os.environ.get("TERMINATOR_CAPTURE")
+        if not name:
+            name = ("pil" if PIL_OK else "powershell" if IS_WIN else
+                    "screencapture" if IS_MAC and shutil.which("screencapture") else None)
+        _source = SOURCES[name]() if name in SOURCES else None
+    return _source
+
+
+def output_format(fmt: str, src) -> str:
+    """The format a shot will really be saved in. Without Pillow only some can be written."""
+    fmt = FORMATS.get(fmt, "png")
+    if PIL_OK or fmt in ("png", "bmp"): return fmt
+    return fmt if fmt == "jpg" and src.name in ("powershell", "screencapture") else "png"
+
+
+# ── Encoding ─────────────────────────────────────────────────────────────────
+
+def _png(frame: RawFrame, level: int) -> bytes:
+    w, h, rgb = frame; stride = w * 3
+    raw  = b"".join(b"\x00" + rgb[y*stride:(y+1)*stride] for y in range(h))
+    def chunk(tag, data):
+        return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", w, h, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw, level)) + chunk(b"IEND", b""))
+
+
+def _bmp(frame: RawFrame) -> bytes:
+    w, h, rgb = frame; stride = w * 3; pad = b"\x00" * (-stride % 4)
+    rows = b"".join(_bgr(rgb[y*stride:(y+1)*stride]) + pad for y in range(h - 1, -1, -1))
+    return (b"BM" + struct.pack("<IHHI", 54 + len(rows), 0, 0, 54)
+            + struct.pack("<IiiHHIIiiII", 40, w, h, 1, 24, 0, len(rows), 2835, 2835, 0, 0) + rows)
+
+
+def _bgr(row: bytes) -> bytes:
+    out = bytearray(row); out[0::3], out[2::3] = row[2::3], row[0::3]
+    return bytes(out)
+
+
+def encode(frame, path: str, fmt: str, level=None) -> str:
+    """Write `frame` to `path` as `fmt`; returns the path actually written."""
+    if fmt == "webp" and not PIL_OK: fmt, path = "png", os.path.splitext(path)[0] + ".png"
+    level = DEFAULT_LEVEL[fmt] if level is None else level
+    if level is not None: level = min(max(level, 0), 9) if fmt == "png" else min(max(level, 1), 100)
+    if isinstance(frame, FileFrame):
+        try:
+            if fmt == "bmp": shutil.move(frame.path, path); return path
+            if PIL_OK:
+                with Image.open(frame.path) as img: return encode(img.convert("RGB"), path, fmt, level)
+            if frame.convert: frame.convert(path, fmt); return path
+            path = os.path.splitext(path)[0] + ".bmp"; shutil.move(frame.path, path); return path
+        finally:
+            release(frame)
+    if PIL_OK:
+        img = Image.frombytes("RGB", frame[:2], frame.rgb) if isinstance(frame, RawFrame) else frame
+        opts = {"png": {"compress_level": level}, "jpg": {"quality": level},
+                "webp": {"quality": level, "method": 0}}.get(fmt, {})
+        img.convert("RGB").save(path, {"jpg": "JPEG"}.get(fmt, fmt.upper()), **opts)
+        return path
+    if fmt not in ("png", "bmp"):   # no Pillow: lossless fallback
+        fmt, path = "png", os.path.splitext(path)[0] + ".png"
+    with open(path, "wb") as f: f.write(_png(frame, level or 1) if fmt == "png" else _bmp(frame))
+    return path
+
+
+def release(frame):
+    """Drop a frame that will not be encoded (temp files only need cleaning up)."""
+    if isinstance(frame, FileFrame):
+        try: os.unlink(frame.path)
+        except OSError: pass
+
+
+class Encoder:
+    """One background thread that encodes queued frames; at most `maxsize` wait in memory."""
+    def __init__(self, maxsize=3):
+        self.q = queue.Queue(maxsize=maxsize)
+        self.written = self.failed = 0
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, frame, path, fmt="png", level=None, block=True, on_done=None) -> bool:
+        """Queue a frame. With block=False a full queue drops it and returns False."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="capture-encoder")
+                self._thread.start()
+        try: self.q.put((frame, path, fmt, level, on_done), block=block)
+        except queue.Full: release(frame); return False
+        return True
+
+    def _run(self):
+        while True:
+            frame, path, fmt, level, on_done = self.q.get()
+            try:
+                out = encode(frame, path, fmt, level); self.written += 1
+            except Exception as e:
+                out = e; self.failed += 1
+                print(f"[{BOT_TAG}] Screenshot encode failed: {e}")
+            finally:
+                self.q.task_done()
+            if on_done: on_done(out)
+
+    def join(self):
+        self.q.join()
+
+
+ENCODER = Encoder()
+
+
+class Recorder(threading.Thread):
+    """Grab a frame every `every` seconds for `total` seconds into `folder`."""
+    def __init__(self, src, folder, every, total, fmt="png", level=None, encoder=ENCODER, on_finish=None):
+        super().__init__(daemon=True, name="capture-recorder")
+        self.src, self.folder, self.every, self.total = src, folder, every, total
+        self.fmt, self.level, self.encoder, self.on_finish = fmt, level, encoder, on_finish
+        self.taken = self.dropped = 0
+        self.stop  = threading.Event()
+
+    def run(self):
+        os.makedirs(self.folder, exist_ok=True)
+        shots = max(1, int(self.total // self.every))
+        t0 = time.monotonic()
+        for i in range(shots):
+            if self.stop.wait(max(0.0, t0 + i * self.every - time.monotonic())): break
+            try: frame = self.src.grab()
+            except Exception as e: print(f"[{BOT_TAG}] Capture failed: {e}"); self.dropped += 1; continue
+            path = os.path.join(self.folder, f"frame_{i:05d}.{self.fmt}")
+            if self.encoder.submit(frame, path, self.fmt, self.level, block=False): self.taken += 1
+            else: self.dropped += 1
+        self.encoder.join()
+        if self.on_finish: self.on_finish(self)
@@ -0,0 +1,126 @@
+"""
+Content packs — jokes, quotes, trivia and friends, read from text files.
+
+A pack is a UTF-8 file with one entry per line. Packs that ship with the bot
+live in packs/data/; drop your own into terminator_content/ in the working
+directory. Every file named <kind>*.txt joins that kind, e.g.
+terminator_content/jokes-dad.txt adds to the built-in jokes.
+
+Each pack gets a .idx file beside it: a small header and one 32-bit byte
+offset per line. Picking entry i is two seeks and a readline, so a pack with
+tens of thousands of lines is never loaded into memory. The index is rebuilt
+when the text file changes.
+
+Entries are dealt in a no-repeat order: position k of a kind maps to entry
+(a·k + b) mod n with gcd(a, n) = 1, which visits every entry once before a
+new (a, b) is drawn. (a, b, k) per kind is kept in terminator_content.json.
+"""
+
+import os, glob, json, math, random, struct, threading
+
+DATA_DIRS  = [os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"),
+              "terminator_content"]
+STATE_FILE = "terminator_content.json"
+
+_IDX_MAGIC  = b"TIX1"
+_IDX_HEADER = struct.Struct("<4sIQ")   # magic, entry count, size of the text file
+_OFFSET     = struct.Struct("<I")
+
+
+class IndexedFile:
+    """One pack file plus its offset index."""
+    def __init__(self, path):
+        self.path = path
+        self.idx  = path[:-4] + ".idx"
+        self.size = os.path.getsize(path)
+        self.count = self._load() if self._fresh() else self._build()
+
+    def _fresh(self):
+        try:
+            if os.path.getmtime(self.idx) < os.path.getmtime(self.path): return False
+            with open(self.idx, "rb") as f:
+                magic, _, size = _IDX_HEADER.unpack(f.read(_IDX_HEADER.size))
+            return magic == _IDX_MAGIC and size == self.size
+        except (OSError, struct.error):
+            return False
+
+    def _load(self):
+        with open(self.idx, "rb") as f:
+            return _IDX_HEADER.unpack(f.read(_IDX_HEADER.size))[1]
+
+    def _build(self):
+        offsets, pos = [], 0
+        with open(self.path, "rb") as f:
+            for line in f:
+                if line.strip() and not line.startswith(b"#"): offsets.append(pos)
+                pos += len(line)
+        blob = _IDX_HEADER.pack(_IDX_MAGIC, len(offsets), self.size) + \
+               b"".join(_OFFSET.pack(o) for o in offsets)
+        try:
+            tmp = self.idx + ".tmp"
+            with open(tmp, "wb") as f: f.write(blob)
+            os.replace(tmp, self.idx)
+        except OSError:   # read-only install: keep the index in memory
+            self.idx = None; self._mem = blob
+        return len(offsets)
+
+    def __getitem__(self, i):
+        at = _IDX_HEADER.size + i * _OFFSET.size
+        if self.idx is None:
+            off = _OFFSET.unpack_from(self._mem, at)[0]
+        else:
+            with open(self.idx, "rb") as f:
+                f.seek(at); off = _OFFSET.unpack(f.read(_OFFSET.size))[0]
+        with open(self.path, "rb") as f:
+            f.seek(off)
+            return f.readline().decode("utf-8", errors="replace").strip()
+
+
+class ContentPacks:
+    """All pack files, grouped by kind, plus the persisted rotation state."""
+    def __init__(self, dirs=DATA_DIRS, state_file=STATE_FILE):
+        self.dirs  = dirs
+        self.state_file = state_file
+        self._files = {}   # kind -> (signature, [IndexedFile, ...])
+        self._lock  = threading.Lock()
+        try:
+            with open(state_file, encoding="utf-8") as f: self._state = json.load(f)
+        except (OSError, ValueError):
+            self._state = {}
+
+    def files(self, kind):
+        paths = sorted(p for d in self.dirs for p in glob.glob(os.path.join(d, f"{kind}*.txt")))
+        sig   = [(p, os.path.getmtime(p)) for p in paths]
+        hit   = self._files.get(kind)
+        if not hit or hit[0] != sig:
+            hit = self._files[kind] = (sig, [IndexedFile(p) for p in paths])
+        return hit[1]
+
+    def _next(self, kind, n):
+        st = self._state.get(kind)
+        if not st or st["n"] != n or st["k"] >= n:
+            a = random.randrange(1, n) if n > 1 else 1
+            while math.gcd(a, n) != 1: a = random.randrange(1, n)
+            st = self._state[kind] = {"n": n, "a": a, "b": random.randrange(n), "k": 0}
+        i = (st["a"] * st["k"] + st["b"]) % n
+        st["k"] += 1
+        tmp = self.state_file + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f: json.dump(self._state, f)
+            os.replace(tmp, self.state_file)
+        except OSError: pass
+        return i
+
+    def pick(self, kind):
+        """Next entry of this kind in no-repeat order, or None if there are none."""
+        with self._lock:
+            files = self.files(kind)
+            n = sum(f.count for f in files)
+            if not n: return None
+            i = self._next(kind, n)
+        for f in files:
+            if i < f.count: return f[i]
+            i -= f.count
+
+
+CONTENT = ContentPacks()
@@ -0,0 +1,189 @@
+"""
+Offline dictionary — definitions without a network round trip.
+
+A dump is imported once (python terminator.py --import-dictionary FILE) into
+terminator_dictionary.bin. The file is read through mmap, so a lookup only
+touches a handful of pages and nothing is held in memory between lookups.
+
+    header  <4sIII    magic "TDX1", word count n, start of keys, start of definitions
+    table   (n+1)×<II  (key offset, definition offset); entry n marks the end of both
+    keys    lowercase UTF-8 words, sorted bytewise, back to back
+    defs    per word, up to MAX_SENSES lines of "part of speech<TAB>definition"
+
+A lookup is a binary search over the key table. When a word is missing (or
+was misheard), the closest words sorted around it are the suggestions.
+
+Dumps the importer understands:
+    .tsv / .txt   word<TAB>part of speech<TAB>definition, or word<TAB>definition
+    .json         {"word": "definition" | ["definition", ...]}, or a list of entries
+    .jsonl        one entry per line
+An entry is {"word": ..., "pos": ..., "definition": ...}; dictionaryapi.dev
+("meanings") and Wiktionary extracts ("senses" → "glosses") work too.
+"""
+
+import os, json, mmap, struct, bisect, difflib, threading
+
+from Terminator import IDLE, BOT_TAG
+
+DICT_FILE  = "terminator_dictionary.bin"
+MAX_SENSES = 3
+
+_MAGIC  = b"TDX1"
+_HEADER = struct.Struct("<4sIII")
+_ENTRY  = struct.Struct("<II")
+
+
+# ── Import ───────────────────────────────────────────────────────────────────
+
+def _senses(obj):
+    """(word, [(pos, definition)]) from one JSON entry in any of the shapes above."""
+    word = obj.get("word") or obj.get("term") or ""
+    pos  = obj.get("pos") or obj.get("partOfSpeech") or ""
+    out  = []
+    for d in (obj.get("definition"), *(obj.get("definitions") or [])):
+        if isinstance(d, dict): d = d.get("definition")
+        if d: out.append((pos, d))
+    for m in obj.get("meanings") or []:
+        out += [(m.get("partOfSpeech", pos), d["definition"]) for d in m.get("definitions", []) if d.get("definition")]
+    for s in obj.get("senses") or []:
+        out += [(pos, g) for g in s.get("glosses", [])[:1]]
+    return word, out
+
+
+def _read_dump(path):
+    """Yield (word, pos, definition) from a TSV, JSON or JSON-lines dump."""
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, encoding="utf-8") as f:
+        if ext in (".tsv", ".txt"):
+            for line in f:
+                if not line.strip() or line.startswith("#"): continue
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) >= 3: yield parts[0], parts[1], parts[2]
+                elif len(parts) == 2: yield parts[0], "", parts[1]
+            return
+        if ext == ".jsonl":
+            entries = (json.loads(line) for line in f if line.strip())
+        else:
+            data = json.load(f)
+            if isinstance(data, dict):   # {"word": "definition"}
+                for word, d in data.items():
+                    for text in ([d] if isinstance(d, str) else d)[:MAX_SENSES]: yield word, "", text
+                return
+            entries = data
+        for obj in entries:
+            word, senses = _senses(obj)
+            for pos, text in senses: yield word, pos, text
+
+
+def import_dump(src: str, dst=DICT_FILE) -> int:
+    """Build the binary dictionary from a dump; returns the number of words."""
+    senses = {}
+    for word, pos, text in _read_dump(src):
+        key  = " ".join(word.lower().split())
+        text = " ".join(str(text).split())
+        if not key or not text: continue
+        have = senses.setdefault(key, [])
+        if len(have) < MAX_SENSES: have.append(f"{' '.join(str(pos).lower().split())}\t{text}")
+    keys = sorted(k.encode("utf-8") for k in senses)
+    table, key_blob, def_blob = [], bytearray(), bytearray()
+    for k in keys:
+        table.append(_ENTRY.pack(len(key_blob), len(def_blob)))
+        key_blob += k; def_blob += "\n".join(senses[k.decode("utf-8")]).encode("utf-8")
+    table.append(_ENTRY.pack(len(key_blob), len(def_blob)))
+    keys_at = _HEADER.size + len(table) * _ENTRY.size
+    DICTIONARY.close()   # Windows will not replace a file that is still mapped
+    tmp = dst + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, len(keys), keys_at, keys_at + len(key_blob)))
+        f.write(b"".join(table)); f.write(key_blob); f.write(def_blob)
+    os.replace(tmp, dst)
+    return len(keys)
+
+
+# ── Lookup ───────────────────────────────────────────────────────────────────
+
+class _Keys:
+    """The sorted key table as a sequence, so bisect can search the mapped file directly."""
+    def __init__(self, d): self.d = d
+    def __len__(self): return self.d.n
+    def __getitem__(self, i): return self.d._key(i)
+
+
+class OfflineDictionary:
+    def __init__(self, path=DICT_FILE):
+        self.path  = path
+        self._lock = threading.Lock()
+        self._map  = None
+        self._sig  = None
+        self.n     = 0
+
+    def _open(self) -> bool:
+        """Map the file, again if it was re-imported; False when there is none."""
+        try: st = os.stat(self.path)
+        except OSError: self._close(); return False
+        if self._map is not None and self._sig == (st.st_mtime_ns, st.st_size): return True
+        self._close()
+        try:
+            with open(self.path, "rb") as f: m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, n, self._keys_at, self._defs_at = _HEADER.unpack_from(m, 0)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"[{BOT_TAG}] Offline dictionary unreadable: {e}"); return False
+        if magic != _MAGIC: m.close(); return False
+        self._map, self.n, self._sig = m, n, (st.st_mtime_ns, st.st_size)
+        return True
+
+    def close(self) -> bool:
+        """Unmap the file (before a re-import, or when idle); the next lookup maps it again."""
+        with self._lock: return self._close()
+
+    def _close(self) -> bool:
+        had = self._map is not None
+        if had: self._map.close()
+        self._map, self.n = None, 0
+        return had
+
+    def _span(self, i):
+        k0, d0 = _ENTRY.unpack_from(self._map, _HEADER.size + i * _ENTRY.size)
+        k1, d1 = _ENTRY.unpack_from(self._map, _HEADER.size + (i + 1) * _ENTRY.size)
+        return k0, k1, d0, d1
+
+    def _key(self, i) -> bytes:
+        k0, k1, _, _ = self._span(i)
+        return self._map[self._keys_at + k0:self._keys_at + k1]
+
+    def lookup(self, word: str) -> list:
+        """[(part of speech, definition)] for `word`, or [] if it is not in the dictionary."""
+        key = " ".join(word.lower().split()).encode("utf-8")
+        with self._lock:
+            if not self._open(): return []
+            i = bisect.bisect_left(_Keys(self), key)
+            if i == self.n or self._key(i) != key: return []
+            _, _, d0, d1 = self._span(i)
+            text = self._map[self._defs_at + d0:self._defs_at + d1].decode("utf-8")
+        return [tuple(line.split("\t", 1)) for line in text.split("\n")]
+
+    def suggest(self, word: str, n=3, window=40) -> list:
+        """
+        Up to n dictionary words that sound like a misspelling of `word`. The
+        candidates are the words sorted next to where `word` would go that
+        share its first three letters (two for short words), so a misheard
+        "recieve" still lands among "receipt", "receive" and "recipe".
+        """
+        key = " ".join(word.lower().split()).encode("utf-8")
+        with self._lock:
+            if not self._open(): return []
+            keys = _Keys(self)
+            i    = bisect.bisect_left(keys, key)
+            for size in (3, 2):
+                lo = bisect.bisect_left(keys, key[:size], max(0, i - window), i)
+                hi = bisect.bisect_left(keys, key[:size] + b"\xff", i, min(self.n, i + window))
+                if hi > lo: break
+            near = [keys[j].decode("utf-8") for j in range(lo, hi)]
+        return difflib.get_close_matches(word.lower(), near, n, cutoff=0.6)
+
+    def __len__(self):
+        with self._lock: return self.n if self._open() else 0
+
+
+DICTIONARY = OfflineDictionary()
+IDLE.register("offline dictionary", DICTIONARY.close)
@@ -0,0 +1,379 @@
+"""
+Files pack — what is filling up your user folders, what is in there twice,
+and what changed last. Folder names come from the apps pack (FOLDERS), so "downloads" means the
+same place here as in "open downloads folder".
+"""
+
+import os, json, mmap, time, heapq, hashlib, threading, subprocess
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from Terminator import IS_WIN, IS_MAC, IDLE, BOT_TAG
+from packs.apps import FOLDERS, USER_FOLDERS
+
+
+def human_size(n: float, spoken=False) -> str:
+    units = ("bytes", "kilobytes", "megabytes", "gigabytes", "terabytes") if spoken else \
+            ("B", "KB", "MB", "GB", "TB")
+    for unit in units:
+        if n < 1024 or unit == units[-1]: break
+        n /= 1024
+    return f"{n:.0f} {unit}" if unit in ("B", "bytes") else f"{n:.1f} {unit}"
+
+
+def _folder(name):
+    """Spoken folder → (label, path), matched like open_folder does."""
+    name = (name or "").lower()
+    for key, path in FOLDERS.items():
+        if key in name: return key, path
+    return None, None
+
+
+# ── Disk usage ───────────────────────────────────────────────────────────────
+
+class DirSizeCache:
+    """
+    Directory sizes by walking with os.scandir. Each directory's own entries
+    are cached together with its mtime: [mtime_ns, bytes of its files,
+    [subdirectories]]. On a repeat scan an unchanged directory is only
+    stat()ed, not listed. Only subtrees where something was added, removed
+    or renamed are read again. Kept in terminator_du_cache.json.
+    Limits: a directory's mtime says nothing about its subdirectories, so
+    every directory is still stat()ed on each scan (no subtree is skipped
+    whole). A file rewritten in place keeps its directory's mtime, and its
+    new size is only seen once something in that directory is added,
+    removed or renamed.
+    """
+    def __init__(self, path="terminator_du_cache.json"):
+        self.path  = path
+        self._lock = threading.RLock()
+        self.listed = 0   # directories actually re-read during the last scan
+        self._data = None
+
+    def _mem(self) -> dict:
+        """The cache, read from disk on first use and again after drop()."""
+        if self._data is None:
+            with self._lock:
+                if self._data is None:
+                    try:
+                        with open(self.path, encoding="utf-8") as f: self._data = json.load(f)
+                    except (OSError, ValueError):
+                        self._data = {}
+        return self._data
+
+    def drop(self) -> bool:
+        with self._lock:
+            had, self._data = self._data is not None, None
+        return had
+
+    def size(self, path: str) -> int:
+        try: mtime = os.stat(path, follow_symlinks=False).st_mtime_ns
+        except OSError: return 0
+        hit = self._mem().get(path)
+        if hit and hit[0] == mtime:
+            files, subdirs = hit[1], hit[2]
+        else:
+            files, subdirs = 0, []
+            try:
+                with os.scandir(path) as it:
+                    for e in it:
+                        try:
+                            if e.is_dir(follow_symlinks=False): subdirs.append(e.path)
+                            elif e.is_file(follow_symlinks=False): files += e.stat(follow_symlinks=False).st_size
+                        except OSError: pass
+            except OSError: pass
+            with self._lock:
+                self._mem()[path] = [mtime, files, subdirs]; self.listed += 1
+        return files + sum(self.size(d) for d in subdirs)
+
+    def save(self):
+        if self._data is None: return
+        with self._lock:
+            tmp = self.path + ".tmp"
+            try:
+                with open(tmp, "w", encoding="utf-8") as f: json.dump(self._data, f)
+                os.replace(tmp, self.path)
+            except OSError as e: print(f"[{BOT_TAG}] Could not save size cache: {e}")
+
+
+DU_CACHE = DirSizeCache()
+IDLE.register("folder size cache", DU_CACHE.drop)
+
+
+def folder_usage(path: str, cache=DU_CACHE, workers=8):
+    """
+    [(bytes, name)] for each child of `path`; loose files are grouped as "(files)".
+    The children are sized in parallel; each one's subtree is walked on one thread.
+    """
+    cache.listed = 0
+    dirs, loose = [], 0
+    with os.scandir(path) as it:
+        for e in it:
+            try:
+                if e.is_dir(follow_symlinks=False): dirs.append(e)
+                elif e.is_file(follow_symlinks=False): loose += e.stat(follow_symlinks=False).st_size
+            except OSError: pass
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        sizes = list(pool.map(lambda e: cache.size(e.path), dirs))
+    cache.save()
+    usage = [(size, e.name) for size, e in zip(sizes, dirs)]
+    if loose: usage.append((loose, "(files)"))
+    return usage
+
+
+def disk_usage(bot, q, folder=None):
+    label, path = _folder(folder)
+    if folder and not path:
+        bot.say("Which folder? Try downloads, documents or desktop."); return
+    if path:
+        if not os.path.isdir(path): bot.say(f"I can't find your {label} folder."); return
+        usage = folder_usage(path)
+    else:   # no folder named: compare the user folders themselves
+        label = "your user folders"
+        roots = [(n, FOLDERS[n]) for n in USER_FOLDERS if os.path.isdir(FOLDERS[n])]
+        DU_CACHE.listed = 0
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            usage = list(zip(pool.map(lambda r: DU_CACHE.size(r[1]), roots), (n for n, _ in roots)))
+        DU_CACHE.save()
+    if not usage: bot.say(f"There's nothing in {label}."); return
+    total = sum(s for s, _ in usage)
+    top   = heapq.nlargest(10, usage)
+    print(f"\n💾  SPACE IN {label.upper()}  ({human_size(total)})\n" + "─"*50)
+    for size, name in top:
+        print(f"  {name[:34]:<34}{human_size(size):>10}{100*size/(total or 1):>5.0f}%")
+    print("─"*50)
+    biggest = ", ".join(f"{name} {human_size(size, spoken=True)}" for size, name in top[:3])
+    bot.say(f"{label[0].upper() + label[1:]} {'take' if not path else 'takes'} up "
+            f"{human_size(total, spoken=True)}. Biggest: {biggest}.")
+
+
+# ── Duplicates ───────────────────────────────────────────────────────────────
+
+DUPE_FOLDERS = ["desktop", "downloads"]
+EDGE_BLOCK   = 64 * 1024
+
+
+class HashCache:
+    """
+    Hashes per file, kept in terminator_dupe_cache.json as
+    path -> [size, mtime_ns, {"edge": ..., "full": ...}]. A hash is reused only
+    while the size and mtime still match, so a rerun over an unchanged folder
+    reads no file contents at all.
+    """
+    def __init__(self, path="terminator_dupe_cache.json"):
+        self.path  = path
+        self._lock = threading.RLock()
+        self.hashed = 0   # hashes actually computed during the last run
+        self._data = None
+
+    def _mem(self) -> dict:
+        """The cache, read from disk on first use and again after drop()."""
+        if self._data is None:
+            with self._lock:
+                if self._data is None:
+                    try:
+                        with open(self.path, encoding="utf-8") as f: self._data = json.load(f)
+                    except (OSError, ValueError):
+                        self._data = {}
+        return self._data
+
+    def drop(self) -> bool:
+        with self._lock:
+            had, self._data = self._data is not None, None
+        return had
+
+    def get(self, path, size, mtime, kind, compute):
+        hit = self._mem().get(path)
+        if hit and hit[0] == size and hit[1] == mtime and kind in hit[2]: return hit[2][kind]
+        digest = compute(path, size)
+        with self._lock:
+            data = self._mem()
+            hit  = data.get(path)
+            if not hit or hit[0] != size or hit[1] != mtime: hit = data[path] = [size, mtime, {}]
+            hit[2][kind] = digest; self.hashed += 1
+        return digest
+
+    def save(self, keep=None):
+        """Write the cache; with `keep`, entries for files no longer seen are dropped."""
+        if self._data is None: return
+        with self._lock:
+            if keep is not None: self._data = {p: v for p, v in self._data.items() if p in keep}
+            tmp = self.path + ".tmp"
+            try:
+                with open(tmp, "w", encoding="utf-8") as f: json.dump(self._data, f)
+                os.replace(tmp, self.path)
+            except OSError as e: print(f"[{BOT_TAG}] Could not save hash cache: {e}")
+
+
+HASH_CACHE = HashCache()
+IDLE.register("duplicate hash cache", HASH_CACHE.drop)
+
+
+def _edge_hash(path, size):
+    """First and last block; for files up to two blocks long this is the whole file."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        h.update(f.read(EDGE_BLOCK))
+        if size > EDGE_BLOCK:
+            f.seek(max(EDGE_BLOCK, size - EDGE_BLOCK)); h.update(f.read(EDGE_BLOCK))
+    return h.hexdigest()
+
+
+def _full_hash(path, size):
+    """The whole file through mmap; hashlib drops the GIL on big buffers, so workers overlap."""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m: h.update(m)
+        except (OSError, ValueError):   # e.g. special files mmap refuses
+            f.seek(0)
+            for chunk in iter(lambda: f.read(1 << 20), b""): h.update(chunk)
+    return h.hexdigest()
+
+
+def _files_under(roots):
+    """(path, size, mtime_ns) for every regular non-empty file; hard links are listed once."""
+    seen, out, stack = set(), [], list(roots)
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for e in it:
+                    try:
+                        if e.is_dir(follow_symlinks=False): stack.append(e.path); continue
+                        if not e.is_file(follow_symlinks=False): continue
+                        st = e.stat(follow_symlinks=False)
+                    except OSError: continue
+                    if st.st_size and (st.st_dev, st.st_ino) not in seen:
+                        seen.add((st.st_dev, st.st_ino)); out.append((e.path, st.st_size, st.st_mtime_ns))
+        except OSError: pass
+    return out
+
+
+def find_duplicates(roots, cache=HASH_CACHE, workers=8):
+    """
+    [(size, [paths])] of identical files under `roots`, biggest waste first. Three
+    stages, each only looking at what the previous one could not tell apart:
+    same size → same first/last block → same full hash.
+    """
+    cache.hashed = 0
+    files = _files_under(roots)
+    groups = defaultdict(list)
+    for f in files: groups[f[1]].append(f)
+    groups = [g for g in groups.values() if len(g) > 1]
+
+    def split(groups, kind, compute):
+        flat = [f for g in groups for f in g]
+        digests = pool.map(lambda f: _safe(cache.get, f[0], f[1], f[2], kind, compute), flat)
+        out = defaultdict(list)
+        for f, d in zip(flat, digests):
+            if d: out[(f[1], d)].append(f)
+        return [g for g in out.values() if len(g) > 1]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        groups = split(groups, "edge", _edge_hash)
+        small  = [g for g in groups if g[0][1] <= 2 * EDGE_BLOCK]   # edge hash already covered them
+        groups = small + split([g for g in groups if g[0][1] > 2 * EDGE_BLOCK], "full", _full_hash)
+    cache.save(keep={f[0] for f in files})
+    groups = [(g[0][1], sorted(p for p, _, _ in g)) for g in groups]
+    return sorted(groups, key=lambda g: -g[0] * (len(g[1]) - 1))
+
+
+def _safe(fn, *args):
+    try: return fn(*args)
+    except OSError: return None
+
+
+def find_duplicate_files(bot, q):
+    roots = [FOLDERS[n] for n in DUPE_FOLDERS if os.path.isdir(FOLDERS[n])]
+    if not roots: bot.say("I can't find your desktop or downloads folder."); return
+    bot.say("Looking for duplicate files on your desktop and in downloads.")
+    groups = find_duplicates(roots)
+    if not groups: bot.say("No duplicate files found."); return
+    wasted = sum(size * (len(g) - 1) for size, g in groups)
+    print(f"\n🗂️  DUPLICATES  ({len(groups)} sets, {human_size(wasted)} wasted)\n" + "─"*50)
+    for size, g in groups[:10]:
+        print(f"  {len(g)} × {human_size(size)}")
+        for p in g: print(f"      {p}")
+    print("─"*50)
+    name, copies = os.path.basename(groups[0][1][0]), len(groups[0][1])
+    bot.say(f"Found {len(groups)} set{'s' if len(groups) != 1 else ''} of duplicates wasting "
+            f"{human_size(wasted, spoken=True)}. The biggest is {name}, {copies} copies.")
+
+
+# ── Recent files ─────────────────────────────────────────────────────────────
+
+RECENT_FOLDERS = ["desktop", "downloads", "documents"]
+RECENT_DEPTH   = 2    # the folder itself and one level of subfolders
+RECENT_TOP     = 10
+
+
+def _recent_entries(root, label, depth=RECENT_DEPTH):
+    """(mtime, path, label) for visible files under `root`. DirEntry.stat() is
+    cached per entry (and free on Windows, where the listing already carries it)."""
+    stack = [(root, 1)]
+    while stack:
+        path, level = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for e in it:
+                    if e.name.startswith((".", "~$")) or e.name == "desktop.ini": continue
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            if level < depth: stack.append((e.path, level + 1))
+                        elif e.is_file(): yield e.stat().st_mtime, e.path, label
+                    except OSError: pass
+        except OSError: pass
+
+
+def recent(names=RECENT_FOLDERS, k=RECENT_TOP) -> list:
+    """Newest k files as [(mtime, path, folder label)]. A k-sized heap, not a sort of every file."""
+    roots = [(n, FOLDERS[n]) for n in names if os.path.isdir(FOLDERS[n])]
+    return heapq.nlargest(k, (f for n, root in roots for f in _recent_entries(root, n)))
+
+
+def _recent_folders(q):
+    """The user folders a request names ("what did I download last" → downloads), else all three."""
+    q = q.lower()
+    named = [n for n, word in (("desktop", "desktop"), ("downloads", "download"), ("documents", "document"))
+             if word in q]
+    return named or RECENT_FOLDERS
+
+
+def _ago(secs):
+    for unit, size in (("day", 86400), ("hour", 3600), ("minute", 60)):
+        if secs >= size: n = int(secs // size); return f"{n} {unit}{'s' if n != 1 else ''} ago"
+    return "just now"
+
+
+def _open_path(path):
+    if IS_WIN: os.startfile(path)
+    elif IS_MAC: subprocess.Popen(["open", path])
+    else: subprocess.Popen(["xdg-open", path])
+
+
+def recent_files(bot, q):
+    folders = _recent_folders(q)
+    files = bot._recent = recent(folders)
+    where = " and ".join(folders) if len(folders) < 3 else "desktop, downloads and documents"
+    if not files: bot.say(f"No files in {where}."); return
+    now = time.time()
+    print(f"\n🕒  RECENT FILES  ({where})\n" + "─"*50)
+    for i, (mtime, path, label) in enumerate(files, 1):
+        print(f"  {i:>2}. {os.path.basename(path)[:30]:<30} {label:<10}{_ago(now - mtime):>14}")
+    print("─"*50)
+    mtime, path, label = files[0]
+    bot.say(f"Most recent: {os.path.basename(path)} in {label}, {_ago(now - mtime)}. "
+            f"Say open the first one, the second one and so on to open a file.")
+
+
+def open_recent(bot, q, n=1):
+    """Open the nth newest file: from the last list shown, or from a fresh scan."""
+    files = getattr(bot, "_recent", None)
+    if not files or any(w in q for w in ("download", "document", "desktop")):
+        files = bot._recent = recent(_recent_folders(q), max(n, RECENT_TOP))
+    if not files: bot.say("I couldn't find any recent files."); return
+    if n > len(files): bot.say(f"There are only {len(files)} recent files."); return
+    path = files[n - 1][1]
+    bot.say(f"Opening {os.path.basename(path)}.")
+    try: _open_path(path)
+    except OSError as e: bot.say(f"Could not open it: {e}")
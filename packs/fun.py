@@ -0,0 +1,41 @@
+"""
+Fun pack — jokes, quotes, games and trivia.
+The sayings come from content packs (see packs/content.py).
+"""
+
+import random
+
+from packs.content import CONTENT
+
+
+def _say_pick(bot, kind, fallback):
+    line = CONTENT.pick(kind)
+    bot.say(line.replace("{name}", bot.user_name) if line else fallback)
+
+
+def joke(bot, _):             _say_pick(bot, "jokes", "I'm out of jokes.")
+def terminator_quote(bot, _): _say_pick(bot, "quotes", "I'll be back.")
+def magic_8ball(bot, _):      _say_pick(bot, "8ball", "Ask again later.")
+def roast(bot, _):            _say_pick(bot, "roasts", "You are running on legacy hardware.")
+def trivia(bot, _):           _say_pick(bot, "trivia", "No trivia packs found.")
+def motivate(bot, _):         _say_pick(bot, "motivate", "Keep going.")
+
+
+def flip_coin(bot, _): bot.say(f"It's {random.choice(['Heads','Tails'])}!")
+
+
+def roll_dice(bot, q, sides=6):
+    sides = max(sides, 2)
+    bot.say(f"I rolled a {sides}-sided die and got {random.randint(1,sides)}.")
+
+
+def random_number(bot, q, lo=1, hi=100):
+    lo, hi = min(lo, hi), max(lo, hi)
+    bot.say(f"Your number is {random.randint(lo,hi)}.")
+
+
+def word_of_day(bot, _):
+    line = CONTENT.pick("words")
+    if not line: bot.say("No word packs found."); return
+    w, pos, defn = (line.split("\t") + ["", ""])[:3]
+    bot.say(f"Word of the day: {w}. {pos.capitalize()}. {defn}.")
@@ -0,0 +1,215 @@
+"""
+Productivity pack — maths, unit conversion, timers and alarms, notes, to-dos.
+"""
+
+import os, re, math, time, datetime, threading
+
+from Terminator import IDLE, duration_label
+from packs.textindex import LineIndex
+from packs.stats import statistic, elementwise, spoken
+
+
+# ── Maths ────────────────────────────────────────────────────────────────────
+
+def calculate(bot, q, expr=None):
+    try:   # statistics and list arithmetic first: "average of 3, 4 and 8", "1, 2, 3 times 10"
+        found = statistic(q)
+        if found is None:
+            r = elementwise(expr or q)
+            found = ("result", r) if r is not None else None
+    except (ValueError, ZeroDivisionError, OverflowError) as e:
+        bot.say(f"Could not calculate that: {e}."); return
+    if found:
+        what, value = found
+        print(f"\n🧮  {what.upper()}: {value}\n")
+        many = isinstance(value, list) and len(value) > 1
+        if many and len(value) > 10:
+            bot.say(f"That gives {len(value)} numbers, starting {spoken(value[:5])}. All on screen.")
+        elif what == "result":
+            bot.say(f"That gives {spoken(value)}.")
+        else:
+            bot.say(f"The {what}{'s are' if many else ' is'} {spoken(value)}.")
+        return
+    expr = ((expr or q).replace("calculate","").replace("what is","").replace("compute","")
+              .replace("equals","").replace("plus","+").replace("minus","-")
+              .replace("times","*").replace("multiplied by","*")
+              .replace("divided by","/").replace("over","/")
+              .replace("to the power of","**").replace("squared","**2")
+              .replace("cubed","**3").replace("percent of","*0.01*").strip())
+    try:
+        allowed = {k: getattr(math, k) for k in dir(math) if not k.startswith("_")}
+        r = eval(expr, {"__builtins__": {}}, allowed)
+        r = int(r) if isinstance(r, float) and r.is_integer() else round(r, 6)
+        bot.say(f"The answer is {r}.")
+    except:
+        bot.say("Could not calculate that. Try: calculate 12 times 8.")
+
+
+CONVERSIONS = [
+    (["celsius","fahrenheit"], lambda v: f"{v}°C = {round(v*9/5+32,1)}°F"),
+    (["fahrenheit","celsius"], lambda v: f"{v}°F = {round((v-32)*5/9,1)}°C"),
+    (["km","mile"],            lambda v: f"{v} km = {round(v*0.621371,2)} miles"),
+    (["mile","km"],            lambda v: f"{v} miles = {round(v*1.60934,2)} km"),
+    (["kg","lb"],              lambda v: f"{v} kg = {round(v*2.20462,2)} lbs"),
+    (["lb","kg"],              lambda v: f"{v} lbs = {round(v*0.453592,2)} kg"),
+    (["meter","feet"],         lambda v: f"{v} m = {round(v*3.28084,2)} ft"),
+    (["feet","meter"],         lambda v: f"{v} ft = {round(v*0.3048,2)} m"),
+    (["liter","gallon"],       lambda v: f"{v} L = {round(v*0.264172,2)} gal"),
+    (["gallon","liter"],       lambda v: f"{v} gal = {round(v*3.78541,2)} L"),
+    (["inch","cm"],            lambda v: f"{v} in = {round(v*2.54,2)} cm"),
+    (["cm","inch"],            lambda v: f"{v} cm = {round(v/2.54,2)} in"),
+]
+UNIT_ALIASES = {"c":"celsius", "f":"fahrenheit", "kilometers":"km", "kilometres":"km",
+                "kilograms":"kg", "kilos":"kg", "pounds":"lb", "lbs":"lb", "metres":"meter",
+                "meters":"meter", "m":"meter", "foot":"feet", "ft":"feet", "litres":"liter",
+                "liters":"liter", "l":"liter", "inches":"inch", "in":"inch",
+                "centimeters":"cm", "centimetres":"cm"}
+
+
+def _unit(word):
+    word = UNIT_ALIASES.get(word, word)
+    return next((k for keys, _ in CONVERSIONS for k in keys if word.startswith(k)), word)
+
+
+def convert(bot, q, value=None, src=None, dst=None):
+    if value is None:
+        nums = re.findall(r"-?\d+\.?\d*", q)
+        if not nums: bot.say("Give me a value, like: convert 100 celsius to fahrenheit."); return
+        value = float(nums[0])
+    value = int(value) if float(value).is_integer() else value
+    if src and dst:
+        pair = [_unit(src), _unit(dst)]
+        for keys, fn in CONVERSIONS:
+            if keys == pair: bot.say(fn(value)); return
+    else:
+        for keys, fn in CONVERSIONS:
+            if all(k in q for k in keys): bot.say(fn(value)); return
+    bot.say("I can convert: celsius/fahrenheit, km/miles, kg/lbs, meters/feet, liters/gallons, inches/cm.")
+
+
+# ── Timers / Alarms ──────────────────────────────────────────────────────────
+
+def timer(bot, q, duration=None):
+    if not duration: bot.say("Specify a duration like: set a 30 second timer."); return
+    secs, label = duration, duration_label(duration)
+    bot.say(f"Timer set for {label}.")
+    def _run(): time.sleep(secs); bot.say(f"Time's up! {label} timer done.")
+    threading.Thread(target=_run, daemon=True).start()
+
+
+def alarm(bot, q, at=None):
+    if not at: bot.say("Specify a time like: set alarm for 7 am."); return
+    hour, minute = at
+    now = datetime.datetime.now()
+    t   = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if t <= now: t += datetime.timedelta(days=1)
+    bot.say(f"Alarm set for {t.strftime('%I:%M %p')}.")
+    def _run():
+        time.sleep((t - datetime.datetime.now()).total_seconds())
+        bot.say(f"Wake up, {bot.user_name}! Alarm going off!")
+    threading.Thread(target=_run, daemon=True).start()
+
+
+def stopwatch(bot, _):
+    if not hasattr(bot, "_sw"):
+        bot._sw = time.time(); bot.say("Stopwatch started.")
+    else:
+        e = time.time() - bot._sw; del bot._sw
+        h, r = divmod(int(e), 3600); m, s = divmod(r, 60)
+        bot.say(f"Stopped. {h}h {m}m {s}s elapsed.")
+
+
+def countdown(bot, q, start=10):
+    n = min(start, 60)
+    bot.say(f"Counting down from {n}.")
+    def _run():
+        for i in range(n, 0, -1): bot.say(str(i)); time.sleep(0.3)
+        bot.say("Go!")
+    threading.Thread(target=_run, daemon=True).start()
+
+
+def pomodoro(bot, q, work=25, rest=5):
+    brk = rest
+    bot.say(f"Pomodoro started. Work for {work} minutes, then {brk} minute break.")
+    def _run():
+        time.sleep(work * 60)
+        bot.say(f"Work session done! Take a {brk} minute break.")
+        time.sleep(brk * 60)
+        bot.say("Break over. Back to work!")
+    threading.Thread(target=_run, daemon=True).start()
+
+
+# ── Notes / Todo ─────────────────────────────────────────────────────────────
+
+NOTES = LineIndex("terminator_notes.txt", strip=r"^\[[^\]]*\]\s*")            # [ts] text
+TODOS = LineIndex("terminator_todo.txt",  strip=r"^\[.\]\s*\[[^\]]*\]\s*")   # [ ] [ts] text
+IDLE.register("notes index", NOTES.drop); IDLE.register("to-do index", TODOS.drop)
+
+
+def note(bot, q, content=None):
+    if not content:
+        bot.say("Go ahead. Pause when done.")
+        content = bot._dictate("Dictate your note")
+    if not content: bot.say("Nothing captured. Note not saved."); return
+    ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+    NOTES.append(f"[{ts}] {content}")
+    bot.say(f"Saved: {content}")
+
+
+def read_notes(bot, _):
+    if not os.path.exists("terminator_notes.txt"): bot.say("No notes yet."); return
+    lines = [l.strip() for l in open("terminator_notes.txt",encoding="utf-8") if l.strip()]
+    if not lines: bot.say("Note file is empty."); return
+    print("\n📝  NOTES\n" + "─"*50)
+    for l in lines: print(l)
+    print("─"*50)
+    bot.say(f"You have {len(lines)} note{'s' if len(lines)!=1 else ''}. Displayed on screen.")
+
+
+def clear_notes(bot, _):
+    NOTES.clear(); bot.say("All notes cleared.")
+
+
+def todo(bot, q, item=None):
+    if not item:
+        bot.say("What should I add?")
+        item = bot._dictate("Dictate your task")
+    if not item: bot.say("Nothing heard. Not added."); return
+    ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
+    TODOS.append(f"[ ] [{ts}] {item}")
+    bot.say(f"Added: {item}.")
+
+
+def read_todo(bot, _):
+    if not os.path.exists("terminator_todo.txt"): bot.say("To-do list is empty."); return
+    lines = [l.strip() for l in open("terminator_todo.txt",encoding="utf-8") if l.strip()]
+    if not lines: bot.say("Nothing on your list."); return
+    print("\n✅  TO-DO LIST\n" + "─"*50)
+    for i,l in enumerate(lines,1): print(f"{i}. {l}")
+    print("─"*50)
+    bot.say(f"You have {len(lines)} item{'s' if len(lines)!=1 else ''}.")
+
+
+def clear_todo(bot, _):
+    TODOS.clear(); bot.say("To-do list cleared.")
+
+
+def _search(bot, index, query, what, icon):
+    if not query: bot.say(f"What should I look for in your {what}?"); return
+    hits = index.search(query, limit=21)
+    if not hits: bot.say(f"Nothing in your {what} about {query}."); return
+    print(f"\n{icon}  {what.upper()} ABOUT \"{query.upper()}\"\n" + "─"*50)
+    for l in hits[:20]: print(l)
+    if len(hits) > 20: print("… and older ones")
+    print("─"*50)
+    count  = "More than 20 matches" if len(hits) > 20 else f"{len(hits)} match{'es' if len(hits)!=1 else ''}"
+    latest = re.sub(index.strip, "", hits[0])
+    bot.say(f"{count}. Latest: {latest}")
+
+
+def search_notes(bot, q, query=None):
+    _search(bot, NOTES, query, "notes", "📝")
+
+
+def search_todo(bot, q, query=None):
+    _search(bot, TODOS, query, "to-dos", "✅")
@@ -0,0 +1,299 @@
+"""
+Statistics and list arithmetic for the calculator.
+
+Spoken numbers are turned into a list first, so "twelve, 18 and twenty five"
+becomes [12, 18, 25]. With NumPy installed, reductions and element-wise
+operations run on arrays. Without it, the statistics module and plain loops
+give the same answers.
+
+Ranges ("the sum of 1 to 1000000") are never built in memory. Counts, sums,
+means, medians and spreads of a range have closed forms, and so do sums of
+squares and cubes. Anything else is reduced in chunks of CHUNK numbers.
+"""
+
+import re, math, statistics
+from collections import Counter
+
+try:    import numpy as np; NP_OK = True
+except ImportError: NP_OK = False
+
+CHUNK       = 1_000_000
+MAX_CHUNKED = 10**8 if NP_OK else 10**7   # numbers we are willing to walk one by one
+
+
+# ── Spoken numbers ───────────────────────────────────────────────────────────
+
+UNITS  = {w: i for i, w in enumerate("zero one two three four five six seven eight nine".split())}
+TEENS  = {w: i + 10 for i, w in enumerate("ten eleven twelve thirteen fourteen fifteen sixteen "
+                                           "seventeen eighteen nineteen".split())}
+TENS   = {w: (i + 2) * 10 for i, w in enumerate("twenty thirty forty fifty sixty seventy eighty "
+                                                 "ninety".split())}
+SCALES = {"thousand": 10**3, "million": 10**6, "billion": 10**9, "trillion": 10**12}
+_TOKEN = re.compile(r"-?\d+(?:,\d{3})+(?:\.\d+)?(?!\d)|-?\d+(?:\.\d+)?|[a-z]+|\S")
+
+
+def spoken_numbers(text: str) -> str:
+    """'one hundred and five, twenty two and 3 thousand' → '105 , 22 and 3000'."""
+    toks, out = _TOKEN.findall(text.lower()), []
+    total = cur = 0; last = None   # last: kind of the previous number word, None = not in a number
+    def flush():
+        nonlocal total, cur, last
+        if last is not None: out.append(str(_num(total + cur)))
+        total = cur = 0; last = None
+    i = 0
+    while i < len(toks):
+        w, nxt = toks[i], toks[i+1] if i + 1 < len(toks) else ""
+        if w[0].isdigit() or (w[0] == "-" and len(w) > 1):
+            flush(); cur = float(w.replace(",", "")); last = "digit"
+        elif w in UNITS or w in TEENS:
+            kind = "unit" if w in UNITS else "teen"
+            if not (last in ("hundred", "scale") or (kind == "unit" and last == "tens")): flush()
+            cur += UNITS.get(w, TEENS.get(w)); last = kind
+        elif w in TENS:
+            if last not in ("hundred", "scale"): flush()
+            cur += TENS[w]; last = "tens"
+        elif w == "hundred" and last in (None, "unit", "teen", "tens", "digit"):
+            cur = (cur or 1) * 100; last = "hundred"
+        elif w in SCALES and last is not None:
+            total += (cur or 1) * SCALES[w]; cur = 0; last = "scale"
+        elif w in SCALES:   # "a thousand"
+            cur = SCALES[w]; last = "scale"
+        elif w == "a" and (nxt == "hundred" or nxt in SCALES):
+            pass
+        elif w == "and" and last in ("hundred", "scale") and (nxt in UNITS or nxt in TEENS or nxt in TENS):
+            pass   # "one hundred and five"
+        elif w == "point" and last is not None and nxt in UNITS:
+            digits = ""
+            while i + 1 < len(toks) and toks[i+1] in UNITS: i += 1; digits += str(UNITS[toks[i]])
+            cur += float("0." + digits)
+        elif w in ("negative", "minus") and last is None and nxt and (nxt[0].isdigit() or nxt in UNITS
+                                                                      or nxt in TEENS or nxt in TENS):
+            out.append("\0")   # sign, glued onto the number that follows
+        else:
+            flush(); out.append(w)
+        i += 1
+    flush()
+    return " ".join(out).replace("\0 ", "-")
+
+
+def _num(x):
+    return int(x) if float(x).is_integer() and abs(x) < 1e18 else x
+
+
+def numbers(text: str) -> list:
+    return [_num(float(n)) for n in re.findall(r"-?\d+(?:\.\d+)?", text)]
+
+
+_RANGE = re.compile(r"^(?:the )?(?:numbers |integers )?(?:from |between )?(-?\d+) (?:to|through|till|until|and) "
+                    r"(-?\d+)(?: (?:in steps of|step|by|counting by) (\d+))?$")
+
+
+def _range(text):
+    """(first, last, step) for '1 to 1000000', '0 to 100 in steps of 5'; else None."""
+    m = _RANGE.match(text.strip(" ?.!"))
+    if not m or (" and " in m.group(0) and "between" not in m.group(0)): return None   # "3 and 4" is a list
+    a, b, d = int(m.group(1)), int(m.group(2)), int(m.group(3) or 1)
+    if b < a: a, b = b, a
+    return (a, a + (b - a) // d * d, d) if d > 0 else None
+
+
+# ── Reductions ───────────────────────────────────────────────────────────────
+
+OPS = [   # spoken name → op (checked in order: "sample standard deviation" before "standard deviation")
+    (r"sample standard deviation|sample std(?:ev)?", "sstd"),
+    (r"standard deviation|std(?: dev)?|stdev", "std"),
+    (r"sample variance", "svar"),
+    (r"variance", "var"),
+    (r"average|mean", "mean"),
+    (r"median", "median"),
+    (r"mode", "mode"),
+    (r"sum|total", "sum"),
+    (r"product", "prod"),
+    (r"minimum|smallest|lowest|min", "min"),
+    (r"maximum|largest|biggest|highest|max", "max"),
+    (r"range", "range"),
+    (r"count", "count"),
+]
+NAMES = {"sstd": "sample standard deviation", "std": "standard deviation", "svar": "sample variance",
+         "var": "variance", "mean": "average", "median": "median", "mode": "most common value",
+         "sum": "sum", "prod": "product", "min": "smallest", "max": "largest", "range": "range",
+         "count": "count"}
+
+MAPS = {   # element-wise functions: spoken → (python function, NumPy ufunc); all rise or fall steadily for x >= 0
+    "squares":      (lambda x: x * x,             "square"),
+    "cubes":        (lambda x: x * x * x,         None),
+    "square roots": (math.sqrt,                   "sqrt"),
+    "reciprocals":  (lambda x: 1 / x,             "reciprocal"),
+    "logs":         (math.log,                    "log"),
+}
+_MAP_WORDS = {"square": "squares", "squares": "squares", "cube": "cubes", "cubes": "cubes",
+              "square root": "square roots", "square roots": "square roots",
+              "reciprocal": "reciprocals", "reciprocals": "reciprocals", "inverses": "reciprocals",
+              "log": "logs", "logs": "logs", "logarithms": "logs"}
+_OP_RX = re.compile(r"\b(" + "|".join(rx for rx, _ in OPS) + r")\b(?: of)?(?: the)?"
+                    r"(?: (" + "|".join(sorted(_MAP_WORDS, key=len, reverse=True)) + r")\b)?(?: of)?"
+                    r"(?: the)?(?: numbers?| values?| list)?(?: of)? (.+)")
+
+
+def _op(word):
+    return next(op for rx, op in OPS if re.fullmatch(rx, word))
+
+
+def reduce_list(op, xs):
+    """One statistic of a list of numbers."""
+    if op == "count": return len(xs)
+    if op == "mode":
+        counts = Counter(xs).most_common()
+        return [x for x, c in counts if c == counts[0][1]]
+    if op == "prod": return math.prod(xs)   # exact; NumPy's int64 would overflow silently
+    if op in ("sstd", "svar") and len(xs) < 2: raise ValueError("need two or more numbers")
+    if NP_OK:
+        a = np.asarray(xs, dtype=float)
+        fn = {"sum": np.sum, "mean": np.mean, "median": np.median, "min": np.min, "max": np.max,
+              "range": np.ptp, "std": np.std, "var": np.var,
+              "sstd": lambda a: np.std(a, ddof=1), "svar": lambda a: np.var(a, ddof=1)}[op]
+        return _num(float(fn(a)))
+    fn = {"sum": math.fsum, "mean": statistics.fmean, "median": statistics.median, "min": min,
+          "max": max, "range": lambda xs: max(xs) - min(xs), "std": statistics.pstdev,
+          "var": statistics.pvariance, "sstd": statistics.stdev, "svar": statistics.variance}[op]
+    return _num(fn(xs))
+
+
+def _power_sum(n, p):
+    """1^p + … + n^p for p = 0..3."""
+    return [n, n * (n + 1) // 2, n * (n + 1) * (2 * n + 1) // 6, (n * (n + 1) // 2) ** 2][p]
+
+
+def reduce_range(op, a, last, d, fmap=None):
+    """A statistic of a, a+d, …, last (d > 0) without building it: closed form where there is one."""
+    n = max(0, (last - a) // d + 1)
+    if op == "count": return n
+    if n == 0:   # an empty range has a sum and a product, nothing else
+        if op in ("sum", "prod"): return 0 if op == "sum" else 1
+        raise ValueError("that range has no numbers in it")
+    last = a + (n - 1) * d   # "0 to 10 in steps of 3" ends at 9
+    if op == "mode": raise ValueError("every number in a range appears once")
+    if fmap is None:
+        closed = {"sum": n * (a + last) // 2, "mean": _num((a + last) / 2), "median": _num((a + last) / 2),
+                  "min": a, "max": last, "range": last - a,
+                  "var": _num(d * d * (n * n - 1) / 12), "std": _num(d * math.sqrt((n * n - 1) / 12))}
+        if n > 1:
+            closed.update(svar=_num(d * d * n * (n + 1) / 12), sstd=_num(d * math.sqrt(n * (n + 1) / 12)))
+        if op in closed: return closed[op]
+    elif fmap in ("squares", "cubes") and d == 1 and a >= 0 and op in ("sum", "mean"):
+        p = 2 if fmap == "squares" else 3
+        s = _power_sum(last, p) - (_power_sum(a - 1, p) if a > 0 else 0)
+        return s if op == "sum" else _num(s / n)
+    if op == "prod":
+        if n > 5000: raise ValueError("that product is too large to work out")
+        f = MAPS[fmap][0] if fmap else None
+        return math.prod(f(x) for x in range(a, last + 1, d)) if f else math.prod(range(a, last + 1, d))
+    if op in ("median", "min", "max", "range") and fmap and a >= 0:   # every map is monotonic for x >= 0
+        f = MAPS[fmap][0]
+        lo, hi = sorted((f(a), f(last)))
+        if op == "median":
+            mid = a + (n - 1) // 2 * d
+            return _num(f(mid) if n % 2 else (f(mid) + f(mid + d)) / 2)
+        return _num({"min": lo, "max": hi, "range": hi - lo}[op])
+    return _chunked(op, a, last, d, n, fmap)
+
+
+def _chunked(op, a, last, d, n, fmap):
+    """Walk the range CHUNK numbers at a time: count, sum, sum of squares, min, max."""
+    if op not in ("sum", "mean", "var", "std", "svar", "sstd", "min", "max", "range"):
+        raise ValueError(f"I can't work out the {NAMES[op]} of that range")
+    if n > MAX_CHUNKED: raise ValueError("that range is too long to go through number by number")
+    f = MAPS[fmap][0] if fmap else None
+    total = sq = 0.0; lo, hi = math.inf, -math.inf
+    for start in range(a, last + 1, CHUNK * d):
+        stop = min(last + 1, start + CHUNK * d)
+        if NP_OK:
+            x = np.arange(start, stop, d, dtype=float)
+            if fmap: x = getattr(np, MAPS[fmap][1])(x) if MAPS[fmap][1] else x ** 3
+            total += float(x.sum()); sq += float((x * x).sum())
+            lo, hi = min(lo, float(x.min())), max(hi, float(x.max()))
+        else:
+            xs = [f(x) for x in range(start, stop, d)] if f else range(start, stop, d)
+            total += math.fsum(xs); sq += math.fsum(x * x for x in xs)
+            lo, hi = min(lo, min(xs)), max(hi, max(xs))
+    mean = total / n
+    var  = max(sq / n - mean * mean, 0.0)
+    if op in ("svar", "sstd"):
+        if n < 2: raise ValueError("need two or more numbers")
+        var = var * n / (n - 1)
+    return _num({"sum": total, "mean": mean, "var": var, "svar": var, "std": math.sqrt(var),
+                 "sstd": math.sqrt(var), "min": lo, "max": hi, "range": hi - lo}[op])
+
+
+def statistic(text: str):
+    """(description, value) for 'average of 12, 18 and 25', 'sum of 1 to 1000000'; else None."""
+    m = _OP_RX.search(spoken_numbers(text))
+    if not m: return None
+    op, fmap, rest = _op(m.group(1)), _MAP_WORDS.get(m.group(2) or ""), m.group(3)
+    what = NAMES[op] + (f" of the {fmap}" if fmap else "")
+    span = _range(rest)
+    if span: return what, reduce_range(op, *span, fmap)
+    xs = numbers(rest)
+    if not xs: return None
+    if fmap: xs = elementwise_map(fmap, xs)
+    return what, reduce_list(op, xs)
+
+
+# ── Element-wise arithmetic ──────────────────────────────────────────────────
+
+ARITH = [("to the power of", "**"), ("multiplied by", "*"), ("divided by", "/"), ("plus", "+"),
+         ("minus", "-"), ("times", "*"), ("over", "/"), ("+", "+"), ("-", "-"), ("*", "*"), ("/", "/")]
+_PY_OPS = {"+": lambda x, y: x + y, "-": lambda x, y: x - y, "*": lambda x, y: x * y,
+           "/": lambda x, y: x / y, "**": lambda x, y: x ** y}
+
+
+def elementwise_map(fmap, xs):
+    if NP_OK and MAPS[fmap][1]:
+        return [_num(float(v)) for v in getattr(np, MAPS[fmap][1])(np.asarray(xs, dtype=float))]
+    return [_num(MAPS[fmap][0](x)) for x in xs]
+
+
+def elementwise(text: str):
+    """'1, 2, 3 plus 4, 5, 6' → [5, 7, 9]; 'squares of 1 2 3' → [1, 4, 9]. None unless a list is involved."""
+    text = spoken_numbers(text)
+    m = re.search(r"\b(" + "|".join(sorted(_MAP_WORDS, key=len, reverse=True)) + r") of (.+)", text)
+    if m:
+        span = _range(m.group(2))
+        if span and (span[1] - span[0]) // span[2] >= 10_000: raise ValueError("that list would be too long to read out")
+        xs = list(range(span[0], span[1] + 1, span[2])) if span else numbers(m.group(2))
+        return elementwise_map(_MAP_WORDS[m.group(1)], xs) if len(xs) > 1 else None
+    for word, sym in ARITH:
+        rx = re.escape(word) if not word.isalpha() else rf"\b{word}\b"
+        parts = re.split(rx if word != "-" else r"(?<!\S)-(?!\d)", text, maxsplit=1)
+        if len(parts) != 2: continue
+        left, right = numbers(parts[0]), numbers(parts[1])
+        if not left or not right or (len(left) == 1 and len(right) == 1): continue
+        if len(left) > 1 and len(right) > 1 and len(left) != len(right):
+            raise ValueError(f"the lists have {len(left)} and {len(right)} numbers")
+        if NP_OK:
+            x, y = np.asarray(left, dtype=float), np.asarray(right, dtype=float)
+            r = {"+": np.add, "-": np.subtract, "*": np.multiply, "/": np.divide, "**": np.power}[sym](
+                x if len(left) > 1 else x[0], y if len(right) > 1 else y[0])
+            return [_num(float(v)) for v in np.atleast_1d(r)]
+        if len(left) == 1: left = left * len(right)
+        if len(right) == 1: right = right * len(left)
+        return [_num(_PY_OPS[sym](x, y)) for x, y in zip(left, right)]
+    return None
+
+
+# ── Speaking results ─────────────────────────────────────────────────────────
+
+def spoken(value) -> str:
+    """A number or list as it should be said: '5, 7 and 9', 'about 4.02 times ten to the 35'."""
+    if isinstance(value, list):
+        parts = [spoken(v) for v in value]
+        return parts[0] if len(parts) == 1 else ", ".join(parts[:-1]) + " and " + parts[-1]
+    if isinstance(value, int) and abs(value) >= 10**15:
+        digits = len(str(abs(value)))
+        return f"about {value / 10**(digits - 1):.3g} times ten to the {digits - 1}" if digits < 300 else \
+               f"a number with {digits} digits"
+    if isinstance(value, float):
+        if value != value or value in (math.inf, -math.inf): return str(value)
+        if abs(value) >= 1e15: return f"about {value:.3g}".replace("e+", " times ten to the ")
+        return str(round(value, 6))
+    return str(value)
@@ -0,0 +1,288 @@
+"""
+System pack — stats, power, volume, screenshots, network.
+"""
+
+import os, re, time, shutil, socket, struct, datetime, subprocess, webbrowser
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from Terminator import IS_WIN, IS_MAC, IS_LINUX, PSUTIL_OK, duration_label
+if PSUTIL_OK: import psutil
+
+
+def system_info(bot, _):
+    if not PSUTIL_OK: bot.say("psutil not installed."); return
+    cpu  = psutil.cpu_percent(interval=0.5)
+    mem  = psutil.virtual_memory()
+    disk = psutil.disk_usage("/")
+    bot.say(f"CPU at {cpu}%. RAM {round(mem.used/1024**3,1)} of "
+             f"{round(mem.total/1024**3,1)} gigs. Disk {round(disk.used/1024**3,1)} "
+             f"of {round(disk.total/1024**3,1)} gigs.")
+
+
+def battery(bot, _):
+    if not PSUTIL_OK: bot.say("psutil not available."); return
+    try:
+        b = psutil.sensors_battery()
+        if b: bot.say(f"Battery at {round(b.percent)}%, {'charging' if b.power_plugged else 'on battery'}.")
+        else: bot.say("No battery detected.")
+    except: bot.say("Could not read battery.")
+
+
+def uptime(bot, _):
+    if not PSUTIL_OK: bot.say("psutil not available."); return
+    delta = datetime.datetime.now() - datetime.datetime.fromtimestamp(psutil.boot_time())
+    h, m  = divmod(int(delta.total_seconds())//60, 60)
+    bot.say(f"System up for {h} hours and {m} minutes.")
+
+
+def ip(bot, _):
+    try:
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.connect(("8.8.8.8", 80)); ip = s.getsockname()[0]; s.close()
+        bot.say(f"Your local IP is {ip}.")
+    except: bot.say("Could not determine IP address.")
+
+
+def list_apps(bot, _):
+    if not PSUTIL_OK: bot.say("psutil not available."); return
+    seen = set(); apps = []
+    for p in psutil.process_iter(["name"]):
+        try:
+            n = p.info["name"]
+            if n and n.lower().endswith(".exe") and n not in seen:
+                seen.add(n); apps.append(n.replace(".exe",""))
+        except: pass
+    apps = sorted(apps)[:20]
+    print("\n📋  RUNNING APPS\n" + "─"*40)
+    for a in apps: print(f"  • {a}")
+    print("─"*40)
+    bot.say(f"Found {len(apps)} running apps. Listed on screen.")
+
+
+def volume(bot, q):
+    if not IS_WIN: bot.say("Volume control is Windows only."); return
+    shell = "(New-Object -ComObject WScript.Shell)"
+    if "mute" in q and "un" not in q:
+        subprocess.run(["powershell","-c",f"{shell}.SendKeys([char]173)"], capture_output=True)
+        bot.say("Muted.")
+    elif "unmute" in q:
+        subprocess.run(["powershell","-c",f"{shell}.SendKeys([char]173)"], capture_output=True)
+        bot.say("Unmuted.")
+    elif any(w in q for w in ["up","louder","increase","raise"]):
+        for _ in range(5): subprocess.run(["powershell","-c",f"{shell}.SendKeys([char]175)"], capture_output=True)
+        bot.say("Volume up.")
+    elif any(w in q for w in ["down","quieter","decrease","lower"]):
+        for _ in range(5): subprocess.run(["powershell","-c",f"{shell}.SendKeys([char]174)"], capture_output=True)
+        bot.say("Volume down.")
+    else: bot.say("Say volume up, volume down, mute, or unmute.")
+
+
+def screenshot(bot, q, fmt="png", level=None):
+    from packs import capture
+    src = capture.source()
+    if not src: bot.say("No screen capture available here. Try: pip install pillow."); return
+    fmt = capture.output_format(fmt, src)
+    fname = f"screenshot_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:-3]}.{fmt}"
+    try: frame = src.grab()
+    except Exception as e: bot.say(f"Screenshot failed: {e}"); return
+    capture.ENCODER.submit(frame, os.path.join(_desktop(), fname), fmt, level)
+    bot.say(f"Screenshot saved to Desktop as {fname}.")
+
+
+def record_screen(bot, q, every=None, total=None, fmt="png", level=None):
+    from packs import capture
+    if not every or not total:
+        bot.say("Say something like: take a screenshot every 10 seconds for 5 minutes."); return
+    src = capture.source()
+    if not src: bot.say("No screen capture available here. Try: pip install pillow."); return
+    if getattr(bot, "_recorder", None) and bot._recorder.is_alive():
+        bot.say("Already recording. Say stop recording first."); return
+    folder = os.path.join(_desktop(), f"screenshots_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    def _done(rec):
+        bot.say(f"Screen recording finished. {rec.taken} screenshots saved"
+                + (f", {rec.dropped} skipped while the encoder caught up." if rec.dropped else "."))
+    bot._recorder = capture.Recorder(src, folder, every, total, capture.output_format(fmt, src),
+                                     level, on_finish=_done)
+    bot._recorder.start()
+    bot.say(f"Taking a screenshot every {duration_label(every)} for {duration_label(total)}.")
+
+
+def stop_recording(bot, _):
+    rec = getattr(bot, "_recorder", None)
+    if not rec or not rec.is_alive(): bot.say("Not recording."); return
+    rec.stop.set()
+
+
+def _desktop():
+    return os.path.join(os.path.expanduser("~"), "Desktop")
+
+
+def lock_screen(bot, _):
+    if IS_WIN: subprocess.run(["rundll32.exe","user32.dll,LockWorkStation"])
+    elif IS_MAC: subprocess.run(["pmset","displaysleepnow"])
+    elif IS_LINUX: subprocess.run(["xdg-screensaver","lock"])
+    bot.say("Screen locked.")
+
+
+def sleep_computer(bot, _):
+    bot.say("Putting computer to sleep.")
+    time.sleep(1)
+    if IS_WIN: subprocess.run(["rundll32.exe","powrprof.dll,SetSuspendState","0","1","0"])
+    elif IS_MAC: subprocess.run(["pmset","sleepnow"])
+    elif IS_LINUX: subprocess.run(["systemctl","suspend"])
+
+
+def empty_recycle_bin(bot, _):
+    if not IS_WIN: bot.say("Windows only."); return
+    subprocess.run(["powershell","-c","Clear-RecycleBin -Force -ErrorAction SilentlyContinue"],
+                   capture_output=True)
+    bot.say("Recycle bin cleared.")
+
+
+def disk_cleanup(bot, _):
+    if not IS_WIN: bot.say("Windows only."); return
+    bot.say("Opening disk cleanup.")
+    subprocess.Popen(["cleanmgr.exe"])
+
+
+def type_text(bot, q, text=None):
+    if not IS_WIN: bot.say("Keyboard typing is Windows only."); return
+    if not text: bot.say("What should I type?"); return
+    try:
+        import pyautogui; pyautogui.write(text, interval=0.05)
+    except ImportError:
+        safe_text = text.replace("'","''")
+        subprocess.run(["powershell","-c",
+            f"Add-Type -AssemblyName System.Windows.Forms;"
+            f"[System.Windows.Forms.SendKeys]::SendWait('{safe_text}')"],
+            capture_output=True)
+    bot.say(f"Typed: {text}")
+
+
+# ── Network ──────────────────────────────────────────────────────────────────
+
+PING_ALIASES = {"google": "google.com", "github": "github.com", "cloudflare": "1.1.1.1",
+                "dns": "8.8.8.8", "youtube": "youtube.com", "localhost": "127.0.0.1"}
+GATEWAY_WORDS = ("my router", "the router", "router", "gateway", "default gateway")
+NETWORK_CHECK = ["router", "1.1.1.1", "google.com"]
+
+PingResult = namedtuple("PingResult", "name target sent received loss min avg max error")
+
+_RTT_UNIX = re.compile(r"= ([\d.]+)/([\d.]+)/([\d.]+)")                       # min/avg/max/mdev
+_RTT_WIN  = re.compile(r"Minimum = (\d+)ms, Maximum = (\d+)ms, Average = (\d+)ms")
+_COUNTS   = re.compile(r"(\d+) packets transmitted, (\d+) (?:packets )?received")
+_COUNTS_W = re.compile(r"Sent = (\d+), Received = (\d+)")
+
+
+def default_gateway():
+    """IPv4 address of the default route, or None."""
+    try:
+        if IS_LINUX:
+            with open("/proc/net/route") as f:
+                for line in f.readlines()[1:]:
+                    iface, dest, gw, flags = line.split()[:4]
+                    if dest == "00000000" and int(flags, 16) & 2:
+                        return socket.inet_ntoa(struct.pack("<L", int(gw, 16)))
+        elif IS_MAC:
+            out = subprocess.run(["route","-n","get","default"], capture_output=True, text=True, timeout=3).stdout
+            m = re.search(r"gateway: (\S+)", out); return m and m.group(1)
+        elif IS_WIN:
+            out = subprocess.run(["ipconfig"], capture_output=True, text=True, timeout=5).stdout
+            m = re.search(r"Default Gateway[ .]*: (\d+\.\d+\.\d+\.\d+)", out); return m and m.group(1)
+    except Exception: pass
+    return None
+
+
+def resolve_host(name: str):
+    """Spoken host → (label, address): "google" → google.com, "my router" → the gateway."""
+    name = name.strip(" .?!").lower()
+    if name in GATEWAY_WORDS: return "router", default_gateway()
+    target = PING_ALIASES.get(name, name.replace(" dot ", ".").replace(" ", ""))
+    if "." not in target and target != "localhost": target += ".com"
+    return name, target
+
+
+def parse_ping(output: str):
+    """(sent, received, min, avg, max) from Unix or Windows ping output; None where absent."""
+    c = _COUNTS.search(output) or _COUNTS_W.search(output)
+    sent, recv = (int(c.group(1)), int(c.group(2))) if c else (None, None)
+    if (m := _RTT_UNIX.search(output)): lo, avg, hi = map(float, m.groups())
+    elif (m := _RTT_WIN.search(output)): lo, hi, avg = map(float, m.groups())
+    else: lo = avg = hi = None
+    return sent, recv, lo, avg, hi
+
+
+def _tcp_probe(target, count, timeout):
+    """No ping binary (containers, locked-down hosts): time TCP connects to port 80 instead."""
+    rtts = []
+    for _ in range(count):
+        t = time.perf_counter()
+        try: socket.create_connection((target, 80), timeout=timeout).close()
+        except ConnectionRefusedError: pass          # the host answered — good enough
+        except OSError: continue
+        rtts.append((time.perf_counter() - t) * 1000)
+    return count, len(rtts), min(rtts, default=None), (sum(rtts) / len(rtts) if rtts else None), \
+           max(rtts, default=None)
+
+
+def ping_one(name, target, count=3, timeout=2):
+    if not target: return PingResult(name, None, 0, 0, 100.0, None, None, None, "no address")
+    try:
+        if shutil.which("ping"):
+            args = (["ping","-n",str(count),"-w",str(timeout*1000),target] if IS_WIN else
+                    ["ping","-c",str(count),"-W",str(timeout*1000 if IS_MAC else timeout),target])
+            r = subprocess.run(args, capture_output=True, text=True, timeout=count * (timeout + 1) + 2)
+            sent, recv, lo, avg, hi = parse_ping(r.stdout)
+            if sent is None: return PingResult(name, target, count, 0, 100.0, None, None, None,
+                                               (r.stderr or r.stdout).strip()[:80] or "no reply")
+        else:
+            sent, recv, lo, avg, hi = _tcp_probe(target, count, timeout)
+        return PingResult(name, target, sent, recv, round(100 * (sent - recv) / sent, 1), lo, avg, hi, None)
+    except subprocess.TimeoutExpired:
+        return PingResult(name, target, count, 0, 100.0, None, None, None, "timed out")
+    except Exception as e:
+        return PingResult(name, target, count, 0, 100.0, None, None, None, str(e))
+
+
+def ping_hosts(names, count=3, timeout=2) -> list:
+    """Ping every host at once; wall time is the slowest host, not the sum."""
+    hosts = [resolve_host(n) for n in names]
+    with ThreadPoolExecutor(max_workers=len(hosts) or 1) as pool:
+        return list(pool.map(lambda h: ping_one(*h, count=count, timeout=timeout), hosts))
+
+
+def _report(bot, results):
+    print("\n📡  PING\n" + "─"*50)
+    for r in results:
+        stats = (f"{r.min:>6.1f}{r.avg:>8.1f}{r.max:>8.1f} ms" if r.avg is not None
+                 else f"  {r.error or 'no reply'}")
+        print(f"  {r.name[:14]:<14}{str(r.target)[:16]:<16}{r.loss:>4.0f}% loss{stats}")
+    print("─"*50)
+    parts = []
+    for r in results:
+        if r.avg is None: parts.append(f"{r.name} unreachable")
+        else: parts.append(f"{r.name} {_ms(r.avg)}" + (f" with {r.loss:g}% loss" if r.loss else ""))
+    down = sum(r.avg is None for r in results)
+    verdict = ("All reachable." if not down else
+               "Nothing is reachable." if down == len(results) else f"{down} of {len(results)} unreachable.")
+    bot.say(", ".join(parts).capitalize() + ". " + verdict)
+
+
+def _ms(v):
+    return "under a millisecond" if v < 1 else f"{v:.0f} millisecond{'s' if round(v) != 1 else ''}"
+
+
+def ping(bot, q, host="google.com"):
+    names = [h for h in re.split(r"\s*(?:,|\band\b)\s*", host) if h.strip()]
+    bot.say(f"Pinging {', '.join(names)}.")
+    _report(bot, ping_hosts(names))
+
+
+def check_network(bot, _):
+    bot.say("Checking your router, DNS and the internet.")
+    _report(bot, ping_hosts(NETWORK_CHECK))
+
+
+def speedtest(bot, _):
+    bot.say("Opening speed test."); webbrowser.open("https://fast.com")
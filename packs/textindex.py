@@ -0,0 +1,195 @@
+"""
+Inverted index over an append-only text file — one entry per line.
+
+Notes and to-dos are searched through this instead of re-reading the whole
+file. The index lives beside the file it covers (terminator_notes.txt →
+terminator_notes.idx) as a journal with one line per entry:
+
+    <byte offset of the entry><TAB><its distinct terms, space separated>
+
+Appending an entry appends one journal line, so the cost of an update does
+not grow with the file. At start-up the journal is replayed into a
+term → [entry numbers] map plus a sorted term list. A prefix query
+("invoice" also finds "invoices") is a bisect into that list. A query with
+several terms walks the postings of the rarest one, newest first.
+
+Next to the journal (terminator_notes.sig) is the (mtime_ns, size) of the
+text file as the index last saw it. When the file's differs, it was edited
+outside the bot (cleared, lines changed, added or removed by hand), so
+byte offsets may be stale and the index is rebuilt from the file.
+"""
+
+import os, re, heapq, bisect, threading
+
+_WORD = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+STOP  = {"a", "an", "and", "any", "about", "for", "my", "of", "on", "the", "to", "with"}
+
+
+def terms(text: str) -> list:
+    return _WORD.findall(text.lower())
+
+
+class LineIndex:
+    def __init__(self, path, strip=None):
+        self.path  = path
+        self.idx   = os.path.splitext(path)[0] + ".idx"
+        self.sig_file = os.path.splitext(path)[0] + ".sig"
+        self.strip = strip   # regex for a per-line prefix not worth indexing (timestamps)
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    # ── Building ─────────────────────────────────────────────────────────────
+
+    def _reset(self):
+        self.offsets, self.postings, self.sorted, self.end = [], {}, [], 0
+
+    def _post(self, offset, words, sort=True):
+        """Add one entry. Bulk loads pass sort=False and sort the term list once at the end."""
+        n = len(self.offsets); self.offsets.append(offset)
+        for w in words:
+            ids = self.postings.get(w)
+            if ids is None:
+                self.postings[w] = [n]
+                if sort: bisect.insort(self.sorted, w)
+            else: ids.append(n)
+
+    def _load(self):
+        self._reset(); self.sig = None
+        try:
+            with open(self.sig_file, encoding="utf-8") as f: sig = tuple(map(int, f.read().split()))
+            with open(self.idx, encoding="utf-8") as f:
+                for line in f:
+                    off, _, words = line.rstrip("\n").partition("\t")
+                    self._post(int(off), words.split(), sort=False)
+            if self.offsets:
+                with open(self.path, "rb") as f:
+                    f.seek(self.offsets[-1]); f.readline(); self.end = f.tell()
+            self.sig = sig
+        except (OSError, ValueError):
+            self._reset()   # no journal, or a damaged one: _sync rebuilds it
+        self.sorted = sorted(self.postings)
+        self._loaded = True
+
+    def _signature(self):
+        try: st = os.stat(self.path)
+        except OSError: return None
+        return st.st_mtime_ns, st.st_size
+
+    def _sync(self):
+        """Bring the index in line with the file: one stat() when nothing changed."""
+        if not self._loaded: self._load()
+        sig = self._signature()
+        if sig == self.sig: return
+        self._reset(); self._drop_journal()   # changed outside the bot: offsets may be stale
+        if sig: self._catch_up()
+        self._save_signature()
+
+    def _catch_up(self):
+        """Index lines past self.end (the whole file after a reset)."""
+        with open(self.path, "rb") as f:
+            f.seek(self.end)
+            while True:
+                off, raw = f.tell(), f.readline()
+                if not raw: break
+                if not raw.endswith(b"\n"): break   # half-written line: the next change re-syncs
+                self.end = f.tell()
+                text = raw.decode("utf-8", errors="replace").strip()
+                if text: self._journal(off, self._terms(text), sort=False)
+        self.sorted = sorted(self.postings)
+
+    def _save_signature(self):
+        """Record that the index matches the text file as it is now."""
+        self.sig = self._signature()
+        if self.sig is None: return
+        try:
+            with open(self.sig_file, "w", encoding="utf-8") as f: f.write(f"{self.sig[0]} {self.sig[1]}\n")
+        except OSError: pass
+
+    def _terms(self, text):
+        if self.strip: text = re.sub(self.strip, "", text)
+        return list(dict.fromkeys(terms(text)))
+
+    def _journal(self, offset, words, sort=True):
+        self._post(offset, words, sort)
+        try:
+            with open(self.idx, "a", encoding="utf-8") as f: f.write(f"{offset}\t{' '.join(words)}\n")
+        except OSError: pass   # read-only: the in-memory index still works this session
+
+    def _drop_journal(self):
+        for path in (self.idx, self.sig_file):
+            try: os.remove(path)
+            except OSError: pass
+
+    # ── Public ───────────────────────────────────────────────────────────────
+
+    def append(self, line: str):
+        """Write one entry to the text file and index it."""
+        with self._lock:
+            self._sync()
+            data = (line + "\n").encode("utf-8")
+            with open(self.path, "ab") as f: f.write(data)
+            off, self.end = self.end, self.end + len(data)
+            self._journal(off, self._terms(line))
+            self._save_signature()
+
+    def clear(self):
+        with self._lock:
+            open(self.path, "w").close()
+            self._drop_journal(); self._reset(); self._loaded = True
+            self._save_signature()
+
+    def drop(self) -> bool:
+        """Free the in-memory index (idle); the journal is replayed on the next use."""
+        with self._lock:
+            if not self._loaded: return False
+            self._reset(); self._loaded = False
+            return True
+
+    def _lists(self, term):
+        """Posting lists for `term`, or for every word starting with it (3+ letters)."""
+        if len(term) < 3: return [self.postings[term]] if term in self.postings else []
+        if len(term) > 3 and term.endswith("s"): term = term[:-1]   # "invoices" finds "invoice"
+        i, out = bisect.bisect_left(self.sorted, term), []
+        while i < len(self.sorted) and self.sorted[i].startswith(term):
+            out.append(self.postings[self.sorted[i]]); i += 1
+        return out
+
+    @staticmethod
+    def _has(lists, n):
+        for ids in lists:
+            i = bisect.bisect_left(ids, n)
+            if i < len(ids) and ids[i] == n: return True
+        return False
+
+    def search(self, query: str, limit=None) -> list:
+        """
+        Entries containing every query term (as a word or word prefix), newest
+        first. The rarest term is walked from the newest entry back and the
+        others are checked by bisect, so `limit` hits cost about the same
+        however many entries there are.
+        """
+        with self._lock:
+            self._sync()
+            words = [w for w in terms(query) if w not in STOP] or terms(query)
+            if not words: return []
+            rarest, *rest = sorted((self._lists(w) for w in words), key=lambda ls: sum(map(len, ls)))
+            ids, last = [], None
+            for n in heapq.merge(*(reversed(ls) for ls in rarest), reverse=True):
+                if n == last: continue
+                last = n
+                if all(self._has(ls, n) for ls in rest):
+                    ids.append(n)
+                    if limit and len(ids) >= limit: break
+            if not ids: return []
+            out = []
+            try:
+                with open(self.path, "rb") as f:   # under the lock: clear() cannot truncate it mid-read
+                    for i in ids:
+                        f.seek(self.offsets[i]); out.append(f.readline().decode("utf-8", errors="replace").strip())
+            except OSError: return []
+        return out
+
+    def __len__(self):
+        with self._lock:
+            self._sync()
+            return len(self.offsets)
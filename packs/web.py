@@ -0,0 +1,243 @@
+"""
+Web pack — search and site shortcuts, plus inline spoken answers for
+weather, forecasts, crypto prices and definitions.
+"""
+
+import os, time, json, datetime, threading, webbrowser, http.client, urllib.parse
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  HTTP CLIENT  — pooled keep-alive connections + persistent TTL cache
+# ══════════════════════════════════════════════════════════════════════════════
+
+# Endpoints for the inline web answers (point these at a local server to test)
+WTTR_URL = "https://wttr.in"
+COIN_URL = "https://api.coingecko.com/api/v3"
+DICT_URL = "https://api.dictionaryapi.dev/api/v2/entries/en"
+_KEEP    = ("HTTP",)   # survive a hot reload: open keep-alive connections, cached responses
+
+
+class HTTPError(Exception):
+    pass
+
+
+class ResponseCache:
+    """
+    Persistent TTL cache of response bodies, keyed by URL.
+    Saved as JSON in the working directory (next to the notes file).
+    """
+    def __init__(self, path="terminator_cache.json"):
+        self.path  = path
+        self._lock = threading.Lock()
+        self._data = {}
+        try:
+            with open(path, encoding="utf-8") as f: data = json.load(f)
+            now = time.time()
+            self._data = {k: v for k, v in data.items() if v[0] > now}
+        except (OSError, ValueError): pass
+
+    def get(self, key):
+        with self._lock:
+            hit = self._data.get(key)
+            if not hit: return None
+            if hit[0] > time.time(): return hit[1]
+            del self._data[key]
+            return None
+
+    def put(self, key, body: str, ttl: float):
+        with self._lock:
+            self._data[key] = [time.time() + ttl, body]
+            tmp = self.path + ".tmp"
+            try:
+                with open(tmp, "w", encoding="utf-8") as f: json.dump(self._data, f)
+                os.replace(tmp, self.path)
+            except OSError: pass
+
+
+class HTTPClient:
+    """
+    Minimal GET client: idle connections are pooled per (scheme, host, port)
+    and reused with keep-alive, every socket op has a strict timeout, and
+    responses go through the TTL cache when a ttl is given.
+    """
+    MAX_IDLE = 4
+
+    def __init__(self, cache=None, timeout=3.0):
+        self.cache   = cache
+        self.timeout = timeout
+        self._idle   = {}   # (scheme, host, port) -> [HTTPConnection, ...]
+        self._lock   = threading.Lock()
+
+    def _acquire(self, key):
+        with self._lock:
+            pool = self._idle.get(key)
+            if pool: return pool.pop(), True
+        scheme, host, port = key
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(host, port, timeout=self.timeout), False
+
+    def _release(self, key, conn):
+        with self._lock:
+            pool = self._idle.setdefault(key, [])
+            if len(pool) < self.MAX_IDLE: pool.append(conn); return
+        conn.close()
+
+    def get(self, url: str, ttl: float = 0) -> str:
+        if ttl and self.cache:
+            hit = self.cache.get(url)
+            if hit is not None: return hit
+        u    = urllib.parse.urlsplit(url)
+        key  = (u.scheme, u.hostname, u.port)
+        path = (u.path or "/") + (f"?{u.query}" if u.query else "")
+        while True:
+            conn, reused = self._acquire(key)
+            try:
+                conn.request("GET", path, headers={"User-Agent": "curl/8.0 (Terminator-Bot)",
+                                                   "Accept": "*/*"})
+                r = conn.getresponse(); body = r.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused: continue   # stale keep-alive socket — retry on a fresh one
+                raise
+            except Exception:
+                conn.close(); raise
+            if r.will_close: conn.close()
+            else: self._release(key, conn)
+            break
+        if r.status != 200: raise HTTPError(f"{r.status} {r.reason} for {url}")
+        text = body.decode("utf-8", errors="replace")
+        if ttl and self.cache: self.cache.put(url, text, ttl)
+        return text
+
+    def get_json(self, url: str, ttl: float = 0):
+        return json.loads(self.get(url, ttl))
+
+
+HTTP = HTTPClient(ResponseCache())
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  HANDLERS
+# ══════════════════════════════════════════════════════════════════════════════
+
+def search(bot, q, query=""):
+    t = query
+    webbrowser.open(f"https://www.google.com/search?q={t.replace(' ','+')}" if t else "https://www.google.com")
+    bot.say(f"Searching for {t}." if t else "Opening Google.")
+
+
+def youtube(bot, q, query=""):
+    t = query
+    webbrowser.open(f"https://www.youtube.com/results?search_query={t.replace(' ','+')}" if t else "https://www.youtube.com")
+    bot.say(f"Searching YouTube for {t}." if t else "Opening YouTube.")
+
+
+def weather(bot, q, city="Amsterdam"):
+    try:
+        line = HTTP.get(f"{WTTR_URL}/{urllib.parse.quote(city)}?format=%l:+%C,+%t", ttl=600).strip()
+        if not line or line.startswith("<") or "unknown location" in line.lower():
+            raise HTTPError(line[:80])
+        bot.say(line.replace(": +", ": ").replace(", +", ", ") + ".")
+    except Exception:
+        bot.say(f"Opening weather for {city}.")
+        webbrowser.open(f"https://wttr.in/{city.replace(' ','+')}")
+
+
+def forecast(bot, q, city="Amsterdam"):
+    try:
+        data  = HTTP.get_json(f"{WTTR_URL}/{urllib.parse.quote(city)}?format=j1", ttl=1800)
+        parts = []
+        for day in data["weather"]:
+            name = datetime.datetime.strptime(day["date"], "%Y-%m-%d").strftime("%A")
+            desc = day["hourly"][len(day["hourly"])//2]["weatherDesc"][0]["value"].strip().lower()
+            parts.append(f"{name}: {day['mintempC']} to {day['maxtempC']} degrees, {desc}")
+        if not parts: raise HTTPError("empty forecast")
+        bot.say(f"Forecast for {city}. " + ". ".join(parts) + ".")
+    except Exception:
+        bot.say(f"Opening 7-day forecast for {city}.")
+        webbrowser.open(f"https://wttr.in/{city.replace(' ','+')}?format=v2")
+
+
+def wikipedia(bot, q, topic=""):
+    t = topic
+    if not t: bot.say("What topic?"); return
+    bot.say(f"Opening Wikipedia for {t}.")
+    webbrowser.open(f"https://en.wikipedia.org/wiki/{t.replace(' ','_')}")
+
+
+def news(bot, _):
+    bot.say("Opening the latest news."); webbrowser.open("https://news.google.com")
+
+
+def reddit(bot, q, sub=""):
+    s = sub
+    if s: bot.say(f"Opening r slash {s}."); webbrowser.open(f"https://www.reddit.com/r/{s.replace(' ','')}")
+    else: bot.say("Opening Reddit."); webbrowser.open("https://www.reddit.com")
+
+
+def github(bot, q, query=""):
+    q2 = query
+    if q2: bot.say(f"Searching GitHub for {q2}."); webbrowser.open(f"https://github.com/search?q={q2.replace(' ','+')}")
+    else:  bot.say("Opening GitHub."); webbrowser.open("https://github.com")
+
+
+def maps(bot, q, place=""):
+    p = place
+    if p: bot.say(f"Opening maps for {p}."); webbrowser.open(f"https://maps.google.com/maps?q={p.replace(' ','+')}")
+    else: bot.say("Opening Google Maps."); webbrowser.open("https://maps.google.com")
+
+
+def translate(bot, q, text=""):
+    t = text
+    bot.say("Opening Google Translate.")
+    webbrowser.open(f"https://translate.google.com/?text={t.replace(' ','+')}")
+
+
+def stackoverflow(bot, q, query=""):
+    t = query
+    if t: bot.say(f"Searching Stack Overflow for {t}."); webbrowser.open(f"https://stackoverflow.com/search?q={t.replace(' ','+')}")
+    else: bot.say("Opening Stack Overflow."); webbrowser.open("https://stackoverflow.com")
+
+
+def chatgpt(bot, _):
+    bot.say("Opening ChatGPT."); webbrowser.open("https://chat.openai.com")
+
+
+def crypto(bot, q, coin="bitcoin"):
+    ids  = {"btc": "bitcoin", "eth": "ethereum", "sol": "solana", "doge": "dogecoin",
+            "ada": "cardano", "xrp": "ripple", "ether": "ethereum", "dot": "polkadot"}
+    cid  = ids.get(coin, coin.replace(" ","-"))
+    try:
+        data = HTTP.get_json(f"{COIN_URL}/simple/price?ids={urllib.parse.quote(cid)}"
+                             f"&vs_currencies=usd&include_24hr_change=true", ttl=60)
+        info = data[cid]
+        msg  = f"{coin.title()} is at {info['usd']:,} dollars"
+        if info.get("usd_24h_change") is not None:
+            ch = info["usd_24h_change"]
+            msg += f", {'up' if ch >= 0 else 'down'} {abs(ch):.1f}% in 24 hours"
+        bot.say(msg + ".")
+    except Exception:
+        bot.say(f"Opening {coin} price.")
+        webbrowser.open(f"https://www.coinbase.com/price/{coin.replace(' ','-')}")
+
+
+def define_word(bot, q, word=None):
+    """Offline dictionary first, then the dictionary API, then the browser."""
+    if not word: bot.say("Which word should I define?"); return
+    from packs.dictionary import DICTIONARY
+    senses = DICTIONARY.lookup(word)
+    if senses:
+        pos, defn = senses[0]
+        bot.say(f"{word.capitalize()}. " + (f"{pos.capitalize()}. " if pos else "") + defn); return
+    try:
+        entry   = HTTP.get_json(f"{DICT_URL}/{urllib.parse.quote(word)}", ttl=7*86400)[0]
+        meaning = entry["meanings"][0]
+        defn    = meaning["definitions"][0]["definition"]
+        bot.say(f"{word.capitalize()}. {meaning['partOfSpeech'].capitalize()}. {defn}")
+    except Exception:
+        close = DICTIONARY.suggest(word)
+        if close:
+            options = ", ".join(close[:-1]) + " or " + close[-1] if len(close) > 1 else close[0]
+            bot.say(f"I don't know {word}. Did you mean {options}?"); return
+        bot.say(f"Looking up {word}.")
+        webbrowser.open(f"https://www.merriam-webster.com/dictionary/{word.replace(' ','%20')}")
@@ -0,0 +1,281 @@
+"""
+Windows app engine — find, open and close ANY installed app.
+The apps pack uses the launch / close helpers on Windows only; the alias
+maps and find_any_app load anywhere (off Windows the search finds nothing).
+"""
+
+import os, glob, shutil, subprocess
+
+from Terminator import IS_WIN, PSUTIL_OK
+if PSUTIL_OK: import psutil
+
+_EV = os.path.expandvars
+
+# Static alias map for 50+ common apps
+WIN_APP_MAP = {
+    "chrome":             r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    "google chrome":      r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+    "firefox":            r"C:\Program Files\Mozilla Firefox\firefox.exe",
+    "edge":               r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
+    "microsoft edge":     r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
+    "brave":              r"C:\Program Files\BraveSoftware\Brave-Browser\Application\brave.exe",
+    "opera":              _EV(r"%LOCALAPPDATA%\Programs\Opera\launcher.exe"),
+    "notepad":            "notepad.exe",
+    "wordpad":            "wordpad.exe",
+    "word":               r"C:\Program Files\Microsoft Office\root\Office16\WINWORD.EXE",
+    "excel":              r"C:\Program Files\Microsoft Office\root\Office16\EXCEL.EXE",
+    "powerpoint":         r"C:\Program Files\Microsoft Office\root\Office16\POWERPNT.EXE",
+    "outlook":            r"C:\Program Files\Microsoft Office\root\Office16\OUTLOOK.EXE",
+    "onenote":            r"C:\Program Files\Microsoft Office\root\Office16\ONENOTE.EXE",
+    "teams":              _EV(r"%LOCALAPPDATA%\Microsoft\Teams\current\Teams.exe"),
+    "calculator":         "calc.exe",
+    "paint":              "mspaint.exe",
+    "snipping tool":      "SnippingTool.exe",
+    "task manager":       "taskmgr.exe",
+    "file explorer":      "explorer.exe",
+    "explorer":           "explorer.exe",
+    "control panel":      "control.exe",
+    "device manager":     "devmgmt.msc",
+    "registry editor":    "regedit.exe",
+    "command prompt":     "cmd.exe",
+    "cmd":                "cmd.exe",
+    "powershell":         "powershell.exe",
+    "terminal":           "wt.exe",
+    "windows terminal":   "wt.exe",
+    "vlc":                r"C:\Program Files\VideoLAN\VLC\vlc.exe",
+    "spotify":            _EV(r"%APPDATA%\Spotify\Spotify.exe"),
+    "itunes":             r"C:\Program Files\iTunes\iTunes.exe",
+    "windows media player": "wmplayer.exe",
+    "vs code":            _EV(r"%LOCALAPPDATA%\Programs\Microsoft VS Code\Code.exe"),
+    "vscode":             _EV(r"%LOCALAPPDATA%\Programs\Microsoft VS Code\Code.exe"),
+    "visual studio code": _EV(r"%LOCALAPPDATA%\Programs\Microsoft VS Code\Code.exe"),
+    "visual studio":      r"C:\Program Files\Microsoft Visual Studio\2022\Community\Common7\IDE\devenv.exe",
+    "pycharm":            r"C:\Program Files\JetBrains\PyCharm Community Edition\bin\pycharm64.exe",
+    "android studio":     r"C:\Program Files\Android\Android Studio\bin\studio64.exe",
+    "git bash":           r"C:\Program Files\Git\git-bash.exe",
+    "discord":            _EV(r"%LOCALAPPDATA%\Discord\Update.exe"),
+    "slack":              _EV(r"%LOCALAPPDATA%\slack\slack.exe"),
+    "zoom":               _EV(r"%APPDATA%\Zoom\bin\Zoom.exe"),
+    "skype":              _EV(r"%APPDATA%\Microsoft\Skype for Desktop\Skype.exe"),
+    "whatsapp":           _EV(r"%LOCALAPPDATA%\WhatsApp\WhatsApp.exe"),
+    "telegram":           _EV(r"%APPDATA%\Telegram Desktop\Telegram.exe"),
+    "steam":              r"C:\Program Files (x86)\Steam\steam.exe",
+    "epic games":         _EV(r"%LOCALAPPDATA%\EpicGamesLauncher\Portal\Binaries\Win64\EpicGamesLauncher.exe"),
+    "obs":                r"C:\Program Files\obs-studio\bin\64bit\obs64.exe",
+    "obs studio":         r"C:\Program Files\obs-studio\bin\64bit\obs64.exe",
+    "photoshop":          r"C:\Program Files\Adobe\Adobe Photoshop 2024\Photoshop.exe",
+    "adobe photoshop":    r"C:\Program Files\Adobe\Adobe Photoshop 2024\Photoshop.exe",
+    "premiere":           r"C:\Program Files\Adobe\Adobe Premiere Pro 2024\Adobe Premiere Pro.exe",
+    "after effects":      r"C:\Program Files\Adobe\Adobe After Effects 2024\Support Files\AfterFX.exe",
+    "illustrator":        r"C:\Program Files\Adobe\Adobe Illustrator 2024\Support Files\Contents\Windows\Illustrator.exe",
+    "blender":            r"C:\Program Files\Blender Foundation\Blender 4.0\blender.exe",
+    "minecraft":          _EV(r"%APPDATA%\.minecraft\MinecraftLauncher.exe"),
+    "notepad++":          r"C:\Program Files\Notepad++\notepad++.exe",
+    "7zip":               r"C:\Program Files\7-Zip\7zFM.exe",
+    "winrar":             r"C:\Program Files\WinRAR\WinRAR.exe",
+    "putty":              r"C:\Program Files\PuTTY\putty.exe",
+    "filezilla":          r"C:\Program Files\FileZilla FTP Client\filezilla.exe",
+}
+
+# Process name map for killing apps
+WIN_PROC_MAP = {
+    "chrome":         ["chrome.exe"],
+    "google chrome":  ["chrome.exe"],
+    "firefox":        ["firefox.exe"],
+    "edge":           ["msedge.exe"],
+    "brave":          ["brave.exe"],
+    "notepad":        ["notepad.exe"],
+    "word":           ["WINWORD.EXE"],
+    "excel":          ["EXCEL.EXE"],
+    "powerpoint":     ["POWERPNT.EXE"],
+    "outlook":        ["OUTLOOK.EXE"],
+    "teams":          ["Teams.exe"],
+    "calculator":     ["CalculatorApp.exe","calc.exe"],
+    "paint":          ["mspaint.exe"],
+    "task manager":   ["Taskmgr.exe"],
+    "spotify":        ["Spotify.exe"],
+    "vlc":            ["vlc.exe"],
+    "discord":        ["Discord.exe"],
+    "slack":          ["slack.exe"],
+    "zoom":           ["Zoom.exe"],
+    "skype":          ["Skype.exe"],
+    "whatsapp":       ["WhatsApp.exe"],
+    "telegram":       ["Telegram.exe"],
+    "steam":          ["steam.exe"],
+    "obs":            ["obs64.exe","obs32.exe","obs.exe"],
+    "obs studio":     ["obs64.exe"],
+    "photoshop":      ["Photoshop.exe"],
+    "blender":        ["blender.exe"],
+    "vs code":        ["Code.exe"],
+    "vscode":         ["Code.exe"],
+    "visual studio code": ["Code.exe"],
+    "visual studio":  ["devenv.exe"],
+    "pycharm":        ["pycharm64.exe"],
+    "notepad++":      ["notepad++.exe"],
+    "epic games":     ["EpicGamesLauncher.exe"],
+}
+
+
+def _registry_search(name_lower: str) -> list:
+    """
+    Search Windows Registry Uninstall keys for installed apps.
+    Returns list of (score, exe_path) tuples.
+    """
+    results = []
+    if not IS_WIN: return results
+    try:
+        import winreg
+        REG_PATHS = [
+            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
+            (winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
+            (winreg.HKEY_CURRENT_USER,  r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
+        ]
+        def rval(k, n):
+            try: return winreg.QueryValueEx(k, n)[0]
+            except: return ""
+
+        for hive, reg_path in REG_PATHS:
+            try:
+                key = winreg.OpenKey(hive, reg_path)
+                for i in range(winreg.QueryInfoKey(key)[0]):
+                    try:
+                        sub = winreg.OpenKey(key, winreg.EnumKey(key, i))
+                        display  = rval(sub, "DisplayName").lower()
+                        exe_icon = rval(sub, "DisplayIcon")
+                        inst_loc = rval(sub, "InstallLocation")
+                        if not display: continue
+                        score = 2 if name_lower == display else (1 if name_lower in display or display in name_lower else 0)
+                        if score == 0: continue
+                        # Check InstallLocation for a matching .exe
+                        if inst_loc and os.path.isdir(inst_loc):
+                            for fn in os.listdir(inst_loc):
+                                if fn.lower().endswith(".exe"):
+                                    stem = fn.lower().replace(".exe","")
+                                    if name_lower in stem or stem in name_lower:
+                                        results.append((score+1, os.path.join(inst_loc, fn)))
+                        # DisplayIcon often IS the exe path
+                        if exe_icon:
+                            exe_path = exe_icon.split(",")[0].strip().strip('"')
+                            if exe_path.lower().endswith(".exe") and os.path.exists(exe_path):
+                                results.append((score, exe_path))
+                    except: pass
+            except: pass
+    except ImportError: pass
+    return results
+
+
+def find_any_app(name: str) -> str | None:
+    """
+    Find ANY installed app by name using 4 strategies:
+      1. Static alias map
+      2. Windows Registry (uninstall entries)
+      3. Start Menu .lnk / .exe shortcuts
+      4. Filesystem walk of install directories
+    Returns best-matching .exe/.lnk path or None.
+    """
+    nl = name.lower().strip()
+    candidates = []  # (score, path)
+
+    # 1. Static alias map
+    if nl in WIN_APP_MAP:
+        path = WIN_APP_MAP[nl]
+        if "*" in path:
+            matches = glob.glob(path)
+            path = sorted(matches)[-1] if matches else None
+        if path and os.path.exists(path):
+            return path  # highest priority, return immediately
+
+    # 2. Registry
+    candidates.extend(_registry_search(nl))
+
+    # 3. Start Menu folders
+    start_dirs = [
+        _EV(r"%APPDATA%\Microsoft\Windows\Start Menu\Programs"),
+        _EV(r"%ProgramData%\Microsoft\Windows\Start Menu\Programs"),
+        _EV(r"%LOCALAPPDATA%\Programs"),
+    ]
+    for root_dir in start_dirs:
+        if not os.path.isdir(root_dir): continue
+        for root, dirs, files in os.walk(root_dir):
+            dirs[:] = [d for d in dirs if not d.startswith(".") and d != "node_modules"]
+            for fn in files:
+                if not fn.lower().endswith((".exe",".lnk")): continue
+                stem = os.path.splitext(fn)[0].lower()
+                score = 2 if nl == stem else (1 if nl in stem or stem in nl else 0)
+                if score: candidates.append((score, os.path.join(root, fn)))
+
+    # 4. Filesystem walk (limited depth for speed)
+    walk_dirs = [
+        _EV(r"%PROGRAMFILES%"), _EV(r"%PROGRAMFILES(X86)%"),
+        _EV(r"%LOCALAPPDATA%"), _EV(r"%APPDATA%"),
+    ]
+    SKIP = {"node_modules","__pycache__","cache","logs","temp","tmp","crash reports",
+            "crashreports","crashpad","resources","locales","swiftshader"}
+    for root_dir in walk_dirs:
+        if not os.path.isdir(root_dir): continue
+        for root, dirs, files in os.walk(root_dir):
+            depth = root.replace(root_dir,"").count(os.sep)
+            if depth > 5: dirs.clear(); continue
+            dirs[:] = [d for d in dirs if not d.startswith(".") and d.lower() not in SKIP]
+            for fn in files:
+                if not fn.lower().endswith(".exe"): continue
+                stem = os.path.splitext(fn)[0].lower()
+                score = 2 if nl == stem else (1 if nl in stem or stem in nl else 0)
+                if score: candidates.append((score, os.path.join(root, fn)))
+
+    if not candidates: return None
+    candidates.sort(key=lambda x: (-x[0], len(x[1])))
+    return candidates[0][1]
+
+
+def launch_windows(name: str) -> bool:
+    """Launch a Windows app. Returns True if successfully launched."""
+    nl = name.lower().strip()
+
+    # Fast: direct .exe on PATH
+    if shutil.which(name): subprocess.Popen([name]); return True
+    if shutil.which(name+".exe"): subprocess.Popen([name+".exe"]); return True
+
+    # Full search
+    path = find_any_app(nl)
+    if path:
+        if path.endswith(".lnk"): os.startfile(path); return True
+        if os.path.exists(path): subprocess.Popen([path]); return True
+
+    # PowerShell Start-Process (handles UWP + Store apps)
+    try:
+        r = subprocess.run(
+            ["powershell","-NoProfile","-Command",f"Start-Process '{nl}'"],
+            capture_output=True, timeout=5)
+        if r.returncode == 0: return True
+    except: pass
+
+    # Last resort: os.startfile
+    try: os.startfile(name); return True
+    except: pass
+
+    return False
+
+
+def close_windows(name: str) -> tuple:
+    """Kill all processes matching name. Returns (success, killed_list)."""
+    nl = name.lower().strip()
+    killed = []
+
+    if not PSUTIL_OK:
+        targets = WIN_PROC_MAP.get(nl, [nl+".exe", nl.replace(" ","")+".exe"])
+        for pn in targets:
+            r = subprocess.run(["taskkill","/F","/IM",pn], capture_output=True)
+            if r.returncode == 0: killed.append(pn)
+        return bool(killed), killed
+
+    targets = WIN_PROC_MAP.get(nl, [])
+    for proc in psutil.process_iter(["pid","name"]):
+        try:
+            pname = proc.info["name"] or ""
+            pl = pname.lower()
+            if pname in targets or nl in pl or pl.replace(".exe","") in nl:
+                proc.kill(); killed.append(pname)
+        except (psutil.NoSuchProcess, psutil.AccessDenied): pass
+
+    return bool(killed), killed
@@ -0,0 +1,913 @@
+"""
+Regression tests, run against the stand-ins the bot already ships:
+SimulatedTTS for the speaker, ScriptedAudioSource for the mic, and a
+local HTTP server in place of the web APIs (see the URLs in packs/web.py).
+
+    python -m pytest -q tests
+"""
+
+import os, sys, json, asyncio, threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import Terminator as T
+
+
+@pytest.fixture
+def scratch(tmp_path, monkeypatch):
+    """Data files (notes, journal) land in a scratch directory; nothing is journaled."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(T.JOURNAL, "enabled", False)
+    return tmp_path
+
+
+@pytest.fixture
+def bot(scratch):
+    return T.Terminator(text_mode=True, tts=T.SimulatedTTS(words_per_sec=1000))
+
+
+def said(bot):
+    return [e["text"] for e in bot.tts.log]
+
+
+# ── Compound utterances ──────────────────────────────────────────────────────
+
+def split(bot, text):
+    return [(t, h.name if h else None) for t, h in bot._split_compound(text)]
+
+
+def test_gather_keeps_trigger_names_as_items(bot):
+    assert split(bot, "ping google, github and my router") == [("ping google, github, my router", "ping")]
+    assert split(bot, "ping github and google") == [("ping github, google", "ping")]
+
+
+def test_gather_ends_at_then_or_a_verb(bot):
+    assert split(bot, "ping google and then open spotify") == [("ping google", "ping"), ("open spotify", "open_app")]
+    assert split(bot, "ping google and what time is it") == [("ping google", "ping"), ("what time is it", "time")]
+
+
+def test_list_items_inherit_the_verb(bot):
+    assert split(bot, "open slack and spotify") == [("open slack", "open_app"), ("open spotify", "open_app")]
+    assert split(bot, "check my network and open spotify, then set a 5 minute timer") == [
+        ("check my network", "check_network"), ("open spotify", "open_app"), ("set a 5 minute timer", "timer")]
+
+
+def test_ping_list_reaches_one_ping_call(bot, monkeypatch):
+    import packs.system as system
+    calls = []
+    def fake_ping_hosts(names, **_):
+        calls.append(names)
+        return [system.PingResult(n, "127.0.0.1", 3, 3, 0.0, 1.0, 2.0, 3.0, None) for n in names]
+    monkeypatch.setattr(system, "ping_hosts", fake_ping_hosts)
+    bot._route("ping google, github and my router")
+    assert calls == [["google", "github", "my router"]]
+    assert not any("github for" in s.lower() for s in said(bot))
+
+
+def test_ping_localhost_and_unreachable():
+    from packs.system import ping_one
+    up = ping_one("localhost", "127.0.0.1", count=1, timeout=1)
+    down = ping_one("nowhere", None)
+    assert up.received == 1 and up.avg is not None
+    assert down.avg is None and down.loss == 100.0
+
+
+# ── Slot grammar ─────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("text, handler, slots", [
+    ("weather in berlin",                     "weather",  {"city": "berlin"}),
+    ("what's the weather in berlin",          "weather",  {"city": "berlin"}),
+    ("temperature in paris",                  "weather",  {"city": "paris"}),
+    ("forecast for new york this week",       "forecast", {"city": "new york"}),
+    ("launch startup disk",                   "open_app", {"app": "startup disk"}),
+    ("open smartstart",                       "open_app", {"app": "smartstart"}),
+    ("start steam",                           "open_app", {"app": "steam"}),
+    ("open the spotify app",                  "open_app", {"app": "spotify"}),
+    ("convert 5 km to miles",                 "convert",  {"value": 5, "src": "km", "dst": "miles"}),
+    ("convert 10 miles into km",              "convert",  {"value": 10, "src": "miles", "dst": "km"}),
+    ("set a timer for 1 hour and 30 minutes", "timer",    {"duration": 5400}),
+    ("set a timer for 2 minutes 30 seconds",  "timer",    {"duration": 150}),
+    ("set a timer for one hour",              "timer",    {"duration": 3600}),
+    ("5 minute timer",                        "timer",    {"duration": 300}),
+    ("wake me up at 7:30 am",                 "alarm",    {"at": (7, 30)}),
+    ("alarm for 7 pm",                        "alarm",    {"at": (19, 0)}),
+    ("pomodoro 50 and 10",                    "pomodoro", {"work": 50, "rest": 10}),
+])
+def test_slots(bot, text, handler, slots):
+    cmd = bot._match(text)[1]
+    assert cmd.name == handler and cmd.parse(text) == slots
+
+
+@pytest.mark.parametrize("text, reply", [
+    ("convert 5 km to miles",             "5 km = 3.11 miles"),
+    ("convert 5 miles to km",             "5 miles = 8.05 km"),
+    ("convert 100 fahrenheit to celsius", "100°F = 37.8°C"),
+    ("convert 100 celsius to fahrenheit", "100°C = 212.0°F"),
+    ("convert 2 kg into pounds",          "2 kg = 4.41 lbs"),
+    ("set a timer for 1 hour and 30 minutes", "Timer set for 1 hour 30 minutes."),
+])
+def test_slots_reach_the_handler(bot, text, reply):
+    bot._route(text)
+    assert said(bot)[-1] == reply
+
+
+# ── Notes and to-do search ───────────────────────────────────────────────────
+
+def test_search_without_notes_file(bot):
+    assert not os.path.exists("terminator_notes.txt")
+    bot._route("search my notes for invoice")
+    bot._route("any todos about dentist")
+    assert bot.is_running and len(said(bot)) == 2
+
+
+def test_search_finds_appended_lines(tmp_path):
+    from packs.textindex import LineIndex
+    index = LineIndex(str(tmp_path / "notes.txt"))
+    for line in ("pay the invoice", "call the dentist", "second invoice overdue"):
+        index.append(line)
+    assert index.search("invoices") == ["second invoice overdue", "pay the invoice"]
+    index.clear()
+    assert index.search("invoice") == []
+
+
+@pytest.mark.parametrize("edit", [
+    lambda text: text.replace("dentist", "plumber"),                   # same size
+    lambda text: text.replace("pay the invoice", "pay the big invoice"),   # grows before the last line
+    lambda text: "call the plumber\n" + text,                          # line added at the top
+])
+def test_search_after_a_hand_edit(tmp_path, edit):
+    from packs.textindex import LineIndex
+    path = tmp_path / "notes.txt"
+    index = LineIndex(str(path))
+    for line in ("call the dentist", "pay the invoice", "second invoice overdue"):
+        index.append(line)
+    assert index.search("invoice") == ["second invoice overdue", "pay the invoice"]
+    text = path.read_text(encoding="utf-8")
+    path.write_text(edit(text), encoding="utf-8")
+    os.utime(path, ns=(T.time.time_ns(), T.time.time_ns() + 10**9))   # coarse mtime clocks
+    want = [line for line in reversed(edit(text).splitlines()) if "invoice" in line]
+    assert index.search("invoice") == want
+    assert LineIndex(str(path)).search("invoice") == want   # a fresh process replays the rebuilt journal
+    assert index.search("dentist") == [line for line in edit(text).splitlines() if "dentist" in line]
+
+
+def test_journal_replay_keeps_terms_sorted(tmp_path):
+    from packs.textindex import LineIndex
+    index = LineIndex(str(tmp_path / "notes.txt"))
+    for i in range(200): index.append(f"entry w{(i * 7919) % 1000:03d}")
+    fresh = LineIndex(str(tmp_path / "notes.txt")); len(fresh)
+    assert fresh.sorted == sorted(fresh.sorted) == sorted(index.sorted)
+    assert fresh.search("w123") == index.search("w123")
+
+
+# ── Phonetic fallback ────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("heard, want", [
+    ("stop watch", "stopwatch"), ("pomo door oh", "pomodoro"), ("take a screen shut", "screenshot"),
+    ("what's the whether in paris", "weather"), ("play jazz on you tube", "youtube"),
+])
+def test_misheard_command_is_corrected(heard, want):
+    hit = T.fuzzy_index().lookup(heard)
+    assert hit and hit[2].name == want
+
+
+@pytest.mark.parametrize("heard", [
+    "i like ice cream", "the deadline is tomorrow", "see you later", "maybe later",
+    "where did i leave my keys", "clean notes", "lock screan", "vol ume down",
+])
+def test_chatter_and_exact_commands_are_not_guessed(heard):
+    assert T.fuzzy_index().lookup(heard) is None
+
+
+def test_chatter_is_not_routed(bot):
+    bot._route("i like ice cream", spoken=True)
+    assert said(bot) and said(bot)[-1] in T.CONFUSED
+
+
+def test_typed_text_is_not_matched_by_sound(bot, monkeypatch):
+    bot._route("stop watch")
+    assert said(bot)[-1] in T.CONFUSED
+    bot._route("stop watch", spoken=True)
+    assert said(bot)[-1] not in T.CONFUSED
+
+
+def test_typed_text_never_reaches_the_phonetic_index(bot, monkeypatch):
+    note = T.fuzzy_index().lookup("take a note")
+    monkeypatch.setattr(T.fuzzy_index(), "lookup", lambda text: note)   # everything sounds like a note
+    bot._route("content-type: text/plain")
+    assert said(bot)[-1] in T.CONFUSED and not os.path.exists("terminator_notes.txt")
+
+
+# ── Apps ─────────────────────────────────────────────────────────────────────
+
+def test_find_app_answers_on_every_platform(bot):
+    bot._route("find app some app that is not installed")
+    assert said(bot)[-1].startswith(("Found", "Could not locate"))
+
+
+# ── Server sessions ──────────────────────────────────────────────────────────
+
+def test_server_follow_up_reads_the_client(scratch):
+    async def session():
+        srv  = T.TerminatorServer()
+        sock = str(scratch / "t.sock")
+        server = await asyncio.start_unix_server(srv._session, path=sock)
+        reader, writer = await asyncio.open_unix_connection(sock)
+        writer.write(b"take a note\n")
+        msgs = []
+        while not msgs or not msgs[-1].get("done"):
+            msgs.append(json.loads(await asyncio.wait_for(reader.readline(), 5)))
+            if "ask" in msgs[-1]: writer.write(b"Buy milk\n")
+        writer.close(); server.close()
+        return msgs
+    msgs = asyncio.run(session())
+    assert {"ask": "Dictate your note"} in msgs
+    assert {"say": "Saved: Buy milk"} in msgs
+    assert "Buy milk" in open("terminator_notes.txt", encoding="utf-8").read()
+
+
+def serve_and(scratch, address, client):
+    """Run TerminatorServer.serve() on `address` while `client()` talks to it."""
+    async def run():
+        srv  = T.TerminatorServer(address)
+        task = asyncio.create_task(srv.serve())
+        await asyncio.sleep(0.2)
+        try: return await client()
+        finally: task.cancel()
+    return asyncio.run(run())
+
+
+async def replies(reader):
+    """Lines until "done", or [] when the server hangs up."""
+    msgs = []
+    while not msgs or not msgs[-1].get("done"):
+        raw = await asyncio.wait_for(reader.readline(), 5)
+        if not raw: break
+        msgs.append(json.loads(raw))
+    return msgs
+
+
+def test_default_socket_is_owner_only(scratch, monkeypatch):
+    if os.name == "nt": pytest.skip("no Unix sockets")
+    sock = str(scratch / "t.sock")
+    async def client():
+        reader, writer = await T._connect(sock)
+        writer.write(b"what time is it\n")
+        msgs = await replies(reader); writer.close()
+        return msgs
+    msgs = serve_and(scratch, sock, client)
+    assert msgs[-1]["done"] and msgs[0]["say"].startswith("It's")
+    assert oct(os.stat(sock).st_mode & 0o777) == "0o600"
+
+
+@pytest.mark.parametrize("first", [
+    b"POST / HTTP/1.1\r\nHost: 127.0.0.1:8765\r\nContent-Type: text/plain\r\n\r\ntake a note attacker was here\n",
+    b"take a note attacker was here\n",                      # no token
+    b'{"token": "guess"}\ntake a note attacker was here\n',
+])
+def test_tcp_server_refuses_unauthenticated_clients(scratch, monkeypatch, first):
+    monkeypatch.setattr(T, "SERVER_TOKEN_FILE", str(scratch / "token"))
+    async def client():
+        reader, writer = await asyncio.open_connection("127.0.0.1", 18765)
+        writer.write(first)
+        msgs = await replies(reader); writer.close()
+        return msgs
+    assert serve_and(scratch, "127.0.0.1:18765", client) == []
+    assert not os.path.exists("terminator_notes.txt")
+
+
+def test_tcp_client_with_the_token_is_served(scratch, monkeypatch):
+    monkeypatch.setattr(T, "SERVER_TOKEN_FILE", str(scratch / "token"))
+    async def client():
+        reader, writer = await T._connect("127.0.0.1:18766")
+        writer.write(b"take a note buy milk\n")
+        msgs = await replies(reader); writer.close()
+        return msgs
+    assert {"say": "Saved: buy milk"} in serve_and(scratch, "127.0.0.1:18766", client)
+    if os.name != "nt": assert oct(os.stat(scratch / "token").st_mode & 0o777) == "0o600"
+
+
+# ── Idle release ─────────────────────────────────────────────────────────────
+
+class FakeEngine:
+    """pyttsx3 stand-in: runAndWait "speaks" for `secs`."""
+    def __init__(self, secs=0.3): self.secs, self.said = secs, []
+    def say(self, text): self.said.append(text)
+    def runAndWait(self): T.time.sleep(self.secs)
+    def stop(self): pass
+    def connect(self, *_): return None
+
+
+def test_tts_is_not_unloaded_mid_utterance(monkeypatch):
+    def setup(self): self.backend, self.engine = "pyttsx3", FakeEngine()
+    monkeypatch.setattr(T.TTSEngine, "_setup", setup)
+    monkeypatch.setattr(T.TTSEngine, "_find_player", lambda self: None)
+    tts = T.TTSEngine()
+    speaker = T.threading.Thread(target=tts.speak, args=("I'll be back.",)); speaker.start()
+    while not getattr(tts, "_users", 1): T.time.sleep(0.005)
+    assert tts.unload() is False and tts.engine is not None
+    speaker.join()
+    assert tts.unload() is True and tts.engine is None
+
+
+def test_release_does_not_block_touch():
+    idle, busy = T.IdleManager(), T.threading.Event()
+    idle.register("slow", lambda: busy.wait(2))   # a release waiting on a decode in progress
+    idle.asleep = True
+    releaser = T.threading.Thread(target=idle.release); releaser.start()
+    t0 = T.time.monotonic(); idle.touch()
+    assert T.time.monotonic() - t0 < 0.5 and releaser.is_alive()
+    busy.set(); releaser.join()
+    assert idle._released == ["slow"]
+
+
+def test_whisper_kept_while_decoding():
+    mic = T.MicListener()
+    mic._wm = object()
+    out = []
+    with mic._wlock:   # a decode in progress
+        worker = T.threading.Thread(target=lambda: out.append(mic.unload_whisper()), daemon=True)
+        worker.start(); worker.join(1)
+    assert out == [False]
+    assert mic.unload_whisper() is True
+
+
+# ── Profiling ────────────────────────────────────────────────────────────────
+
+@pytest.fixture
+def profiled(scratch, monkeypatch):
+    """Profiler writing into the scratch directory; returns the profiled handler names."""
+    names = []
+    monkeypatch.setattr(T.PROFILER, "out_dir", str(scratch / "profiles"))
+    monkeypatch.setattr(T.PROFILER, "_report", lambda cmd, prof, wall: names.append(cmd.name))
+    yield names
+    T.PROFILER.always = T.PROFILER._next = False
+
+
+def test_profile_next_survives_an_unmatched_utterance(bot, profiled):
+    bot._route("profile next command")
+    bot._route("the cat sat on the mat")
+    bot._route("what time is it")
+    assert profiled == ["time"]
+
+
+def test_profile_next_covers_routine_steps(bot, profiled):
+    bot._save_routines({"wake up": ["what time is it", "what's the date"]})
+    bot._route("profile next command")
+    bot._route("wake up")
+    assert profiled == ["time", "date"]
+
+
+# ── Tracing ──────────────────────────────────────────────────────────────────
+
+@pytest.fixture
+def tracer(scratch, monkeypatch):
+    """A fresh Tracer in place of the global one; Popen/run are put back afterwards."""
+    import atexit, subprocess
+    tr = T.Tracer()
+    monkeypatch.setattr(T, "TRACER", tr)
+    monkeypatch.setattr(subprocess, "Popen", subprocess.Popen)
+    monkeypatch.setattr(subprocess, "run", subprocess.run)
+    yield tr
+    atexit.unregister(tr.flush)
+
+
+def traced(bot, tracer, path):
+    import subprocess
+    tracer.start(str(path))
+    for text in ["what time is it and what's the date", "wake up"]:
+        with T.TRACER.span("utterance", cat="utterance", mode="text"): bot._route(text)
+    with T.TRACER.span("utterance", cat="utterance", mode="text"):
+        subprocess.run([sys.executable, "-c", "pass"], check=True)
+
+
+def end(e): return round(e["ts"] + e["dur"], 1)
+
+
+def test_trace_is_chrome_trace_json_with_nested_spans(bot, tracer, scratch):
+    bot._save_routines({"wake up": ["what time is it", "what's the date"]})
+    traced(bot, tracer, scratch / "trace.json")
+    doc = json.loads((scratch / "trace.json").read_text())
+    assert doc["displayTimeUnit"] == "ms"
+    spans = [e for e in doc["traceEvents"] if e["ph"] == "X"]
+    named = {e["tid"] for e in doc["traceEvents"] if e["ph"] == "M" and e["name"] == "thread_name"}
+    assert {e["ph"] for e in doc["traceEvents"]} == {"X", "M"}
+    assert {e["tid"] for e in spans} <= named and len(named) > 1   # compound sub-commands run on workers
+
+    by_id = {e["args"]["id"]: e for e in spans}
+    assert len(by_id) == len(spans)
+    names = {e["name"] for e in spans}
+    assert {"utterance", "route", "handler core.time", "handler core.date", "step what time is it",
+            "tts.speak"} <= names
+    assert any(n.startswith("subprocess ") for n in names)
+    for e in spans:
+        assert e["dur"] >= 0 and e["pid"] == os.getpid()
+        up = by_id.get(e["args"]["parent"])
+        if up is None:
+            assert e["name"] == "utterance" and e["args"]["utterance"] == e["args"]["id"]; continue
+        assert up["ts"] <= e["ts"] and end(e) <= end(up), (e["name"], up["name"])
+        assert e["args"]["utterance"] == up["args"]["utterance"]
+    assert sum(e["args"]["parent"] is None for e in spans) == 3
+
+    for tid in named:   # on each thread, every span closes before the span around it does
+        open_ = []
+        for e in sorted((e for e in spans if e["tid"] == tid), key=lambda e: (e["ts"], -e["dur"])):
+            while open_ and end(open_[-1]) <= e["ts"]: open_.pop()
+            assert not open_ or end(e) <= end(open_[-1]), (e["name"], open_[-1]["name"])
+            open_.append(e)
+
+
+def test_trace_jsonl_writes_one_span_per_line(bot, tracer, scratch):
+    bot._save_routines({"wake up": ["what time is it", "what's the date"]})
+    traced(bot, tracer, scratch / "trace.jsonl")
+    lines = [json.loads(l) for l in (scratch / "trace.jsonl").read_text().splitlines()]
+    assert lines == [e for e in tracer.events if e["ph"] == "X"]
+    assert [l["name"] for l in lines].count("utterance") == 3
+
+
+# ── Self-echo ────────────────────────────────────────────────────────────────
+
+def scripted_bot(script, phrases, **kw):
+    """A voice bot on a ScriptedAudioSource room; the stub recognizer maps an amplitude to its phrase."""
+    room = T.ScriptedAudioSource(script)
+    mic  = T.MicListener(lambda: room)
+    mic._transcribe = lambda audio: next((phrases[abs(x)] for x in T.array("h", audio.get_raw_data())
+                                          if abs(x) in phrases), "")
+    mic.timeout = 1
+    return T.Terminator(tts=T.SimulatedTTS(words_per_sec=4), mic=mic, **kw)
+
+
+def test_echo_guard_keeps_the_bot_from_obeying_itself(scratch):
+    stats = T.bench_echo()
+    assert stats["off"]["bot speech routed"] > 0
+    assert stats["on"]["bot speech routed"] == 0 and stats["on"]["user commands routed"] == 2
+
+
+def test_own_voice_does_not_stop_the_reply(scratch):
+    bot = scripted_bot([(0.1, 0), (2.0, 2500)], {2500: "your five minute timer is up"}, barge_in=True)
+    bot.say("Your five minute timer is up.")   # the speaker, 2500 at the mic from the first word
+    assert not bot.tts.log[-1]["interrupted"] and bot.barge.heard is None
+    assert bot.barge.count == 0 and bot.barge.echo_level == 2500
+
+
+def test_user_talking_over_the_echo_stops_the_reply(scratch):
+    bot = scripted_bot([(0.1, 0), (0.6, 2500), (1.0, 9000)], {9000: "what time is it"}, barge_in=True)
+    bot.say("Your five minute timer is up.")
+    assert bot.tts.log[-1]["interrupted"] and 0.6 < bot.tts.log[-1]["end"] - bot.tts.log[-1]["start"] < 1.2
+    assert bot.get_input() == "what time is it"
+
+
+@pytest.mark.parametrize("phrase, heard", [
+    ("your five minute timer is up", ""),   # a speaker that lags past `lead` is caught by the transcript
+    ("what time is it", "what time is it"),
+])
+def test_barge_in_transcript_goes_through_the_echo_check(scratch, phrase, heard):
+    bot = scripted_bot([(1.2, 0), (1.0, 2500)], {2500: phrase}, barge_in=True)
+    bot.say("Your five minute timer is up.")
+    assert bot.tts.log[-1]["interrupted"] and bot.barge.heard is not None
+    assert bot.get_input() == heard
+    assert bot.echo.echoes == (0 if heard else 1)
+
+
+# ── Streaming dictation ──────────────────────────────────────────────────────
+
+def test_dictation_stitches_segments_in_spoken_order():
+    phrases = {2000: "buy milk", 2400: "and eggs", 2800: "then call mum"}
+    def transcribe(audio):   # later segments come back first
+        amp = next(abs(x) for x in T.array("h", audio.get_raw_data()) if abs(x) in phrases)
+        T.time.sleep(0.3 - 0.1 * list(phrases).index(amp))
+        return phrases[amp]
+    room = T.ScriptedAudioSource([(0.2, 0), (0.6, 2000), (1.0, 0), (0.6, 2400), (1.0, 0), (0.6, 2800)],
+                                 realtime=False)
+    dictation = T.StreamingDictation(transcribe, T.EnergyVAD(), pause=0.5)
+    with room as src:
+        assert dictation.run(src) == "buy milk and eggs then call mum"
+    assert dictation.segments == 3
+
+
+def test_dictation_without_speech_times_out():
+    with T.ScriptedAudioSource([], realtime=False) as src, pytest.raises(T.sr.WaitTimeoutError):
+        T.StreamingDictation(lambda audio: "", timeout=0.5).run(src)
+
+
+# ── Web answers ──────────────────────────────────────────────────────────────
+
+class Stub(BaseHTTPRequestHandler):
+    """wttr.in / CoinGecko stand-in. Keeps connections alive and counts them."""
+    protocol_version = "HTTP/1.1"
+    routes, hits, connections = {}, [], []
+
+    def setup(self):
+        super().setup(); self.connections.append(self.client_address)
+
+    def do_GET(self):
+        self.hits.append(self.path)
+        body = self.routes.get(self.path)
+        code = 200 if body is not None else 404
+        body = (body if isinstance(body, str) else json.dumps(body) if body is not None else "Unknown location").encode()
+        self.send_response(code); self.send_header("Content-Length", str(len(body))); self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_): pass
+
+
+@pytest.fixture
+def web(scratch, monkeypatch):
+    """packs.web pointed at the stub, with a fresh client and cache; browser fallbacks are recorded."""
+    import packs.web as web
+    Stub.routes, Stub.hits, Stub.connections = {}, [], []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Stub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    monkeypatch.setattr(web, "WTTR_URL", url)
+    monkeypatch.setattr(web, "COIN_URL", url)
+    monkeypatch.setattr(web, "HTTP", web.HTTPClient(web.ResponseCache(str(scratch / "cache.json"))))
+    opened = []
+    monkeypatch.setattr(web.webbrowser, "open", opened.append)
+    yield opened
+    server.shutdown(); server.server_close()
+
+
+def test_weather_is_spoken_and_cached(bot, web):
+    Stub.routes["/paris?format=%l:+%C,+%t"] = "Paris: Sunny, +18°C"
+    bot._route("weather in paris")
+    bot._route("weather in paris")
+    assert said(bot)[-2:] == ["Paris: Sunny, 18°C."] * 2
+    assert len(Stub.hits) == 1 and not web
+
+
+def test_web_answers_reuse_one_connection(bot, web):
+    Stub.routes["/simple/price?ids=bitcoin&vs_currencies=usd&include_24hr_change=true"] = \
+        {"bitcoin": {"usd": 64000, "usd_24h_change": -1.25}}
+    Stub.routes["/simple/price?ids=ethereum&vs_currencies=usd&include_24hr_change=true"] = \
+        {"ethereum": {"usd": 3100, "usd_24h_change": 2.0}}
+    bot._route("bitcoin price")
+    bot._route("ethereum price")
+    assert said(bot)[-2:] == ["Bitcoin is at 64,000 dollars, down 1.2% in 24 hours.",
+                              "Ethereum is at 3,100 dollars, up 2.0% in 24 hours."]
+    assert len(Stub.hits) == 2 and len(Stub.connections) == 1
+
+
+def test_unknown_city_falls_back_to_the_browser(bot, web):
+    bot._route("weather in atlantis")
+    assert said(bot)[-1] == "Opening weather for atlantis." and len(web) == 1
+
+
+# ── Offline dictionary ───────────────────────────────────────────────────────
+
+@pytest.fixture
+def dictionary(tmp_path):
+    from packs.dictionary import OfflineDictionary, import_dump
+    src = tmp_path / "words.tsv"
+    src.write_text("# word\tpos\tdefinition\n"
+                   "Receive\tverb\tBe given something.\n"
+                   "receipt\tnoun\tA written note that something was received.\n"
+                   "recipe\tnoun\tInstructions for preparing a dish.\n"
+                   "ice cream\tnoun\tA frozen dessert.\n"
+                   "zebra\tAn African wild horse with stripes.\n", encoding="utf-8")
+    dst = str(tmp_path / "dict.bin")
+    assert import_dump(str(src), dst) == 5
+    d = OfflineDictionary(dst)
+    yield d
+    d.close()
+
+
+def test_dictionary_lookup(dictionary):
+    assert dictionary.lookup("receive") == [("verb", "Be given something.")]
+    assert dictionary.lookup("  ICE   Cream ") == [("noun", "A frozen dessert.")]
+    assert dictionary.lookup("zebra") == [("", "An African wild horse with stripes.")]
+    assert dictionary.lookup("recieve") == [] and dictionary.lookup("aardvark") == []
+    assert dictionary.suggest("recieve")[0] == "receive"
+    assert len(dictionary) == 5
+
+
+def test_dictionary_close_waits_for_a_lookup(dictionary):
+    assert dictionary.lookup("recipe")
+    with dictionary._lock:   # a lookup in progress
+        closer = T.threading.Thread(target=dictionary.close, daemon=True); closer.start()
+        closer.join(0.2)
+        assert closer.is_alive() and dictionary._map is not None
+    closer.join(1)
+    assert dictionary._map is None and dictionary.lookup("recipe")   # mapped again on demand
+
+
+# ── Screen capture ───────────────────────────────────────────────────────────
+
+@pytest.fixture
+def capture(scratch, monkeypatch):
+    """Headless capture: the synthetic source, with the Desktop in the scratch directory."""
+    import packs.capture as capture, packs.system as system
+    monkeypatch.setenv("TERMINATOR_CAPTURE", "synthetic")
+    monkeypatch.setattr(capture, "_source", None)
+    monkeypatch.setattr(system, "_desktop", lambda: str(scratch))
+    return capture
+
+
+def test_screenshot_is_encoded_off_the_command_path(bot, capture, scratch):
+    bot._route("take a screenshot")
+    capture.ENCODER.join()
+    shots = list(scratch.glob("screenshot_*.png"))
+    assert said(bot)[-1] == f"Screenshot saved to Desktop as {shots[0].name}."
+    assert shots[0].read_bytes().startswith(b"\x89PNG\r\n\x1a\n")
+
+
+def test_recorder_drops_frames_instead_of_queueing_them(capture, scratch, monkeypatch):
+    encoder, queued = capture.Encoder(maxsize=3), []
+    real = capture.encode
+    def slow(frame, path, fmt, level=None):   # an encoder that cannot keep up
+        queued.append(encoder.q.qsize()); T.time.sleep(0.05)
+        return real(frame, path, fmt, level)
+    monkeypatch.setattr(capture, "encode", slow)
+    rec = capture.Recorder(capture.source(), str(scratch / "rec"), every=0.01, total=0.4, fmt="bmp",
+                           encoder=encoder)
+    rec.start(); rec.join(10)
+    frames = sorted(os.listdir(scratch / "rec"))
+    assert rec.taken + rec.dropped == 40 and rec.dropped > 0
+    assert len(frames) == rec.taken == encoder.written and encoder.failed == 0
+    assert max(queued) <= 3
+    assert all((scratch / "rec" / f).read_bytes().startswith(b"BM") for f in frames)
+
+
+# ── Range statistics ─────────────────────────────────────────────────────────
+
+RANGE_OPS = ["count", "sum", "mean", "median", "min", "max", "range", "var", "std", "svar", "sstd", "prod"]
+
+
+def brute(op, xs):
+    from packs.stats import reduce_list
+    return len(xs) if op == "count" else reduce_list(op, xs)
+
+
+def same(got, want):
+    return got == want if isinstance(want, int) else got == pytest.approx(want, rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.parametrize("a, last, d", [(1, 10, 1), (-7, 12, 1), (-20, -3, 1), (0, 100, 5), (0, 10, 3),
+                                        (3, 3, 1), (-9, 9, 3)])
+def test_range_closed_forms_match_brute_force(a, last, d):
+    from packs.stats import reduce_range
+    xs = list(range(a, last + 1, d))
+    for op in RANGE_OPS:
+        if op in ("svar", "sstd") and len(xs) < 2:
+            with pytest.raises(ValueError): reduce_range(op, a, last, d)
+            continue
+        assert same(reduce_range(op, a, last, d), brute(op, xs)), op
+
+
+@pytest.mark.parametrize("fmap", ["squares", "cubes", "square roots", "reciprocals", "logs"])
+def test_range_of_a_map_matches_brute_force(fmap):
+    from packs.stats import reduce_range, MAPS
+    for a, last, d in ((1, 30, 1), (4, 40, 4)):
+        xs = [MAPS[fmap][0](x) for x in range(a, last + 1, d)]
+        for op in ("sum", "mean", "median", "min", "max", "range", "var", "std", "prod"):
+            assert same(reduce_range(op, a, last, d, fmap), brute(op, xs)), (op, a)
+
+
+def test_large_ranges(monkeypatch):
+    import math, packs.stats as stats
+    n = 10**6
+    assert stats.reduce_range("sum", 1, n, 1) == n * (n + 1) // 2
+    assert stats.reduce_range("var", 1, n, 1) == pytest.approx((n * n - 1) / 12)
+    assert stats.reduce_range("sum", 1, 10**5, 1, "squares") == sum(x * x for x in range(1, 10**5 + 1))
+    monkeypatch.setattr(stats, "CHUNK", 1000)   # walk many chunks
+    xs = [math.sqrt(x) for x in range(1, 200_001)]
+    assert stats.reduce_range("sum", 1, 200_000, 1, "square roots") == pytest.approx(math.fsum(xs), rel=1e-12)
+    assert stats.reduce_range("std", 1, 200_000, 1, "square roots") == pytest.approx(stats.statistics.pstdev(xs), rel=1e-6)
+
+
+def test_reversed_negative_and_empty_ranges():
+    from packs.stats import statistic, reduce_range
+    assert statistic("sum of 10 to 1") == ("sum", 55)
+    assert statistic("average of -10 to -20") == ("average", -15)
+    assert statistic("product of -3 to 3") == ("product", 0)
+    assert reduce_range("count", 5, 4, 1) == 0 and reduce_range("sum", 5, 4, 1) == 0
+    assert reduce_range("prod", 5, 4, 1) == 1
+    with pytest.raises(ValueError): reduce_range("mean", 5, 4, 1)
+
+
+# ── Files ────────────────────────────────────────────────────────────────────
+
+def write(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"x" * size)
+
+
+def test_folder_usage_reuses_the_cache_until_a_directory_changes(tmp_path):
+    from packs.files import DirSizeCache, folder_usage
+    root = tmp_path / "root"
+    write(root / "music" / "a.mp3", 3000); write(root / "music" / "live" / "b.mp3", 2000)
+    write(root / "docs" / "c.txt", 100); write(root / "loose.bin", 7)
+    cache = DirSizeCache(str(tmp_path / "du.json"))
+    want = sorted([(5000, "music"), (100, "docs"), (7, "(files)")])
+    assert sorted(folder_usage(str(root), cache)) == want and cache.listed == 3
+
+    assert sorted(folder_usage(str(root), cache)) == want and cache.listed == 0
+    fresh = DirSizeCache(str(tmp_path / "du.json"))   # saved to disk
+    assert sorted(folder_usage(str(root), fresh)) == want and fresh.listed == 0
+
+    write(root / "music" / "live" / "d.mp3", 500)   # only that directory is read again
+    assert sorted(folder_usage(str(root), cache)) == sorted([(5500, "music"), (100, "docs"), (7, "(files)")])
+    assert cache.listed == 1
+    (root / "docs" / "c.txt").unlink()
+    assert dict((n, s) for s, n in folder_usage(str(root), cache))["docs"] == 0 and cache.listed == 1
+
+
+def test_duplicates_need_the_full_hash_and_reuse_cached_ones(tmp_path):
+    from packs.files import EDGE_BLOCK, HashCache, find_duplicates
+    root, size = tmp_path / "root", 3 * EDGE_BLOCK
+    body = bytes(range(256)) * (size // 256)
+    middle = body[:size // 2] + b"!" + body[size // 2 + 1:]   # same first and last block
+    for name, data in (("a.bin", body), ("sub/b.bin", body), ("c.bin", middle),
+                       ("d.bin", b"?" + body[1:]), ("e.bin", body[:-1])):
+        (root / name).parent.mkdir(parents=True, exist_ok=True); (root / name).write_bytes(data)
+    cache = HashCache(str(tmp_path / "hashes.json"))
+    want = [(size, [str(root / "a.bin"), str(root / "sub" / "b.bin")])]
+    assert find_duplicates([str(root)], cache) == want
+    assert cache.hashed == 4 + 3   # edge: a, b, c, d (e has a size of its own); full: a, b, c
+    fresh = HashCache(str(tmp_path / "hashes.json"))   # saved to disk
+    assert find_duplicates([str(root)], fresh) == want and fresh.hashed == 0
+    assert find_duplicates([str(root)], cache) == want and cache.hashed == 0
+    (root / "c.bin").write_bytes(body); os.utime(root / "c.bin", ns=(1, 1))
+    assert find_duplicates([str(root)], cache)[0][1] == sorted(want[0][1] + [str(root / "c.bin")])
+    assert cache.hashed == 2   # only the rewritten file
+
+
+@pytest.fixture
+def user_folders(tmp_path, monkeypatch):
+    """Desktop, downloads and documents in tmp_path; returns a helper that adds a file at a given mtime."""
+    import packs.files as files
+    for name in files.RECENT_FOLDERS:
+        monkeypatch.setitem(files.FOLDERS, name, str(tmp_path / name))
+    def add(rel, mtime):
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True); path.write_text(rel)
+        os.utime(path, (mtime, mtime))
+        return str(path)
+    return add
+
+
+def test_recent_keeps_the_newest_k_in_order(user_folders):
+    from packs.files import recent
+    paths = {t: user_folders(rel, 1_700_000_000 + t) for rel, t in [
+        ("desktop/a.txt", 5), ("downloads/b.zip", 40), ("documents/c.doc", 12), ("downloads/d/e.pdf", 33),
+        ("documents/f.txt", 1), ("desktop/g.png", 27), ("downloads/.h", 99), ("documents/x/y/deep.txt", 98)]}
+    got = recent(k=4)
+    assert [p for _, p, _ in got] == [paths[40], paths[33], paths[27], paths[12]]   # hidden and too-deep files left out
+    assert [label for _, _, label in got] == ["downloads", "downloads", "desktop", "documents"]
+    assert [p for _, p, _ in recent(["desktop"], k=10)] == [paths[27], paths[5]]
+
+
+def test_open_recent_opens_the_nth_newest(bot, user_folders, monkeypatch):
+    import packs.files as files
+    opened = []
+    monkeypatch.setattr(files, "_open_path", opened.append)
+    old, new = user_folders("downloads/old.pdf", 1_700_000_000), user_folders("desktop/new.pdf", 1_700_000_500)
+    bot._route("recent files")
+    bot._route("open the second one")
+    bot._route("open the first one")
+    assert opened == [old, new]
+    bot._route("open number 3")
+    assert said(bot)[-1] == "There are only 2 recent files."
+
+
+# ── Journal ──────────────────────────────────────────────────────────────────
+
+def test_usage_summary_reads_across_rotated_journals(tmp_path):
+    journal = T.Journal(str(tmp_path / "journal.jsonl"), max_bytes=1200, keep=8, every=60)
+    for i in range(12):
+        journal.record("what time is it", "builtin.time", "ok", 0.002 * (i + 1))
+        journal.record("open steam", "apps.open_app", "error" if i % 4 == 0 else "ok", 0.05)
+        journal.record("flibber", None, "unmatched")
+        if i % 3 == 0: journal.record("opening spotify", None, "echo")
+        journal.flush()
+    rotated = sorted(p.name for p in tmp_path.iterdir())
+    assert "journal.jsonl.2" in rotated and "journal.jsonl.8" not in rotated   # rotated, nothing dropped yet
+    total, uses, unmatched, errors, slowest, echoes = T.usage_summary(journal.entries())
+    assert total == 12 * 3 + 4 and echoes == 4
+    assert dict(uses) == {"builtin.time": 12, "apps.open_app": 12}
+    assert unmatched == [("flibber", 12)] and errors == [("apps.open_app", 3)]
+    assert slowest[0] == (50.0, 50.0, "apps.open_app") and slowest[1] == (13.0, 24.0, "builtin.time")
+    times = [e["t"] for e in journal.entries()]
+    assert times == sorted(times)   # oldest file first
+
+
+def test_journal_rotation_drops_only_the_oldest_file(tmp_path):
+    journal = T.Journal(str(tmp_path / "journal.jsonl"), max_bytes=10, keep=2, every=60)
+    for i in range(5):
+        journal.record(f"command {i}", "builtin.time", "ok"); journal.flush()   # rotates every time
+    assert [e["text"] for e in journal.entries()] == ["command 3", "command 4"]
+
+
+# ── Content packs ────────────────────────────────────────────────────────────
+
+@pytest.mark.parametrize("n", [1, 7, 12])
+def test_content_is_dealt_without_repeats_across_a_reload(tmp_path, n):
+    from packs.content import ContentPacks
+    (tmp_path / "jokes.txt").write_text("# built in\n" + "".join(f"joke {i}\n\n" for i in range(n - n // 2)))
+    (tmp_path / "jokes-dad.txt").write_text("".join(f"joke {i}\n" for i in range(n - n // 2, n)))
+    state = str(tmp_path / "state.json")
+    packs = ContentPacks([str(tmp_path)], state)
+    first = [packs.pick("jokes") for _ in range(n // 2)]
+    packs = ContentPacks([str(tmp_path)], state)   # a restart mid-cycle
+    rest  = [packs.pick("jokes") for _ in range(n - n // 2)]
+    assert sorted(first + rest) == sorted(f"joke {i}" for i in range(n))
+    again = [packs.pick("jokes") for _ in range(n)]   # the next cycle deals everything once more
+    assert sorted(again) == sorted(first + rest)
+    assert ContentPacks([str(tmp_path)], state).pick("unknown") is None
+
+
+# ── Speech output ────────────────────────────────────────────────────────────
+
+REPLY = ("Systems check complete. All processors are running within normal parameters. "
+         "Memory usage is at forty two percent. Your next alarm is set for seven in the morning. "
+         "I'll be back.")
+
+
+def simulated(**kw):
+    tts, played = T.SimulatedTTS(words_per_sec=40, synth_startup=0.05, synth_per_char=0.001, **kw), []
+    play = tts._play_clip
+    tts._play_clip = lambda clip, stop=None: played.append(clip) or play(clip, stop)
+    return tts, played
+
+
+def test_first_sentence_plays_before_the_reply_is_synthesised():
+    sentences = T.split_sentences(REPLY)
+    synthesis = 0.05 + 0.001 * len(REPLY)   # the whole reply in one go
+    tts, played = simulated()
+    tts.speak(REPLY)
+    assert played == sentences and len(sentences) == 4
+    first = 0.05 + 0.001 * len(sentences[0])
+    assert tts.last_pipeline["ttfa"] < first + 0.03 < synthesis   # waited for one sentence, not the reply
+    assert tts.last_pipeline["max_gap"] < 0.05   # the next sentence was ready before this one ended
+    block, played = simulated(pipelined=False)
+    block.speak(REPLY)
+    assert played == [REPLY] and block.last_pipeline["ttfa"] >= synthesis * 0.9
+
+
+def test_stop_ends_the_reply_after_the_current_sentence():
+    tts, played = simulated()
+    stop = T.threading.Event()
+    T.threading.Timer(0.2, stop.set).start()
+    tts.speak(REPLY, stop=stop)
+    assert tts.log[-1]["interrupted"] and played == T.split_sentences(REPLY)[:len(played)] and len(played) < 4
+
+
+# ── Hot reload ───────────────────────────────────────────────────────────────
+
+@pytest.fixture
+def pack_copy(tmp_path, monkeypatch):
+    """A copy of packs/ imported as `packs` for the duration of a test."""
+    import shutil
+    shutil.copytree(os.path.dirname(T.MANIFEST_FILE), tmp_path / "packs",
+                    ignore=shutil.ignore_patterns("__pycache__", "*.idx"))
+    saved = {n: m for n, m in sys.modules.items() if n == "packs" or n.startswith("packs.")}
+    for n in saved: del sys.modules[n]
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield tmp_path / "packs"
+    for n in [n for n in sys.modules if n == "packs" or n.startswith("packs.")]: del sys.modules[n]
+    sys.modules.update(saved)
+    manifest = str(tmp_path / "packs" / "manifest.json")
+    T._COMMANDS.pop(manifest, None); T._FUZZY.pop(manifest, None)
+
+
+def edit(path, old, new):
+    path.write_text(path.read_text(encoding="utf-8").replace(old, new), encoding="utf-8")
+    st = path.stat(); os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))   # coarse mtime clocks
+
+
+def test_hot_reload_order_keep_and_recovery(pack_copy, monkeypatch):
+    import importlib
+    import packs.files, packs.web
+    assert packs.web.__file__.startswith(str(pack_copy))
+    manifest = str(pack_copy / "manifest.json")
+    reloader = T.HotReloader(manifest)
+    before = T.load_commands(manifest)
+    http = packs.web.HTTP
+
+    reloaded, reload = [], importlib.reload
+    monkeypatch.setattr(importlib, "reload", lambda m: reloaded.append(m.__name__) or reload(m))
+    edit(pack_copy / "winapps.py", "WIN_APP_MAP = {", 'WIN_APP_MAP = {"skynet": "skynet.exe", ')
+    edit(pack_copy / "web.py", "def search(", "def answer_to_everything(): return 42\n\n\ndef search(")
+    assert reloader.check() == ["web.py", "winapps.py"]
+    assert reloaded.index("packs.winapps") < reloaded.index("packs.apps") < reloaded.index("packs.files")
+    assert sys.modules["packs.apps"].WIN_APP_MAP["skynet"] == "skynet.exe"
+    assert sys.modules["packs.files"].FOLDERS is sys.modules["packs.apps"].FOLDERS
+    assert sys.modules["packs.web"].answer_to_everything() == 42
+    assert sys.modules["packs.web"].HTTP is http   # _KEEP: live connections survive
+    after = T.load_commands(manifest)
+    assert after is not before
+
+    edit(pack_copy / "web.py", "def answer_to_everything(): return 42", "def answer_to_everything(: return 42")
+    with pytest.raises(SyntaxError): reloader.check()
+    assert sys.modules["packs.web"].answer_to_everything() == 42 and T.load_commands(manifest) is after
+    edit(pack_copy / "web.py", "def answer_to_everything(: return 42", "def answer_to_everything(): return 43")
+    assert reloader.check() == ["web.py"] and sys.modules["packs.web"].answer_to_everything() == 43
+
+    edit(pack_copy / "manifest.json", '"triggers": ["weather in",', '"triggers": ["weather at", "weather in",')
+    assert reloader.check() == ["manifest.json"]
+    bot = T.Terminator(text_mode=True, tts=T.SimulatedTTS(words_per_sec=1000))
+    bot.commands = T.load_commands(manifest)
+    assert bot._match("weather at the office")[1].name == "weather"